@@ -0,0 +1,318 @@
+"""
+Benchmarks of the SDK hot paths against a local stand-in server.
+
+Usage:
+    python -m benchmarks.run [--quick] [--only NAME ...] [--output results.json]
+
+Each benchmark reports operations per second and latency percentiles. The JSON
+output carries the SDK and Python versions, so results of different releases
+can be compared to spot regressions.
+"""
+
+import argparse
+import contextlib
+import json
+import os
+import platform
+import statistics
+import sys
+import threading
+import time
+
+from datetime import datetime
+from datetime import timezone
+from typing import Callable
+from typing import Optional
+
+from benchmarks.server import StandInServer
+from tagoio_sdk import __version__
+from tagoio_sdk.common.Cache import TTLCache
+from tagoio_sdk.common.Hash_Generator import generateRequestID
+from tagoio_sdk.common.Hash_Generator import hash_generator
+from tagoio_sdk.infrastructure.http_session import closeSessions
+from tagoio_sdk.modules.Analysis.Analysis import Analysis
+from tagoio_sdk.modules.Device.Device import Device
+from tagoio_sdk.modules.Resources.Resources import Resources
+
+
+ACCOUNT_TOKEN = "benchmark-account-token"
+MB = 2**20
+
+
+def _percentile(samples: list[float], percent: float) -> float:
+    ordered = sorted(samples)
+    index = min(int(round(percent / 100 * (len(ordered) - 1))), len(ordered) - 1)
+    return ordered[index]
+
+
+def measure(
+    name: str,
+    func: Callable[[], Optional[dict]],
+    iterations: int,
+    warmup: int = 1,
+    **extra,
+) -> dict:
+    """
+    Run `func` `iterations` times after `warmup` runs and summarize the latencies.
+
+    `func` may return a dict of counters (records, bytes) summed over the iterations,
+    which are also reported per second.
+    """
+    for _ in range(warmup):
+        func()
+
+    samples = []
+    counters: dict[str, float] = {}
+    for _ in range(iterations):
+        start = time.perf_counter()
+        result = func()
+        samples.append(time.perf_counter() - start)
+        if isinstance(result, dict):
+            for key, value in result.items():
+                counters[key] = counters.get(key, 0) + value
+
+    total = sum(samples)
+    return {
+        "name": name,
+        "iterations": iterations,
+        "total_s": total,
+        "ops_per_s": iterations / total if total else None,
+        "mean_ms": statistics.fmean(samples) * 1000,
+        "p50_ms": _percentile(samples, 50) * 1000,
+        "p95_ms": _percentile(samples, 95) * 1000,
+        "p99_ms": _percentile(samples, 99) * 1000,
+        **{f"{key}_per_s": value / total for key, value in counters.items() if total},
+        **extra,
+    }
+
+
+def benchSendData(server: StandInServer, scale: int) -> list[dict]:
+    _, token = server.backend.addDevice("Send Data")
+    device = Device({"token": token, "region": server.region})
+
+    results = []
+    for batchSize in (1, 100, 1000):
+        batch = [
+            {"variable": "temperature", "value": i, "unit": "C"}
+            for i in range(batchSize)
+        ]
+
+        def send(batch=batch) -> dict:
+            device.sendData(batch)
+            return {"records": len(batch)}
+
+        iterations = max(int(scale * 20 / batchSize**0.5), 5)
+        results.append(
+            measure(f"device.sendData[{batchSize}]", send, iterations, batch=batchSize)
+        )
+
+    return results
+
+
+def benchGetDeviceData(server: StandInServer, scale: int) -> list[dict]:
+    deviceID, token = server.backend.addDevice("Get Data")
+    Device({"token": token, "region": server.region}).sendData(
+        [
+            {
+                "variable": "temperature",
+                "value": i,
+                "time": f"2024-01-01T{i // 3600:02d}:{i // 60 % 60:02d}:{i % 60:02d}Z",
+            }
+            for i in range(5000)
+        ]
+    )
+    resources = Resources({"token": ACCOUNT_TOKEN, "region": server.region})
+
+    def getData() -> dict:
+        result = resources.devices.getDeviceData(deviceID, {"qty": 1000})
+        return {"records": len(result)}
+
+    def getDataStream() -> dict:
+        return {
+            "records": sum(
+                1
+                for _ in resources.devices.getDeviceDataStream(deviceID, {"qty": 1000})
+            )
+        }
+
+    return [
+        measure("devices.getDeviceData[1000]", getData, scale * 2),
+        measure("devices.getDeviceDataStream[1000]", getDataStream, scale * 2),
+    ]
+
+
+def benchListDevice(server: StandInServer, scale: int) -> list[dict]:
+    for i in range(500):
+        server.backend.addDevice(
+            f"Pagination {i:03d}", tags=[{"key": "bench", "value": "list"}]
+        )
+    resources = Resources({"token": ACCOUNT_TOKEN, "region": server.region})
+
+    def listAll() -> dict:
+        devices = []
+        page = 1
+        while True:
+            result = resources.devices.listDevice(
+                {
+                    "page": page,
+                    "amount": 100,
+                    "fields": ["id", "name", "created_at"],
+                    "filter": {"name": "Pagination*"},
+                }
+            )
+            devices.extend(result)
+            if len(result) < 100:
+                return {"records": len(devices), "pages": page}
+            page += 1
+
+    def listAllParallel() -> dict:
+        devices = resources.devices.listAllDevices(
+            {"fields": ["id", "name", "created_at"], "filter": {"name": "Pagination*"}},
+            pageSize=100,
+        )
+        return {"records": len(devices)}
+
+    return [
+        measure("devices.listDevice[500 by 100]", listAll, scale),
+        measure("devices.listAllDevices[500 by 100]", listAllParallel, scale),
+    ]
+
+
+def benchUploadFile(server: StandInServer, scale: int) -> list[dict]:
+    resources = Resources({"token": ACCOUNT_TOKEN, "region": server.region})
+    content = os.urandom(16 * MB)
+
+    def upload() -> dict:
+        resources.files.uploadFile(
+            content, "/benchmark/file.bin", {"chunkSize": 5 * MB}
+        )
+        return {"bytes": len(content)}
+
+    return [
+        measure("files.uploadFile[16MB]", upload, max(scale // 2, 2), size=len(content))
+    ]
+
+
+def benchAnalysisTrigger(server: StandInServer, scale: int) -> list[dict]:
+    analysisToken = server.backend.addAnalysis("Benchmark")
+    triggered = threading.Event()
+
+    def analysisFunction(context, scope) -> None:
+        triggered.set()
+
+    analysis = Analysis({"token": analysisToken, "region": server.region})
+    thread = threading.Thread(
+        target=analysis.init, args=(analysisFunction,), daemon=True
+    )
+    thread.start()
+
+    deadline = time.monotonic() + 10
+    while not server.backend.triggerAnalysis(analysisToken):
+        if time.monotonic() > deadline:
+            raise RuntimeError("The analysis did not connect to the SSE channel")
+        time.sleep(0.01)
+    triggered.wait(10)
+
+    def dispatch() -> None:
+        triggered.clear()
+        server.backend.triggerAnalysis(
+            analysisToken, data=[{"variable": "temperature", "value": 1}]
+        )
+        if not triggered.wait(10):
+            raise RuntimeError("The analysis was not triggered")
+
+    return [measure("analysis.sseTriggerDispatch", dispatch, scale * 10)]
+
+
+def benchCacheAndHash(server: StandInServer, scale: int) -> list[dict]:
+    params = {
+        "path": "/device/63f50a69fd802b000ac1aa76/data",
+        "method": "GET",
+        "params": {
+            "variables": ["temperature", "humidity"],
+            "qty": 1000,
+            "ordination": "descending",
+        },
+        "token": ACCOUNT_TOKEN,
+    }
+    cache = TTLCache(max_entries=1000)
+    value = [{"variable": "temperature", "value": i} for i in range(100)]
+    valueSize = len(json.dumps(value))
+    keys = list(range(2000))
+
+    def cacheSetGet() -> dict:
+        for key in keys:
+            cache.set(key, value, 60_000, size=valueSize)
+            cache.get(key)
+        return {"operations": len(keys) * 2}
+
+    iterations = scale * 1000
+    return [
+        measure("hash_generator", lambda: hash_generator(params), iterations),
+        measure("generateRequestID", lambda: generateRequestID(params), iterations),
+        measure("TTLCache.set+get[2000]", cacheSetGet, max(scale, 5)),
+    ]
+
+
+BENCHMARKS = {
+    "sendData": benchSendData,
+    "getDeviceData": benchGetDeviceData,
+    "listDevice": benchListDevice,
+    "uploadFile": benchUploadFile,
+    "analysisTrigger": benchAnalysisTrigger,
+    "cacheAndHash": benchCacheAndHash,
+}
+
+
+def run(names: list[str], scale: int) -> dict:
+    results = []
+    # The analysis runtime prints its status, keep stdout for the JSON report
+    with StandInServer() as server, contextlib.redirect_stdout(sys.stderr):
+        for name in names:
+            results.extend(BENCHMARKS[name](server, scale))
+    closeSessions()
+
+    return {
+        "sdk_version": __version__,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "scale": scale,
+        "results": results,
+    }
+
+
+def main(argv: Optional[list[str]] = None) -> None:
+    argParser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    argParser.add_argument(
+        "--only", nargs="+", choices=list(BENCHMARKS), default=list(BENCHMARKS)
+    )
+    argParser.add_argument(
+        "--quick", action="store_true", help="fewer iterations, for smoke runs"
+    )
+    argParser.add_argument(
+        "--output", help="write the JSON results to this file instead of stdout"
+    )
+    args = argParser.parse_args(argv)
+
+    report = run(args.only, scale=1 if args.quick else 10)
+
+    if args.output:
+        with open(args.output, "w") as output:
+            json.dump(report, output, indent=2)
+    else:
+        json.dump(report, sys.stdout, indent=2)
+        print()
+
+    for result in report["results"]:
+        print(
+            f"{result['name']:<36} {result['ops_per_s']:>12.1f} ops/s  p50 {result['p50_ms']:>9.3f} ms"
+            f"  p95 {result['p95_ms']:>9.3f} ms",
+            file=sys.stderr,
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+"""
+Local HTTP stand-in for the TagoIO API and SSE endpoints.
+
+Serves a `FakeTagoIO` backend over real sockets, so benchmarks go through the
+whole SDK stack: sessions, connection pool, retries, JSON codec and streaming.
+"""
+
+import threading
+
+from http.server import BaseHTTPRequestHandler
+from http.server import ThreadingHTTPServer
+
+import requests
+
+from tagoio_sdk.infrastructure.fake_backend import FakeTagoIO
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+    backend: FakeTagoIO
+
+    def _serve(self) -> None:
+        length = int(self.headers.get("Content-Length") or 0)
+        body = self.rfile.read(length) if length else None
+        url = f"http://{self.headers.get('Host')}{self.path}"
+        request = requests.Request(
+            self.command, url, headers=dict(self.headers.items()), data=body
+        ).prepare()
+
+        response = self.backend.handle(request)
+
+        self.send_response(response.status_code)
+        self.send_header("Content-Type", response.headers["Content-Type"])
+        if response.headers["Content-Type"] == "text/event-stream":
+            self.send_header("Connection", "close")
+            self.end_headers()
+            for chunk in iter(lambda: response.raw.read(1024), b""):
+                self.wfile.write(chunk)
+                self.wfile.flush()
+            self.close_connection = True
+            return
+
+        content = response.raw.read()
+        self.send_header("Content-Length", str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    do_GET = do_POST = do_PUT = do_DELETE = _serve
+
+    def log_message(self, *args) -> None:
+        pass
+
+
+class StandInServer(object):
+    """
+    Run a `FakeTagoIO` backend on a local port, in a background thread.
+
+    :example:
+
+        with StandInServer() as server:
+            resources = Resources({"token": "account", "region": server.region})
+    """
+
+    def __init__(
+        self, backend: FakeTagoIO = None, host: str = "127.0.0.1", port: int = 0
+    ) -> None:
+        self.backend = backend or FakeTagoIO()
+        handler = type("Handler", (_Handler,), {"backend": self.backend})
+        self._httpd = ThreadingHTTPServer((host, port), handler)
+        self._httpd.daemon_threads = True
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+
+    @property
+    def url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    @property
+    def region(self) -> dict:
+        return {"api": self.url, "sse": f"{self.url}/events"}
+
+    def start(self) -> "StandInServer":
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self.backend.closeStreams()
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+    def __enter__(self) -> "StandInServer":
+        return self.start()
+
+    def __exit__(self, *args) -> None:
+        self.stop()
@@ -1,10 +1,22 @@
 __version__ = "4.1.1"
 
 from .modules.Analysis.Analysis import Analysis
+from .modules.Device.AsyncDevice import AsyncDevice
 from .modules.Device.Device import Device
 from .modules.Resources.AccountDeprecated import AccountDeprecated as Account
+from .modules.Resources.AsyncResources import AsyncResources
 from .modules.Resources.Resources import Resources
+from .modules.Services.AsyncServices import AsyncServices
 from .modules.Services.Services import Services
 
 
-__all__ = ["Analysis", "Device", "Account", "Resources", "Services"]
+__all__ = [
+    "Analysis",
+    "Device",
+    "Account",
+    "Resources",
+    "Services",
+    "AsyncDevice",
+    "AsyncResources",
+    "AsyncServices",
+]
@@ -1,29 +1,269 @@
+import heapq
+import itertools
+import sys
+import threading
 import time
 
+from collections import OrderedDict
 from typing import Any
+from typing import Callable
 from typing import Dict
+from typing import Hashable
+from typing import Iterable
 from typing import Optional
 
+from tagoio_sdk import config
 from tagoio_sdk.common.Hash_Generator import generateRequestID
+from tagoio_sdk.infrastructure.json_codec import dumps
 
 
-# Cache structure: {(request_id, expire_timestamp): cached_object}
-cache_obj = {}
+def _json_size(value: Any) -> int:
+    try:
+        return len(dumps(value))
+    except (TypeError, ValueError):
+        return sys.getsizeof(value)
 
 
-def clear_cache_ttl() -> None:
+class _Entry(object):
+    __slots__ = ("value", "expires_at", "size", "tags")
+
+    def __init__(self, value: Any, expires_at: float, size: int, tags: tuple[str, ...]) -> None:
+        self.value = value
+        self.expires_at = expires_at
+        self.size = size
+        self.tags = tags
+
+
+class TTLCache(object):
     """
-    Clear expired items from the cache
+    Thread-safe cache with per-entry TTL and least recently used eviction.
+
+    Lookups are O(1) and expired entries are dropped through an expiry heap,
+    so no operation needs to scan every key.
+
+    Args:
+        max_entries: Max amount of entries, defaults to `cache.maxEntries`
+        max_bytes: Budget of the cached values, measured by their size in JSON,
+            defaults to `cache.maxBytes`
     """
-    current_time = int(time.time() * 1000)  # Current time in milliseconds
-    expired_keys = []
 
-    for item in cache_obj.keys():
-        if item[1] < current_time:
-            expired_keys.append(item)
+    def __init__(self, max_entries: Optional[int] = None, max_bytes: Optional[int] = None) -> None:
+        self.max_entries = max_entries if max_entries is not None else config.tagoSDKconfig["cache"]["maxEntries"]
+        self.max_bytes = max_bytes if max_bytes is not None else config.tagoSDKconfig["cache"]["maxBytes"]
+        self._entries: "OrderedDict[Hashable, _Entry]" = OrderedDict()
+        self._expiry: list[tuple[float, int, Hashable]] = []
+        self._counter = itertools.count()
+        self._tags: dict[str, set[Hashable]] = {}
+        self._lock = threading.RLock()
+        self._bytes = 0
+        self._reservations: dict[int, tuple[tuple[str, ...], list[bool]]] = {}
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def _remove(self, key: Hashable) -> None:
+        entry = self._entries.pop(key)
+        self._bytes -= entry.size
+        for tag in entry.tags:
+            keys = self._tags[tag]
+            keys.discard(key)
+            if not keys:
+                del self._tags[tag]
+
+    def _purge_expired(self, now: float) -> None:
+        while self._expiry and self._expiry[0][0] <= now:
+            expires_at, _, key = heapq.heappop(self._expiry)
+            entry = self._entries.get(key)
+            # Heap items are left behind when an entry is replaced or evicted
+            if entry is not None and entry.expires_at == expires_at:
+                self._remove(key)
+                self.expirations += 1
+
+        if len(self._expiry) > 2 * len(self._entries) + 64:
+            self._expiry = [(entry.expires_at, next(self._counter), key) for key, entry in self._entries.items()]
+            heapq.heapify(self._expiry)
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """
+        Get a cached value, None if it's missing or expired
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+
+            if entry.expires_at <= time.monotonic():
+                self._remove(key)
+                self.expirations += 1
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry.value
+
+    def reserve(self, tags: Iterable[str]) -> int:
+        """
+        Reserve the caching of a value still being fetched, returns the reservation
+        to pass to `set`
+
+        If an entry with one of the tags is invalidated in the meantime, the value
+        is not cached, as it may have been fetched before the change.
+        """
+        with self._lock:
+            reservation = next(self._counter)
+            self._reservations[reservation] = (tuple(tags), [False])
+            return reservation
+
+    def cancel_reservation(self, reservation: int) -> None:
+        """
+        Drop a reservation whose value won't be cached
+        """
+        with self._lock:
+            self._reservations.pop(reservation, None)
+
+    def _invalidate_reservations(self, predicate: Callable[[str], bool]) -> None:
+        for tags, stale in self._reservations.values():
+            if not stale[0] and any(predicate(tag) for tag in tags):
+                stale[0] = True
+
+    def set(
+        self,
+        key: Hashable,
+        value: Any,
+        ttl_ms: int = 5000,
+        tags: Iterable[str] = (),
+        size: Optional[int] = None,
+        reservation: Optional[int] = None,
+    ) -> None:
+        """
+        Cache a value for `ttl_ms` milliseconds, evicting the least recently used
+        entries while the cache is over its limits
+
+        Tags group entries so they can be dropped together with `invalidate_tag`.
+        `size` is the length in bytes of the response body the value was parsed
+        from; without it the value is serialized to JSON to measure it.
+        With a `reservation` from `reserve`, the value is only cached if none of
+        its tags was invalidated since then.
+        """
+        if reservation is not None:
+            with self._lock:
+                _, stale = self._reservations.pop(reservation, ((), [True]))
+            if stale[0]:
+                return
+
+        if size is None:
+            size = _json_size(value)
+        if size > self.max_bytes:
+            return
+
+        with self._lock:
+            now = time.monotonic()
+            self._purge_expired(now)
+
+            if key in self._entries:
+                self._remove(key)
+
+            expires_at = now + ttl_ms / 1000
+            tags = tuple(tags)
+            self._entries[key] = _Entry(value, expires_at, size, tags)
+            self._bytes += size
+            for tag in tags:
+                self._tags.setdefault(tag, set()).add(key)
+            heapq.heappush(self._expiry, (expires_at, next(self._counter), key))
 
-    for key in expired_keys:
-        del cache_obj[key]
+            while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+                old_key = next(iter(self._entries))
+                self._remove(old_key)
+                self.evictions += 1
+
+    def delete(self, key: Hashable) -> bool:
+        """
+        Remove an entry, returns whether it existed
+        """
+        with self._lock:
+            if key not in self._entries:
+                return False
+            self._remove(key)
+            return True
+
+    def invalidate_tag(self, tag: str) -> int:
+        """
+        Remove every entry with the tag, returns the amount removed
+        """
+        with self._lock:
+            self._invalidate_reservations(lambda reserved: reserved == tag)
+            keys = list(self._tags.get(tag, ()))
+            for key in keys:
+                self._remove(key)
+
+            return len(keys)
+
+    def invalidate_tags(self, predicate: Callable[[str], bool]) -> int:
+        """
+        Remove every entry with a tag matching the predicate, returns the amount removed
+
+        Reserved values with a matching tag won't be cached either.
+        """
+        with self._lock:
+            self._invalidate_reservations(predicate)
+            keys = set()
+            for tag in [tag for tag in self._tags if predicate(tag)]:
+                keys.update(self._tags[tag])
+
+            for key in keys:
+                self._remove(key)
+
+            return len(keys)
+
+    def clear_expired(self) -> None:
+        """
+        Remove every expired entry
+        """
+        with self._lock:
+            self._purge_expired(time.monotonic())
+
+    def clear(self) -> None:
+        """
+        Remove every entry
+        """
+        with self._lock:
+            self._entries.clear()
+            self._expiry.clear()
+            self._tags.clear()
+            self._bytes = 0
+            self._invalidate_reservations(lambda tag: True)
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Counters of the cache usage
+        """
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+            }
+
+
+# Default cache shared by the SDK, keyed by request ID
+cache_obj = TTLCache()
+
+
+def clear_cache_ttl() -> None:
+    """
+    Clear expired items from the cache
+    """
+    cache_obj.clear_expired()
 
 
 def add_cache(request_obj: Dict, obj: Any, ttl_ms: int = 5000) -> None:
@@ -35,10 +275,7 @@ def add_cache(request_obj: Dict, obj: Any, ttl_ms: int = 5000) -> None:
         obj: The object to cache
         ttl_ms: Time-to-live in milliseconds (default: 5000)
     """
-    clear_cache_ttl()
-    key = generateRequestID(request_obj)
-    expiration = int(time.time() * 1000) + ttl_ms
-    cache_obj[(key, expiration)] = obj
+    cache_obj.set(generateRequestID(request_obj), obj, ttl_ms)
 
 
 def get_cache(request_obj: Dict) -> Optional[Any]:
@@ -51,14 +288,7 @@ def get_cache(request_obj: Dict) -> Optional[Any]:
     Returns:
         The cached object or None if not found
     """
-    clear_cache_ttl()
-    key = generateRequestID(request_obj)
-
-    for item in list(cache_obj.keys()):
-        if item[0] == key:
-            return cache_obj[item]
-
-    return None
+    return cache_obj.get(generateRequestID(request_obj))
 
 
 def clear_cache() -> None:
@@ -66,3 +296,10 @@ def clear_cache() -> None:
     Clear all items from the cache
     """
     cache_obj.clear()
+
+
+def cache_stats() -> Dict[str, int]:
+    """
+    Hit, miss and eviction counters of the cache
+    """
+    return cache_obj.stats()
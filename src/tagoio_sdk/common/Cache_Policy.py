@@ -0,0 +1,133 @@
+import re
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import lru_cache
+from typing import Iterator
+from typing import Optional
+
+from tagoio_sdk import config
+from tagoio_sdk.common.Cache import cache_obj
+
+
+_bypass_cache: ContextVar[bool] = ContextVar("tagoio_bypass_cache", default=False)
+
+
+@lru_cache(maxsize=256)
+def compile_path_pattern(pattern: str) -> re.Pattern:
+    """
+    Convert a path pattern to a regex.
+
+    `*` and `{name}` match a single path segment, `**` matches anything.
+    The segments matched by `{name}` are captured as named groups.
+    """
+    regex = ""
+    names = set()
+    for token in re.split(r"(\*\*|\*|\{[^}/]*\})", pattern):
+        name = token[1:-1] if token.startswith("{") and token.endswith("}") else None
+        if token == "**":
+            regex += ".*"
+        elif name and name.isidentifier():
+            regex += f"(?P={name})" if name in names else f"(?P<{name}>[^/]+)"
+            names.add(name)
+        elif token == "*" or name is not None:
+            regex += "[^/]+"
+        else:
+            regex += re.escape(token)
+
+    return re.compile(f"{regex}/?")
+
+
+def get_cache_ttl(path: str) -> Optional[int]:
+    """
+    TTL in milliseconds of the first cache policy matching the path,
+    None if responses of the path must not be cached
+
+    Args:
+        path: Path of the request, without the API URL or query string
+    """
+    cache_config = config.tagoSDKconfig["cache"]
+    if not cache_config["enabled"]:
+        return None
+
+    for pattern, ttl_ms in cache_config["policies"].items():
+        if compile_path_pattern(pattern).fullmatch(path):
+            return ttl_ms
+
+    return None
+
+
+def get_invalidation_patterns(path: str) -> list[str]:
+    """
+    Path patterns of the cached GETs made stale by a PUT, POST or DELETE on the path.
+
+    The path itself, its sub-paths and its parent (usually the list endpoint) are
+    always included, plus the targets of every `cache.invalidation` rule matching
+    the path, with `{name}` replaced by the segment captured by the rule.
+
+    Args:
+        path: Path of the mutating request
+    """
+    path = path.rstrip("/") or "/"
+    patterns = [path, f"{path}/**"]
+
+    parent = path.rsplit("/", 1)[0]
+    if parent:
+        patterns.append(parent)
+
+    for rule, targets in config.tagoSDKconfig["cache"]["invalidation"].items():
+        match = compile_path_pattern(rule).fullmatch(path)
+        if match is None:
+            continue
+
+        for target in targets:
+            for name, value in match.groupdict().items():
+                target = target.replace(f"{{{name}}}", value)
+            patterns.append(target)
+
+    return patterns
+
+
+def invalidate_cache(path: str) -> int:
+    """
+    Drop the cached responses made stale by a mutation on the path, for every token
+
+    Args:
+        path: Path of the mutating request
+
+    Returns:
+        Amount of cached responses removed
+    """
+    regexes = [
+        compile_path_pattern(pattern) for pattern in get_invalidation_patterns(path)
+    ]
+    return cache_obj.invalidate_tags(
+        lambda tag: any(regex.fullmatch(tag) for regex in regexes)
+    )
+
+
+def is_cache_bypassed() -> bool:
+    """
+    Check if the current context is inside `bypass_cache()`
+    """
+    return _bypass_cache.get()
+
+
+@contextmanager
+def bypass_cache() -> Iterator[None]:
+    """
+    Skip cached responses for every request made inside the block.
+
+    Fresh responses are still stored, so later calls see the updated data.
+
+    Example:
+        ```python
+        with bypass_cache():
+            network = resources.integration.networks.info(network_id)
+        ```
+    """
+    token = _bypass_cache.set(True)
+    try:
+        yield
+    finally:
+        _bypass_cache.reset(token)
@@ -1,32 +1,53 @@
+import hashlib
 import json
 
 from typing import Any
 from typing import Dict
 
 
+try:
+    import xxhash
+except ImportError:
+    xxhash = None
+
+
+CACHEABLE_METHODS = ("GET", "HEAD")
+"""Methods whose responses can be cached or shared, the only ones needing a request ID"""
+
+
+def is_cacheable_method(method: str) -> bool:
+    """
+    Check if requests with the method can be cached, so computing their ID is worth it
+    """
+    return str(method).upper() in CACHEABLE_METHODS
+
+
+def canonical_json(obj: Any) -> bytes:
+    """
+    Serialize an object to compact JSON with sorted keys, so equal objects give equal bytes
+    """
+    return json.dumps(obj, sort_keys=True, separators=(",", ":"), default=str, ensure_ascii=False).encode()
+
+
 def hash_generator(obj: Any) -> int:
     """
-    Generate a hash from any object by converting it to JSON string
+    Generate a hash from any object by converting it to canonical JSON
+
+    Uses xxHash (XXH3) when the `xxhash` package is installed and BLAKE2b
+    otherwise. Bytes are hashed as they are, without serializing them.
 
     Args:
         obj: Any object that can be serialized to JSON
 
     Returns:
-        A 32-bit integer hash
+        A 128-bit integer hash
     """
-    obj_string = json.dumps(obj, sort_keys=True)
-
-    hash_value = 0
+    data = obj if isinstance(obj, (bytes, bytearray, memoryview)) else canonical_json(obj)
 
-    if len(obj_string) == 0:
-        return hash_value
+    if xxhash is not None:
+        return xxhash.xxh3_128_intdigest(data)
 
-    for i in range(len(obj_string)):
-        char = ord(obj_string[i])
-        hash_value = ((hash_value << 5) - hash_value) + char
-        hash_value = hash_value & 0xFFFFFFFF  # Convert to 32bit integer
-
-    return hash_value
+    return int.from_bytes(hashlib.blake2b(data, digest_size=16).digest(), "big")
 
 
 def generateRequestID(request_obj: Dict) -> int:
@@ -39,11 +60,14 @@ def generateRequestID(request_obj: Dict) -> int:
     Returns:
         A unique request ID as integer
     """
+    body = request_obj.get("data") or request_obj.get("body")
+
     obj_key = {
         "url": request_obj.get("url"),
         "token": request_obj.get("headers", {}).get("token"),
         "params": request_obj.get("params"),
-        "body": request_obj.get("data") or request_obj.get("body"),
+        # Pre-serialized bodies are hashed on their own instead of being stringified
+        "body": hash_generator(body) if isinstance(body, (bytes, bytearray, memoryview)) else body,
         "method": request_obj.get("method"),
     }
 
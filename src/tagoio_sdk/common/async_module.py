@@ -0,0 +1,142 @@
+import asyncio
+import contextvars
+import functools
+import inspect
+import threading
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+from typing import AsyncIterator
+from typing import Callable
+from typing import Generic
+from typing import Optional
+from typing import TypeVar
+
+from tagoio_sdk import config
+from tagoio_sdk.common.tagoio_module import TagoIOModule
+
+
+ModuleT = TypeVar("ModuleT")
+
+_executor: Optional[ThreadPoolExecutor] = None
+_executorLock = threading.Lock()
+
+
+def asyncWorkers() -> int:
+    """
+    Threads running the async calls: `asyncMaxWorkers`, or by default the
+    connections kept per host (`connectionPool.poolMaxsize`), so every thread
+    gets a pooled keep-alive connection.
+    """
+    return (
+        config.tagoSDKconfig["asyncMaxWorkers"]
+        or config.tagoSDKconfig["connectionPool"]["poolMaxsize"]
+    )
+
+
+def getAsyncExecutor() -> ThreadPoolExecutor:
+    """
+    Get the executor shared by every async module, with `asyncWorkers()` threads.
+    """
+    global _executor
+
+    with _executorLock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=asyncWorkers(), thread_name_prefix="tagoio-sdk"
+            )
+
+    return _executor
+
+
+def closeAsyncExecutor() -> None:
+    """
+    Shut the shared executor down, the next async call starts a new one from
+    the current config.
+    """
+    global _executor
+
+    with _executorLock:
+        executor, _executor = _executor, None
+    if executor is not None:
+        executor.shutdown(wait=False)
+
+
+async def runAsync(func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+    """
+    Run a blocking SDK call on the shared executor without blocking the event loop.
+
+    The caller context is copied to the worker thread, so context variables
+    keep working inside the call.
+    """
+    loop = asyncio.get_running_loop()
+    context = contextvars.copy_context()
+    call = functools.partial(context.run, func, *args, **kwargs)
+
+    return await loop.run_in_executor(getAsyncExecutor(), call)
+
+
+class ThreadOffloadModule(Generic[ModuleT]):
+    """
+    Expose the methods of a TagoIO module as coroutines, by running the
+    blocking calls on a thread pool.
+
+    This is not a native asyncio client: each call takes one of the
+    `asyncWorkers()` threads for as long as its request runs, so that's the
+    amount of requests in flight at once. Raise `TAGOIO_POOL_MAXSIZE` (or
+    `asyncMaxWorkers`) for larger fan-outs. Request building, region resolution
+    and result handling are the ones of the wrapped module.
+
+    Methods yielding items, such as `listDeviceStream`, become async iterators.
+    The wrapped generator is closed when the async iterator is, so use
+    `contextlib.aclosing` to release a stream left before its end right away.
+
+    The methods and parameters are the ones of the wrapped module, available as
+    `sync` for type hints and documentation.
+    """
+
+    def __init__(self, module: ModuleT) -> None:
+        self._module = module
+
+    @property
+    def sync(self) -> ModuleT:
+        """
+        The wrapped, blocking module.
+        """
+        return self._module
+
+    def __getattr__(self, name: str) -> Any:
+        attribute = getattr(self._module, name)
+
+        if isinstance(attribute, TagoIOModule):
+            wrapped = ThreadOffloadModule(attribute)
+        elif inspect.isgeneratorfunction(attribute) and not name.startswith("_"):
+
+            @functools.wraps(attribute)
+            async def wrapped(*args: Any, **kwargs: Any) -> AsyncIterator[Any]:
+                iterator = attribute(*args, **kwargs)
+                done = object()
+                try:
+                    while (item := await runAsync(next, iterator, done)) is not done:
+                        yield item
+                finally:
+                    await runAsync(iterator.close)
+
+        elif callable(attribute) and not name.startswith("_"):
+
+            @functools.wraps(attribute)
+            async def wrapped(*args: Any, **kwargs: Any) -> Any:
+                return await runAsync(attribute, *args, **kwargs)
+
+        else:
+            return attribute
+
+        self.__dict__[name] = wrapped
+        return wrapped
+
+    def __dir__(self) -> list[str]:
+        public = [name for name in dir(self._module) if not name.startswith("_")]
+        return sorted(set(super().__dir__()) | set(public))
+
+    def __repr__(self) -> str:
+        return f"<Async{type(self._module).__name__}>"
@@ -0,0 +1,180 @@
+import contextvars
+import threading
+
+from concurrent.futures import FIRST_COMPLETED
+from concurrent.futures import Future
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import wait
+from typing import Any
+from typing import Callable
+from typing import Hashable
+from typing import Iterator
+from typing import Optional
+from typing import TypeVar
+
+
+T = TypeVar("T")
+
+DEFAULT_PAGE_SIZE = 100
+DEFAULT_MAX_WORKERS = 8
+
+
+def _fetchInBackground(fetchPage: Callable[[Any], Any], page: Any) -> Future:
+    future: Future = Future()
+    context = contextvars.copy_context()
+
+    def run() -> None:
+        try:
+            future.set_result(context.run(fetchPage, page))
+        except BaseException as e:
+            future.set_exception(e)
+
+    threading.Thread(target=run, name="tagoio-prefetch", daemon=True).start()
+    return future
+
+
+def paginate(
+    fetchPage: Callable[[int], list[T]],
+    pageSize: int = DEFAULT_PAGE_SIZE,
+    page: int = 1,
+    prefetch: bool = False,
+) -> Iterator[T]:
+    """
+    Yield the items of every page, starting at `page`, until a page shorter
+    than `pageSize` comes back.
+
+    Pages are only requested while the iteration goes on, so at most one page
+    (two when prefetching) is held in memory.
+
+    Args:
+        fetchPage: Request one page, given its number
+        pageSize: Amount of items asked for each page
+        page: First page to request
+        prefetch: Request the next page in the background while the items of
+            the current one are consumed
+    """
+    nextPage = None
+    while True:
+        items = nextPage.result() if nextPage is not None else fetchPage(page)
+        nextPage = None
+
+        full = len(items) >= pageSize
+        if full and prefetch:
+            nextPage = _fetchInBackground(fetchPage, page + 1)
+
+        yield from items
+
+        if not full:
+            return
+        page += 1
+
+
+def paginateCursor(
+    fetchPage: Callable[[Any], tuple[list[T], Any]],
+    cursor: Any = None,
+    prefetch: bool = False,
+) -> Iterator[T]:
+    """
+    Yield the items of every page of a cursor-paginated query.
+
+    `fetchPage` gets the cursor of a page and returns its items with the cursor
+    of the next page, None on the last page. The next cursor is known as soon as
+    a page arrives, so with `prefetch` the next page is requested in the
+    background before the items of the current one are yielded.
+
+    Args:
+        fetchPage: Request the page at a cursor
+        cursor: Cursor of the first page
+        prefetch: Request the next page while the current one is consumed
+    """
+    nextPage = None
+    while True:
+        items, cursor = nextPage.result() if nextPage is not None else fetchPage(cursor)
+        nextPage = None
+
+        if cursor is not None and prefetch:
+            nextPage = _fetchInBackground(fetchPage, cursor)
+
+        yield from items
+
+        if cursor is None:
+            return
+
+
+def _itemID(item: Any) -> Optional[Hashable]:
+    return item.get("id") if isinstance(item, dict) else None
+
+
+def fetchAllPages(
+    fetchPage: Callable[[int], list[T]],
+    pageSize: int = DEFAULT_PAGE_SIZE,
+    page: int = 1,
+    maxWorkers: int = DEFAULT_MAX_WORKERS,
+    key: Optional[Callable[[T], Optional[Hashable]]] = _itemID,
+) -> list[T]:
+    """
+    Request the pages concurrently, starting at `page`, until a page shorter
+    than `pageSize` comes back, and return their items in page order.
+
+    Up to `maxWorkers` pages are in flight at once. Once a short page arrives,
+    the pages after it are cancelled or dropped. Items moving between pages
+    while the scan runs would show up twice, so items with the same `key` are
+    only kept the first time. Items without key (None) are always kept.
+
+    Args:
+        fetchPage: Request one page, given its number
+        pageSize: Amount of items asked for each page
+        page: First page to request
+        maxWorkers: Max pages requested at once
+        key: Identity of an item, defaults to its "id". None disables the dedupe
+    """
+    pages: dict[int, list[T]] = {}
+    lastPage: Optional[int] = None
+    nextPage = page
+
+    with ThreadPoolExecutor(
+        max_workers=maxWorkers, thread_name_prefix="tagoio-pages"
+    ) as executor:
+        pending: dict[Future, int] = {}
+        try:
+            while True:
+                while len(pending) < maxWorkers and lastPage is None:
+                    future = executor.submit(
+                        contextvars.copy_context().run, fetchPage, nextPage
+                    )
+                    pending[future] = nextPage
+                    nextPage += 1
+                if not pending:
+                    break
+
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    number = pending.pop(future)
+                    items = future.result()
+                    pages[number] = items
+                    if len(items) < pageSize and (
+                        lastPage is None or number < lastPage
+                    ):
+                        lastPage = number
+
+                if lastPage is not None:
+                    for future, number in list(pending.items()):
+                        if number > lastPage:
+                            future.cancel()
+                            del pending[future]
+        finally:
+            for future in pending:
+                future.cancel()
+
+    result: list[T] = []
+    seen: set[Hashable] = set()
+    for number in range(page, lastPage + 1):
+        for item in pages[number]:
+            itemKey = key(item) if key is not None else None
+            if itemKey is not None:
+                if itemKey in seen:
+                    continue
+                seen.add(itemKey)
+            result.append(item)
+
+    return result
@@ -1,8 +1,33 @@
+import copy
+import time
+
+from typing import Any
+from typing import Iterator
 from typing import Optional
+from typing import Sequence
 from typing import TypedDict
 
+import requests
+
+from tagoio_sdk import config
+from tagoio_sdk.common.Cache import cache_obj
+from tagoio_sdk.common.Cache_Policy import get_cache_ttl
+from tagoio_sdk.common.Cache_Policy import invalidate_cache
+from tagoio_sdk.common.Cache_Policy import is_cache_bypassed
+from tagoio_sdk.common.Hash_Generator import generateRequestID
+from tagoio_sdk.common.Hash_Generator import is_cacheable_method
 from tagoio_sdk.infrastructure.api_request import RequestParams
 from tagoio_sdk.infrastructure.api_request import apiRequest
+from tagoio_sdk.infrastructure.api_request import apiRequestStream
+from tagoio_sdk.infrastructure.api_request import apiRequestWithSize
+from tagoio_sdk.infrastructure.http_session import getSession
+from tagoio_sdk.infrastructure.instrumentation import RequestInfo
+from tagoio_sdk.infrastructure.instrumentation import afterRequest
+from tagoio_sdk.infrastructure.instrumentation import beforeRequest
+from tagoio_sdk.infrastructure.instrumentation import endpointName
+from tagoio_sdk.infrastructure.rate_limiter import getRateLimiter
+from tagoio_sdk.infrastructure.single_flight import SingleFlight
+from tagoio_sdk.infrastructure.tracing import span
 from tagoio_sdk.regions import Regions
 from tagoio_sdk.regions import getConnectionURI
 
@@ -10,6 +35,8 @@ from tagoio_sdk.regions import getConnectionURI
 class DoRequestParams(RequestParams):
     url: None
     maxContentLength: Optional[float]
+    cache: Optional[bool]
+    """Set False to skip the cached response, the fresh one is still cached"""
 
 
 class GenericModuleParams(TypedDict):
@@ -17,6 +44,9 @@ class GenericModuleParams(TypedDict):
     region: Regions
 
 
+_inFlightRequests = SingleFlight()
+
+
 class TagoIOModule(object):
     def __init__(self, params: GenericModuleParams) -> None:
         self.token = params.get("token")
@@ -29,6 +59,13 @@ class TagoIOModule(object):
             raise Exception("Token is invalid")
         pass
 
+    @property
+    def session(self) -> requests.Session:
+        """
+        Keep-alive session shared by every module using the same region and token
+        """
+        return getSession(getConnectionURI(self.region)["api"], self.token)
+
     def _converter_dict_param_filter(self, params: dict) -> None:
         """
         Convert filter params to API format
@@ -54,11 +91,100 @@ class TagoIOModule(object):
                 params[f"filter[{key}]"] = value
 
     def doRequest(self, params: DoRequestParams) -> dict[str, any]:
+        method = params["method"].upper()
+        attributes = {"http.request.method": method, "url.path": params["path"]}
+        with span(f"TagoIO {method} {endpointName(params['path'])}", attributes):
+            return self._doRequest(params)
+
+    def _doRequest(self, params: DoRequestParams) -> dict[str, any]:
+        url = getConnectionURI(self.region)["api"]
+        self._converter_dict_param_filter(params=params.get("params", {}))
+        requestParams = {
+            **params,
+            "url": url,
+            "headers": {"token": self.token},
+            "session": getSession(url, self.token),
+            "rateLimiter": getRateLimiter(url, self.token),
+        }
+
+        if is_cacheable_method(params["method"]):
+            return self._doGetRequest(requestParams)
+
+        try:
+            return apiRequest(requestParams)
+        finally:
+            if config.tagoSDKconfig["cache"]["enabled"]:
+                invalidate_cache(params["path"])
+
+    def _doGetRequest(self, requestParams: RequestParams) -> dict[str, any]:
+        """
+        Serve GET requests from the response cache and share in-flight ones
+        """
+        cacheTTL = get_cache_ttl(requestParams["path"])
+        coalesce = config.tagoSDKconfig["coalesceRequests"]
+        if cacheTTL is None and not coalesce:
+            return apiRequest(requestParams)
+
+        requestID = generateRequestID(
+            {**requestParams, "url": f"{requestParams['url']}{requestParams['path']}"}
+        )
+
+        if cacheTTL is not None and requestParams.get("cache") is not False and not is_cache_bypassed():
+            cached = cache_obj.get(requestID)
+            if cached is not None:
+                info = RequestInfo(requestParams["method"], requestParams["url"], requestParams["path"])
+                info.cacheHit = True
+                beforeRequest(info)
+                afterRequest(info)
+                return copy.deepcopy(cached)
+
+        def request() -> dict[str, any]:
+            if cacheTTL is None:
+                return apiRequest(requestParams)
+
+            # Not cached if a mutation invalidated the path while the request was running
+            tags = [requestParams["path"]]
+            reservation = cache_obj.reserve(tags)
+            try:
+                result, size = apiRequestWithSize(requestParams)
+            except BaseException:
+                cache_obj.cancel_reservation(reservation)
+                raise
+            cache_obj.set(requestID, copy.deepcopy(result), cacheTTL, tags=tags, size=size, reservation=reservation)
+            return result
+
+        if coalesce:
+            callDeadline = None
+            if requestParams.get("deadline") is not None:
+                callDeadline = time.monotonic() + requestParams["deadline"]
+            return _inFlightRequests.do(requestID, request, callDeadline)
+
+        return request()
+
+    def doRequestStream(self, params: DoRequestParams, itemsPath: Sequence[str] = ("result",)) -> Iterator[Any]:
+        """
+        Send a request and yield the items of the result array as they are downloaded.
+
+        Nothing is sent until the iteration starts. Responses are never cached.
+
+        Args:
+            params: Same params as `doRequest`
+            itemsPath: Keys leading to the array to iterate, starting at the response root
+        """
         url = getConnectionURI(self.region)["api"]
         self._converter_dict_param_filter(params=params.get("params", {}))
-        return apiRequest({**params, "url": url, "headers": {"token": self.token}})
+        return apiRequestStream(
+            {
+                **params,
+                "url": url,
+                "headers": {"token": self.token},
+                "session": getSession(url, self.token),
+                "rateLimiter": getRateLimiter(url, self.token),
+            },
+            itemsPath,
+        )
 
     @staticmethod
     def doRequestAnonymous(params: DoRequestParams, region: Regions) -> dict[str, any]:
         url = getConnectionURI(region)["api"]
-        return apiRequest({**params, "url": url, "headers": {}})
+        return apiRequest({**params, "url": url, "headers": {}, "session": getSession(url)})
@@ -1,9 +1,89 @@
 import os
 
 
+def _envFlag(name: str) -> bool:
+    """
+    Check if an environment variable is set to 1, true or yes.
+    """
+    return (os.environ.get(name) or "").strip().lower() in ("1", "true", "yes")
+
+
+def _envRateLimit() -> float:
+    """
+    Requests per second set by `TAGOIO_RATE_LIMIT`, 0 (disabled) when unset or not positive.
+    """
+    rate = float(os.environ.get("TAGOIO_RATE_LIMIT") or 0)
+    return rate if rate > 0 else 0
+
+
+_rateLimit = _envRateLimit()
+
 tagoSDKconfig = {
     "requestAttempts": int(os.environ.get("TAGOIO_REQUEST_ATTEMPTS") or 5),
-    "requestTimeout": 60,  # seconds
+    "requestTimeout": 60,  # seconds, read timeout of each attempt
+    "connectTimeout": float(os.environ.get("TAGOIO_CONNECT_TIMEOUT") or 10),  # seconds to open a connection
+    "analysisDeadline": float(os.environ.get("TAGOIO_ANALYSIS_DEADLINE") or 0) or None,  # seconds SDK calls of a run may take
+    "spillDirectory": os.environ.get("TAGOIO_SPILL_DIRECTORY"),  # temporary files of spilled responses
+    "jsonCodec": os.environ.get("TAGOIO_JSON_CODEC") or "auto",  # "auto", "orjson", "ujson" or "json"
+    "retry": {
+        "baseDelay": 0.5,  # seconds, doubled on every attempt
+        "maxDelay": 30,  # seconds, cap of a single backoff (and of Retry-After)
+        "budget": 120,  # seconds, total time a call may spend retrying
+        "minAttemptTime": 1,  # seconds, no retry when less than this is left before the deadline
+    },
+    "transport": os.environ.get("TAGOIO_HTTP_TRANSPORT") or "http1",  # "http1", "http2" (needs the http2 extra) or an adapter factory
+    "connectionPool": {
+        "poolConnections": int(os.environ.get("TAGOIO_POOL_CONNECTIONS") or 10),  # hosts kept per session
+        "poolMaxsize": int(os.environ.get("TAGOIO_POOL_MAXSIZE") or 10),  # connections per host
+        "poolBlock": False,  # wait for a free connection instead of opening extra ones
+        "maxSessions": 64,  # sessions kept alive across regions/tokens
+    },
+    "cache": {
+        "enabled": _envFlag("TAGOIO_CACHE"),  # cache GET responses matching the policies
+        "policies": {  # path pattern: TTL in milliseconds, first match wins
+            "/integration/network/*": 10 * 60 * 1000,
+            "/dictionary/**": 5 * 60 * 1000,
+            "/device/{id}": 30 * 1000,
+        },
+        "invalidation": {  # mutated path pattern: cached path patterns dropped by PUT/POST/DELETE
+            "/device/{id}": ["/device/token/{id}"],
+            "/device/token/**": ["/device/token/**"],
+            "/integration/network/token/**": ["/integration/network/token/**"],
+            "/dictionary/**": ["/dictionary", "/dictionary/**"],
+        },
+        "maxEntries": 1000,
+        "maxBytes": 32 * 1024 * 1024,  # size of the cached response bodies
+    },
+    "compression": {
+        "threshold": int(os.environ.get("TAGOIO_COMPRESS_THRESHOLD") or 1024),  # bytes, smaller bodies are sent as is
+        "level": 6,  # gzip level of request bodies, 1 (fastest) to 9 (smallest)
+        "acceptEncoding": None,  # response encodings to ask for, None for every one urllib3 can decode
+    },
+    "hedging": {
+        "enabled": _envFlag("TAGOIO_HEDGING"),  # resend slow GETs, see infrastructure/hedging.py
+        "percentile": 95,  # latency percentile of the endpoint after which a GET is hedged
+        "minDelay": 0.01,  # seconds, never hedge sooner than this
+        "budget": 0.05,  # max extra requests, as a ratio of the GETs sent
+        "burst": 10,  # hedges that can be sent at once after a quiet period
+        "minSamples": 20,  # latencies of an endpoint needed before hedging it
+        "maxPrimaries": 64,  # GETs that may be hedged at once, the others run unhedged
+    },
+    "coalesceRequests": True,  # concurrent identical GETs share one request
+    "rateLimit": {
+        "enabled": _rateLimit > 0,
+        "requestsPerSecond": _rateLimit or 10,  # per token and region
+        "burst": 20,  # requests allowed at once after being idle
+        "initialConcurrency": 4,  # in-flight requests, adjusted on throttling
+        "minConcurrency": 1,
+        "maxConcurrency": 32,
+    },
+    "metrics": {
+        "enabled": True,  # per-endpoint request metrics, see instrumentation.getMetrics()
+    },
+    "tracing": {
+        "enabled": True,  # OpenTelemetry spans, once a tracer provider is configured
+    },
+    "asyncMaxWorkers": int(os.environ.get("TAGOIO_ASYNC_MAX_WORKERS") or 0) or None,  # threads of async calls, defaults to poolMaxsize
     "socketOpts": {
         "reconnectionDelay": 10,  # seconds
         "reconnection": True,
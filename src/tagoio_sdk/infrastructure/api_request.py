@@ -1,16 +1,39 @@
-import json
+import gzip
 import os
 import platform
+import tempfile
 import time
 
+from functools import lru_cache
+from typing import Any
+from typing import Iterator
 from typing import Literal
 from typing import Optional
+from typing import Sequence
 from typing import TypedDict
 
 import requests
 
+from urllib3.util.request import ACCEPT_ENCODING
+
 from tagoio_sdk import __version__
 from tagoio_sdk import config
+from tagoio_sdk.infrastructure.deadline import attemptTimeout
+from tagoio_sdk.infrastructure.deadline import remainingTime
+from tagoio_sdk.infrastructure.hedging import getHedger
+from tagoio_sdk.infrastructure.http_session import getSession
+from tagoio_sdk.infrastructure.instrumentation import RequestInfo
+from tagoio_sdk.infrastructure.instrumentation import afterRequest
+from tagoio_sdk.infrastructure.instrumentation import beforeRequest
+from tagoio_sdk.infrastructure.json_codec import getJSONCodec
+from tagoio_sdk.infrastructure.json_stream import STREAM_CHUNK_SIZE
+from tagoio_sdk.infrastructure.json_stream import JSONResultStream
+from tagoio_sdk.infrastructure.rate_limiter import RateLimiter
+from tagoio_sdk.infrastructure.rate_limiter import isThrottled
+from tagoio_sdk.infrastructure.retry import RetryPolicy
+from tagoio_sdk.infrastructure.retry import getRetryPolicy
+from tagoio_sdk.infrastructure.retry import parseRetryAfter
+from tagoio_sdk.infrastructure.tracing import currentSpan
 
 
 class RequestParams(TypedDict):
@@ -21,6 +44,19 @@ class RequestParams(TypedDict):
     body: Optional[any]
     params: Optional[any]
     headers: Optional[any]
+    session: Optional[requests.Session]
+    retryPolicy: Optional[RetryPolicy]
+    rateLimiter: Optional[RateLimiter]
+    maxContentLength: Optional[float]
+    """Max bytes of the response body, larger responses raise TagoIORequestError"""
+    spillToFile: Optional[bool]
+    """When streaming, download the body to a temporary file and parse it from there"""
+    compress: Optional[bool]
+    """Gzip the body when it's larger than the compression threshold"""
+    deadline: Optional[float]
+    """Max seconds the call can take, retries included, on top of the context deadline"""
+    hedge: Optional[bool]
+    """Resend the GET when it's slower than usual, defaults to the hedging config"""
 
 
 class TagoIORequestError(Exception):
@@ -28,13 +64,20 @@ class TagoIORequestError(Exception):
 
     Attributes:
         message -- explanation of the error
+        statusCode -- HTTP status code of the response, None on connection errors
     """
 
-    def __init__(self, message: str = "Internal Error"):
+    def __init__(self, message: str = "Internal Error", statusCode: Optional[int] = None):
         self.message = message
+        self.statusCode = statusCode
         super().__init__(self.message)
 
 
+class TagoIODeadlineError(TagoIORequestError):
+    """Exception raised when a call runs out of time before getting a response."""
+
+
+@lru_cache(maxsize=1)
 def getUserAgent() -> str:
     systemBanner = "(External; Python/{} {})".format(
         platform.python_version(), platform.platform()
@@ -55,7 +98,13 @@ class ResultHandlerResponse(TypedDict):
 
 
 def resultHandler(req: requests.Response) -> ResultHandlerResponse:
-    responseJson = req.json()
+    try:
+        responseJson = getJSONCodec().loads(req.content)
+    except ValueError:
+        return {"error": f"Invalid response from TagoIO API (status {req.status_code})"}
+
+    if not isinstance(responseJson, dict):
+        return {"data": responseJson}
 
     if responseJson.get("status") is False or (
         req.status_code >= 400 and req.status_code < 500
@@ -65,47 +114,261 @@ def resultHandler(req: requests.Response) -> ResultHandlerResponse:
     return {"data": responseJson.get("result")}
 
 
-def apiRequest(requestParams: RequestParams) -> dict[str, any]:
-    sessionHTTP = requests.Session()
-    sessionHTTP.headers.update(
-        {
-            **requestParams["headers"],
-            "user-agent": getUserAgent(),
-            "content-type": "application/json",
-        }
+def _errorMessage(error: Exception) -> str:
+    reason = getattr(error.args[0], "reason", None) if error.args else None
+    return str(reason if reason is not None else error)
+
+
+def _iterContent(response: requests.Response, maxContentLength: Optional[float] = None) -> Iterator[bytes]:
+    """
+    Read the body of a streamed response, failing once it's over `maxContentLength` bytes.
+
+    Compressed bodies are decoded chunk by chunk, so the limit applies to the decoded size.
+    """
+    contentLength = response.headers.get("Content-Length")
+    if maxContentLength and contentLength and contentLength.isdigit() and int(contentLength) > maxContentLength:
+        raise TagoIORequestError(
+            f"Response of {contentLength} bytes exceeds maxContentLength of {maxContentLength:g} bytes",
+            response.status_code,
+        )
+
+    received = 0
+    for chunk in response.iter_content(chunk_size=STREAM_CHUNK_SIZE):
+        received += len(chunk)
+        if maxContentLength and received > maxContentLength:
+            raise TagoIORequestError(
+                f"Response exceeds maxContentLength of {maxContentLength:g} bytes",
+                response.status_code,
+            )
+        yield chunk
+
+
+def _bodySize(response: requests.Response) -> int:
+    contentLength = response.headers.get("Content-Length")
+    if contentLength and contentLength.isdigit():
+        return int(contentLength)
+    return len(response.content)
+
+
+def _countBytes(chunks: Iterator[bytes], info: RequestInfo) -> Iterator[bytes]:
+    for chunk in chunks:
+        info.bytesReceived += len(chunk)
+        yield chunk
+
+
+def _spillToFile(chunks: Iterator[bytes]) -> Iterator[bytes]:
+    """
+    Download the whole body to a temporary file, then read it back in chunks.
+
+    The connection is released as soon as the download ends, no matter how
+    slowly the items are consumed. The file is removed once read or closed.
+    """
+    spillFile = tempfile.TemporaryFile(dir=config.tagoSDKconfig["spillDirectory"])
+    try:
+        for chunk in chunks:
+            spillFile.write(chunk)
+        spillFile.seek(0)
+    except BaseException:
+        spillFile.close()
+        raise
+
+    def readFile() -> Iterator[bytes]:
+        with spillFile:
+            yield from iter(lambda: spillFile.read(STREAM_CHUNK_SIZE), b"")
+
+    return readFile()
+
+
+def _sendRequest(
+    requestParams: RequestParams, stream: bool = False
+) -> tuple[requests.Response, ResultHandlerResponse, RequestInfo]:
+    """
+    Send a request, retrying it according to the retry policy.
+
+    Returns the successful response, its handled result and the RequestInfo of the
+    call. When streaming, the body of successful responses is left unread, the
+    result is empty and the caller ends the RequestInfo with `afterRequest`.
+    """
+    sessionHTTP = requestParams.get("session") or getSession(
+        requestParams["url"], requestParams["headers"].get("token")
     )
+    compression = config.tagoSDKconfig["compression"]
+    headers = {
+        **requestParams["headers"],
+        "user-agent": getUserAgent(),
+        "content-type": "application/json",
+        "accept-encoding": compression["acceptEncoding"] or ACCEPT_ENCODING,
+    }
+    retryPolicy = requestParams.get("retryPolicy") or getRetryPolicy()
+    method = requestParams["method"].upper()
+    rateLimiter = requestParams.get("rateLimiter")
 
     url = "{}{}".format(requestParams["url"], requestParams["path"])
-    dataBody = json.dumps(requestParams.get("body"), default=str)
-    if dataBody == "null":
-        dataBody = None
-
-    def request() -> ResultHandlerResponse:
-        return resultHandler(
-            sessionHTTP.request(
-                method=requestParams["method"],
-                url=url,
-                data=dataBody,
-                params=requestParams.get("params"),
-                timeout=config.tagoSDKconfig["requestTimeout"],
-            )
+    dataBody = requestParams.get("body")
+    if dataBody is not None and not isinstance(dataBody, (bytes, bytearray)):
+        dataBody = getJSONCodec().dumps(dataBody)
+    if requestParams.get("compress") and dataBody is not None and len(dataBody) >= compression["threshold"]:
+        dataBody = gzip.compress(dataBody, compresslevel=compression["level"])
+        headers["content-encoding"] = "gzip"
+
+    maxContentLength = requestParams.get("maxContentLength")
+    callDeadline = time.monotonic() + requestParams["deadline"] if requestParams.get("deadline") is not None else None
+    info = RequestInfo(method, requestParams["url"], requestParams["path"], len(dataBody or b""), stream)
+    beforeRequest(info)
+
+    hedge = requestParams.get("hedge")
+    if hedge is None:
+        hedge = config.tagoSDKconfig["hedging"]["enabled"]
+    hedger = getHedger() if hedge and method == "GET" and not stream else None
+
+    def request() -> requests.Response:
+        remaining = remainingTime(callDeadline)
+        if remaining is not None and remaining <= 0:
+            raise TagoIODeadlineError("Deadline exceeded before the request was sent")
+
+        response = sessionHTTP.request(
+            method=method,
+            url=url,
+            data=dataBody,
+            headers=headers,
+            params=requestParams.get("params"),
+            timeout=attemptTimeout(callDeadline),
+            stream=stream or bool(maxContentLength),
         )
+        if maxContentLength and not stream:
+            # Read it in chunks, so an oversized body is refused before being buffered
+            try:
+                response._content = b"".join(_iterContent(response, maxContentLength))
+            finally:
+                response.close()
+        return response
+
+    startTime = time.monotonic()
+    attempt = 0
+    while True:
+        error = None
+        statusCode = None
+        retryAfter = None
+        resultBack = {}
+        resultError = None
+        info.attempts = attempt + 1
 
-    result = None
-    resulterror = None
-    for _ in range(config.tagoSDKconfig["requestAttempts"]):
+        if rateLimiter is not None and not rateLimiter.acquire(remainingTime(callDeadline)):
+            failure = TagoIODeadlineError("Deadline exceeded waiting for the rate limit")
+            info.error = failure
+            afterRequest(info)
+            raise failure
         try:
-            resultBack = request()
-            if resultBack.get("error") is not None:
-                resulterror = resultBack.get("error")
+            if hedger is not None:
+                response, hedged = hedger.run((method, info.endpoint), request, hedge, rateLimiter)
+                info.hedged = info.hedged or hedged
             else:
-                result = resultBack.get("data")
-            break
+                response = request()
+        except TagoIORequestError as e:
+            info.statusCode = e.statusCode
+            info.error = e
+            afterRequest(info)
+            raise
         except Exception as e:
-            resulterror = str(e.args[0].reason)
-        time.sleep(1.5)
+            error = e
+            resultError = _errorMessage(e)
+        else:
+            statusCode = info.statusCode = response.status_code
+            if not stream or statusCode >= 400:
+                resultBack = resultHandler(response)
+                resultError = resultBack.get("error")
+        finally:
+            if rateLimiter is not None:
+                rateLimiter.release(isThrottled(statusCode, resultBack.get("error")))
+
+        if error is None:
+            if resultError is None and statusCode < 500:
+                if not stream:
+                    info.bytesReceived = _bodySize(response)
+                    afterRequest(info)
+                return response, resultBack, info
+
+            resultError = resultError or response.reason
+            retryAfter = parseRetryAfter(response.headers.get("Retry-After"))
+            response.close()
+
+        remaining = remainingTime(callDeadline)
+        delay = retryPolicy.nextDelay(
+            attempt,
+            time.monotonic() - startTime,
+            method,
+            statusCode=statusCode,
+            error=error,
+            retryAfter=retryAfter,
+            remaining=remaining,
+        )
+        if delay is None:
+            if remaining is not None and remaining <= 0:
+                failure = TagoIODeadlineError(f"Deadline exceeded: {resultError}", statusCode)
+            else:
+                failure = TagoIORequestError(resultError, statusCode)
+            info.error = error or failure
+            afterRequest(info)
+            raise failure
+
+        currentSpan().add_event(
+            "retry",
+            {"tagoio.attempt": attempt + 1, "tagoio.delay": delay, "http.response.status_code": statusCode or 0},
+        )
+        time.sleep(delay)
+        attempt += 1
+
 
+def apiRequest(requestParams: RequestParams) -> dict[str, any]:
+    return apiRequestWithSize(requestParams)[0]
+
+
+def apiRequestWithSize(requestParams: RequestParams) -> tuple[Any, int]:
+    """
+    Same as `apiRequest`, also returning the length of the decoded response body in bytes.
+    """
+    response, resultBack, _ = _sendRequest(requestParams)
+
+    result = resultBack.get("data")
     if result is None:
-        raise TagoIORequestError(resulterror)
+        raise TagoIORequestError(None, response.status_code)
+
+    return result, len(response.content)
+
+
+def apiRequestStream(requestParams: RequestParams, itemsPath: Sequence[str] = ("result",)) -> Iterator[Any]:
+    """
+    Send a request and yield the items of the response array while it's downloaded,
+    without loading the whole body in memory.
+
+    Args:
+        requestParams: Same params as `apiRequest`
+        itemsPath: Keys leading to the array to iterate, starting at the response root
+    """
+    response, _, info = _sendRequest(requestParams, stream=True)
+
+    try:
+        chunks = _iterContent(response, requestParams.get("maxContentLength"))
+        contentLength = response.headers.get("Content-Length")
+        if contentLength and contentLength.isdigit():
+            info.bytesReceived = int(contentLength)
+        else:
+            chunks = _countBytes(chunks, info)
+        if requestParams.get("spillToFile"):
+            chunks = _spillToFile(chunks)
+            response.close()
+
+        stream = JSONResultStream(chunks, itemsPath)
+        yield from stream
 
-    return result
+        if stream.envelope.get("status") is False:
+            raise TagoIORequestError(stream.envelope.get("message"), response.status_code)
+    except TagoIORequestError as e:
+        info.error = e
+        raise
+    except ValueError as e:
+        info.error = TagoIORequestError(f"Invalid response from TagoIO API: {e}", response.status_code)
+        raise info.error from e
+    finally:
+        response.close()
+        afterRequest(info)
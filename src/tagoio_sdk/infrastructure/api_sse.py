@@ -3,11 +3,10 @@ from typing import Union
 from urllib.parse import urlencode
 from urllib.parse import urljoin
 
-import requests
-
 from sseclient import SSEClient
 
 from tagoio_sdk.common.tagoio_module import GenericModuleParams
+from tagoio_sdk.infrastructure.http_session import getSession
 from tagoio_sdk.regions import getConnectionURI
 
 
@@ -48,6 +47,8 @@ def openSSEListening(params: OpenSSEConfig) -> SSEClient:
 
     url += "?" + urlencode(query_params)
 
-    response = requests.get(url, stream=True, headers={"Accept": "text/event-stream"})
+    response = getSession(base_url, params.get("token")).get(
+        url, stream=True, headers={"Accept": "text/event-stream"}
+    )
 
     return SSEClient(response)
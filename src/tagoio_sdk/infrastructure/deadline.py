@@ -0,0 +1,83 @@
+import contextlib
+import contextvars
+import time
+
+from typing import Iterator
+from typing import Optional
+
+from tagoio_sdk import config
+
+
+_deadline: contextvars.ContextVar[Optional[float]] = contextvars.ContextVar(
+    "tagoio_deadline", default=None
+)
+
+
+def getDeadline() -> Optional[float]:
+    """
+    Get the deadline of the current context, as a `time.monotonic()` timestamp.
+    """
+    return _deadline.get()
+
+
+def remainingTime(callDeadline: Optional[float] = None) -> Optional[float]:
+    """
+    Seconds left until the earliest of the context deadline and `callDeadline`,
+    None when there is no deadline. It's negative once the deadline is over.
+    """
+    deadlines = [
+        value for value in (_deadline.get(), callDeadline) if value is not None
+    ]
+    if not deadlines:
+        return None
+    return min(deadlines) - time.monotonic()
+
+
+def attemptTimeout(callDeadline: Optional[float] = None) -> tuple[float, float]:
+    """
+    Connect and read timeouts of one request attempt, shortened to the time left
+    before the deadline.
+    """
+    connectTimeout = config.tagoSDKconfig["connectTimeout"]
+    readTimeout = config.tagoSDKconfig["requestTimeout"]
+
+    remaining = remainingTime(callDeadline)
+    if remaining is not None:
+        remaining = max(remaining, 0.001)
+        connectTimeout = min(connectTimeout, remaining)
+        readTimeout = min(readTimeout, remaining)
+
+    return connectTimeout, readTimeout
+
+
+@contextlib.contextmanager
+def deadline(seconds: Optional[float]) -> Iterator[Optional[float]]:
+    """
+    Limit the time every SDK call made inside the block can take, retries included.
+
+    Calls fail with TagoIODeadlineError once the time is over, and are not retried
+    when the time left is too short for another attempt. Nested deadlines can only
+    shorten the outer one. The deadline follows the context, so it applies to async
+    calls and upload threads started inside the block. None sets no deadline.
+
+    Example:
+        ```python
+        def my_analysis(context, scope):
+            with deadline(30):
+                devices = resources.devices.listDevice()
+        ```
+    """
+    if seconds is None:
+        yield _deadline.get()
+        return
+
+    value = time.monotonic() + seconds
+    current = _deadline.get()
+    if current is not None:
+        value = min(value, current)
+
+    token = _deadline.set(value)
+    try:
+        yield value
+    finally:
+        _deadline.reset(token)
@@ -0,0 +1,954 @@
+import base64
+import fnmatch
+import gzip
+import io
+import itertools
+import json
+import queue
+import re
+import threading
+import time
+import uuid
+
+from datetime import datetime
+from datetime import timezone
+from typing import Any
+from typing import Callable
+from typing import Optional
+from urllib.parse import parse_qs
+from urllib.parse import urlsplit
+
+import requests
+
+from dateutil import parser as dateutilParser
+from requests.adapters import BaseAdapter
+from requests.structures import CaseInsensitiveDict
+from requests_toolbelt.multipart.decoder import MultipartDecoder
+
+from tagoio_sdk import config
+from tagoio_sdk.infrastructure.http_session import closeSessions
+
+
+DEFAULT_DATA_QTY = 15
+"""Records returned by a data query without `qty`, same as the API"""
+
+
+class FakeTagoIOError(Exception):
+    def __init__(self, message: str, statusCode: int = 400) -> None:
+        super().__init__(message)
+        self.message = message
+        self.statusCode = statusCode
+
+
+def _now() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+def _formatDate(value: Optional[datetime]) -> Optional[str]:
+    if value is None:
+        return None
+    return value.isoformat(timespec="milliseconds").replace("+00:00", "Z")
+
+
+def _parseDate(value: Any) -> datetime:
+    if isinstance(value, datetime):
+        date = value
+    else:
+        date = dateutilParser.parse(str(value))
+    return date if date.tzinfo else date.replace(tzinfo=timezone.utc)
+
+
+def _serialize(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return _formatDate(value)
+    if isinstance(value, dict):
+        return {key: _serialize(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_serialize(item) for item in value]
+    return value
+
+
+def _pick(item: dict, fields: Optional[list[str]]) -> dict:
+    if not fields:
+        return dict(item)
+    return {field: item.get(field) for field in fields}
+
+
+def _paginate(items: list, query: dict, defaultAmount: int = 20) -> list:
+    page = max(int(query.get("page") or 1), 1)
+    amount = int(query.get("amount") or defaultAmount)
+    return items[(page - 1) * amount : page * amount]
+
+
+def _orderBy(items: list, query: dict, default: str) -> list:
+    field, _, direction = (query.get("orderBy") or default).partition(",")
+    return sorted(
+        items,
+        key=lambda item: (item.get(field) is None, item.get(field)),
+        reverse=direction == "desc",
+    )
+
+
+def _filterItems(items: list, query: dict) -> list:
+    """Apply `filter[field]` params, with `*` wildcards on strings and `filter[tags][i][key]` pairs"""
+    filters = {}
+    tags = {}
+    for key, value in query.items():
+        match = re.fullmatch(r"filter\[tags\]\[(\d+)\]\[(key|value)\]", key)
+        if match:
+            tags.setdefault(match.group(1), {})[match.group(2)] = value
+            continue
+        match = re.fullmatch(r"filter\[(\w+)\]", key)
+        if match:
+            filters[match.group(1)] = value
+
+    def matches(item: dict) -> bool:
+        for field, expected in filters.items():
+            value = item.get(field)
+            if isinstance(value, bool):
+                if str(value).lower() != str(expected).lower():
+                    return False
+            elif not fnmatch.fnmatchcase(str(value), str(expected)):
+                return False
+        for tag in tags.values():
+            if not any(
+                all(itemTag.get(key) == expected for key, expected in tag.items())
+                for itemTag in item.get("tags") or []
+            ):
+                return False
+        return True
+
+    return [item for item in items if matches(item)]
+
+
+def _listParam(query: dict, *names: str) -> Optional[list[str]]:
+    values = []
+    for name in names:
+        value = query.get(name)
+        if value is None:
+            continue
+        values.extend(value if isinstance(value, list) else [value])
+    return values or None
+
+
+class _FakeRequest(object):
+    def __init__(
+        self, method: str, url: str, headers: CaseInsensitiveDict, body: Any
+    ) -> None:
+        parts = urlsplit(url)
+        self.method = method.upper()
+        self.host = parts.netloc
+        self.path = parts.path.rstrip("/") or "/"
+        self.headers = headers
+        self.token = headers.get("token")
+        self.query = {
+            key: values
+            if len(values) > 1 or key in ("fields", "variables", "groups", "ids")
+            else values[0]
+            for key, values in parse_qs(parts.query, keep_blank_values=True).items()
+        }
+        self.rawBody = self._readBody(body)
+
+    def _readBody(self, body: Any) -> bytes:
+        if body is None:
+            return b""
+        if hasattr(body, "read"):
+            body = body.read()
+        if isinstance(body, str):
+            body = body.encode()
+        if self.headers.get("Content-Encoding") == "gzip":
+            body = gzip.decompress(body)
+        return bytes(body)
+
+    @property
+    def json(self) -> Any:
+        return json.loads(self.rawBody) if self.rawBody else None
+
+    @property
+    def form(self) -> dict[str, Any]:
+        decoder = MultipartDecoder(self.rawBody, self.headers["Content-Type"])
+        form = {}
+        for part in decoder.parts:
+            disposition = part.headers[b"Content-Disposition"].decode()
+            name = re.search(r'name="([^"]*)"', disposition).group(1)
+            form[name] = part.content if "filename=" in disposition else part.text
+        return form
+
+
+class _EventStream(object):
+    """Body of an SSE response, blocking until events are published or the backend closes it"""
+
+    def __init__(self) -> None:
+        self.events: "queue.Queue[Optional[bytes]]" = queue.Queue()
+        self._buffer = b""
+        self._closed = False
+
+    def read(self, amt: Optional[int] = None, **kwargs) -> bytes:
+        while not self._buffer and not self._closed:
+            event = self.events.get()
+            if event is None:
+                self._closed = True
+            else:
+                self._buffer += event
+
+        size = len(self._buffer) if amt is None else amt
+        data, self._buffer = self._buffer[:size], self._buffer[size:]
+        return data
+
+    def close(self) -> None:
+        self.events.put(None)
+
+
+class FakeTagoIO(object):
+    """
+    In-memory TagoIO backend, serving the SDK requests without any network.
+
+    Implements devices, device data (insert, query with `qty`/`skip`/`ordination`,
+    edit and delete), device tokens, configuration parameters, file uploads
+    (base64 and multipart), networks with downlinks, the analysis console and the
+    SSE channels. Any token that is not a device or analysis token is accepted as
+    an account token.
+
+    Install it as the transport of every session with `install()`, or use it as a
+    context manager. Handy for tests, load tests and benchmarks of analyses.
+
+    :param float latency: Seconds added to every request, to mimic a network round trip
+
+    :example:
+
+        with FakeTagoIO() as tago:
+            deviceID, token = tago.addDevice("Sensor")
+            Device({"token": token}).sendData({"variable": "temperature", "value": 21})
+            Resources({"token": "account"}).devices.getDeviceData(deviceID, {"qty": 10})
+    """
+
+    def __init__(self, latency: float = 0) -> None:
+        self.latency = latency
+        self.devices: dict[str, dict] = {}
+        self.data: dict[str, list[dict]] = {}
+        self.params: dict[str, list[dict]] = {}
+        self.tokens: dict[str, dict] = {}
+        self.analyses: dict[str, dict] = {}
+        self.networks: dict[str, dict] = {}
+        self.files: dict[str, dict] = {}
+        self.downlinks: list[dict] = []
+        self.console: list[str] = []
+        self.requestCount = 0
+        self._uploads: dict[str, dict] = {}
+        self._subscribers: dict[str, list[_EventStream]] = {}
+        self._ids = itertools.count(1)
+        self._lock = threading.RLock()
+        self._previousTransport = None
+        self._routes: list[tuple[str, re.Pattern, Callable]] = []
+        self._addRoutes()
+
+    # Setup
+
+    def install(self) -> "FakeTagoIO":
+        """Route the requests of every new session to this backend"""
+        self._previousTransport = config.tagoSDKconfig["transport"]
+        config.tagoSDKconfig["transport"] = self.adapter
+        closeSessions()
+        return self
+
+    def uninstall(self) -> None:
+        """Restore the previous transport and end the open SSE streams"""
+        config.tagoSDKconfig["transport"] = self._previousTransport
+        closeSessions()
+        self.closeStreams()
+
+    def __enter__(self) -> "FakeTagoIO":
+        return self.install()
+
+    def __exit__(self, *args) -> None:
+        self.uninstall()
+
+    def adapter(self) -> "FakeTagoIOAdapter":
+        """Create a transport adapter serving the requests from this backend"""
+        return FakeTagoIOAdapter(self)
+
+    def _newID(self) -> str:
+        return f"{next(self._ids):024x}"
+
+    def addDevice(self, name: str, **fields: Any) -> tuple[str, str]:
+        """
+        Create a device with a token.
+
+        :return: The device ID and its token
+        """
+        with self._lock:
+            device = self._createDevice({"name": name, **fields})
+            return device["id"], self._createToken(device["id"], {"name": "Default"})[
+                "token"
+            ]
+
+    def addAnalysis(self, name: str, **fields: Any) -> str:
+        """
+        Create an analysis to run locally.
+
+        :return: The analysis token
+        """
+        with self._lock:
+            token = str(uuid.uuid4())
+            self.analyses[token] = {
+                "id": self._newID(),
+                "name": name,
+                "run_on": "external",
+                "active": True,
+                **fields,
+            }
+            return token
+
+    def addNetwork(self, name: str, middlewareEndpoint: Optional[str] = None) -> str:
+        """
+        Create a network, with downlink support when it has a middleware endpoint.
+
+        :return: The network ID
+        """
+        with self._lock:
+            networkID = self._newID()
+            self.networks[networkID] = {
+                "id": networkID,
+                "name": name,
+                "middleware_endpoint": middlewareEndpoint,
+            }
+            return networkID
+
+    # SSE
+
+    def publish(self, channel: str, data: Any, token: Optional[str] = None) -> int:
+        """
+        Send an event to the SSE clients listening to a channel.
+
+        :param str channel: Channel name, with the resource ID when needed (`device_inspector.<id>`)
+        :param data: Event data, serialized to JSON
+        :param str token: Only deliver to clients connected with this token
+        :return: Amount of clients that received the event
+        """
+        event = f"data: {json.dumps(_serialize(data))}\n\n".encode()
+        with self._lock:
+            subscribers = [
+                stream
+                for stream, streamToken in self._subscribers.get(channel, [])
+                if token in (None, streamToken)
+            ]
+        for stream in subscribers:
+            stream.events.put(event)
+        return len(subscribers)
+
+    def triggerAnalysis(
+        self,
+        analysisToken: str,
+        data: Optional[list] = None,
+        environment: Optional[list] = None,
+    ) -> int:
+        """Trigger an analysis connected through `Analysis` on the analysis_trigger channel"""
+        analysis = self.analyses[analysisToken]
+        payload = {
+            "analysis_id": analysis["id"],
+            "data": data or [],
+            "environment": environment or [],
+        }
+        return self.publish(
+            "analysis_trigger", {"payload": payload}, token=analysisToken
+        )
+
+    def closeStreams(self) -> None:
+        """End every open SSE stream"""
+        with self._lock:
+            subscribers, self._subscribers = self._subscribers, {}
+        for streams in subscribers.values():
+            for stream, _ in streams:
+                stream.close()
+
+    # Request handling
+
+    def _addRoutes(self) -> None:
+        routes = [
+            ("GET", "/info", self._info),
+            ("POST", "/data", self._deviceInsertData),
+            ("GET", "/data", self._deviceGetData),
+            ("PUT", "/data", self._deviceEditData),
+            ("DELETE", "/data", self._deviceDeleteData),
+            ("GET", "/device/params", self._deviceGetParams),
+            ("PUT", "/device/params/{param}", self._deviceMarkParamSent),
+            ("GET", "/device", self._listDevices),
+            ("POST", "/device", self._createDeviceRoute),
+            ("GET", "/device/token/{device}", self._listTokens),
+            ("POST", "/device/token", self._createTokenRoute),
+            ("DELETE", "/device/token/{token}", self._deleteToken),
+            ("GET", "/device/{device}", self._deviceInfo),
+            ("PUT", "/device/{device}", self._editDevice),
+            ("DELETE", "/device/{device}", self._deleteDevice),
+            ("GET", "/device/{device}/data", self._getData),
+            ("POST", "/device/{device}/data", self._insertData),
+            ("PUT", "/device/{device}/data", self._editData),
+            ("DELETE", "/device/{device}/data", self._deleteData),
+            ("GET", "/device/{device}/data_amount", self._dataAmount),
+            ("POST", "/device/{device}/empty", self._emptyData),
+            ("GET", "/device/{device}/params", self._getParams),
+            ("POST", "/device/{device}/params", self._setParams),
+            ("DELETE", "/device/{device}/params/{param}", self._removeParam),
+            ("GET", "/integration/network/{network}", self._networkInfo),
+            ("GET", "/files", self._listFiles),
+            ("POST", "/files", self._uploadFiles),
+            ("PUT", "/files", self._moveFiles),
+            ("DELETE", "/files", self._deleteFiles),
+            ("POST", "/downlink", self._downlink),
+            ("POST", "/analysis/services/console/send", self._consoleLog),
+        ]
+        for method, pattern, handler in routes:
+            regex = re.compile(
+                "^" + re.sub(r"\{(\w+)\}", r"(?P<\1>[^/]+)", pattern) + "$"
+            )
+            self._routes.append((method, regex, handler))
+
+    def handle(self, request: requests.PreparedRequest) -> requests.Response:
+        """Serve a prepared request, returning the response the API would send"""
+        if self.latency:
+            time.sleep(self.latency)
+
+        fakeRequest = _FakeRequest(
+            request.method, request.url, request.headers, request.body
+        )
+        with self._lock:
+            self.requestCount += 1
+
+        if fakeRequest.path.endswith("/events") and fakeRequest.method == "GET":
+            return self._openStream(request, fakeRequest)
+
+        try:
+            handler, pathParams = self._route(fakeRequest)
+            with self._lock:
+                result = handler(fakeRequest, **pathParams)
+            statusCode, payload = 200, {"status": True, "result": _serialize(result)}
+        except FakeTagoIOError as e:
+            statusCode, payload = e.statusCode, {"status": False, "message": e.message}
+
+        return self._response(
+            request,
+            statusCode,
+            io.BytesIO(json.dumps(payload).encode()),
+            "application/json",
+        )
+
+    def _route(self, request: _FakeRequest) -> tuple[Callable, dict]:
+        pathFound = False
+        for method, regex, handler in self._routes:
+            match = regex.match(request.path)
+            if match is None:
+                continue
+            pathFound = True
+            if method == request.method:
+                return handler, match.groupdict()
+
+        raise FakeTagoIOError(
+            f"Cannot {request.method} {request.path}", 405 if pathFound else 404
+        )
+
+    @staticmethod
+    def _response(
+        request: requests.PreparedRequest, statusCode: int, raw: Any, contentType: str
+    ) -> requests.Response:
+        response = requests.Response()
+        response.status_code = statusCode
+        response.headers = CaseInsensitiveDict({"Content-Type": contentType})
+        response.encoding = "utf-8"
+        response.reason = "OK" if statusCode < 400 else "Error"
+        response.raw = raw
+        response.url = request.url
+        response.request = request
+        return response
+
+    def _openStream(
+        self, request: requests.PreparedRequest, fakeRequest: _FakeRequest
+    ) -> requests.Response:
+        channel = fakeRequest.query.get("channel")
+        token = fakeRequest.query.get("token")
+        if not channel or not token:
+            body = json.dumps(
+                {"status": False, "message": "Missing channel or token"}
+            ).encode()
+            return self._response(request, 400, io.BytesIO(body), "application/json")
+
+        stream = _EventStream()
+        with self._lock:
+            self._subscribers.setdefault(channel, []).append((stream, token))
+        return self._response(request, 200, stream, "text/event-stream")
+
+    # Authentication
+
+    def _accountToken(self, request: _FakeRequest) -> None:
+        if not request.token or request.token in self.tokens:
+            raise FakeTagoIOError("Authorization Denied", 401)
+
+    def _deviceToken(self, request: _FakeRequest) -> dict:
+        token = self.tokens.get(request.token)
+        if token is None:
+            raise FakeTagoIOError("Invalid Device Token", 401)
+        token["last_authorization"] = _now()
+        return self._getDevice(token["device_id"])
+
+    def _getDevice(self, deviceID: str) -> dict:
+        device = self.devices.get(deviceID)
+        if device is None:
+            raise FakeTagoIOError("Device not found", 404)
+        return device
+
+    # Devices
+
+    def _createDevice(self, body: dict) -> dict:
+        if not body.get("name"):
+            raise FakeTagoIOError("Device name is required")
+
+        deviceID = self._newID()
+        now = _now()
+        device = {
+            "active": True,
+            "visible": True,
+            "type": "immutable",
+            "tags": [],
+            "network": None,
+            "connector": None,
+            "payload_decoder": None,
+            "last_input": None,
+            **body,
+            "id": deviceID,
+            "bucket": {"id": deviceID, "name": body["name"]},
+            "created_at": now,
+            "updated_at": now,
+        }
+        self.devices[deviceID] = device
+        self.data[deviceID] = []
+        self.params[deviceID] = []
+        return device
+
+    def _info(self, request: _FakeRequest) -> dict:
+        if request.token in self.analyses:
+            return self.analyses[request.token]
+        if request.token in self.tokens:
+            return self._deviceToken(request)
+        self._accountToken(request)
+        return {"id": "fake_account", "name": "Fake Account"}
+
+    def _listDevices(self, request: _FakeRequest) -> list:
+        self._accountToken(request)
+        devices = _filterItems(list(self.devices.values()), request.query)
+        devices = _paginate(_orderBy(devices, request.query, "name,asc"), request.query)
+        return [
+            _pick(device, _listParam(request.query, "fields")) for device in devices
+        ]
+
+    def _createDeviceRoute(self, request: _FakeRequest) -> dict:
+        self._accountToken(request)
+        device = self._createDevice(request.json or {})
+        token = self._createToken(device["id"], {"name": "Default"})
+        return {
+            "device_id": device["id"],
+            "bucket_id": device["id"],
+            "token": token["token"],
+        }
+
+    def _deviceInfo(self, request: _FakeRequest, device: str) -> dict:
+        self._accountToken(request)
+        return self._getDevice(device)
+
+    def _editDevice(self, request: _FakeRequest, device: str) -> str:
+        self._accountToken(request)
+        self._getDevice(device).update(
+            {**(request.json or {}), "id": device, "updated_at": _now()}
+        )
+        return "Successfully Updated"
+
+    def _deleteDevice(self, request: _FakeRequest, device: str) -> str:
+        self._accountToken(request)
+        self._getDevice(device)
+        del self.devices[device]
+        del self.data[device]
+        del self.params[device]
+        for token in [
+            token
+            for token, tokenData in self.tokens.items()
+            if tokenData["device_id"] == device
+        ]:
+            del self.tokens[token]
+        return "Successfully Removed"
+
+    # Tokens
+
+    def _createToken(self, deviceID: str, body: dict) -> dict:
+        expireTime = body.get("expire_time")
+        token = {
+            "name": body.get("name"),
+            "permission": body.get("permission") or "full",
+            "serie_number": body.get("serie_number"),
+            "verification_code": body.get("verification_code"),
+            "expire_time": None
+            if expireTime in (None, "never")
+            else _parseDate(expireTime),
+            "last_authorization": None,
+            "created_at": _now(),
+            "device_id": deviceID,
+            "token": str(uuid.uuid4()),
+        }
+        self.tokens[token["token"]] = token
+        return token
+
+    def _listTokens(self, request: _FakeRequest, device: str) -> list:
+        self._accountToken(request)
+        self._getDevice(device)
+        tokens = [
+            token for token in self.tokens.values() if token["device_id"] == device
+        ]
+        tokens = _paginate(
+            _orderBy(
+                _filterItems(tokens, request.query), request.query, "created_at,desc"
+            ),
+            request.query,
+        )
+        return [_pick(token, _listParam(request.query, "fields")) for token in tokens]
+
+    def _createTokenRoute(self, request: _FakeRequest) -> dict:
+        self._accountToken(request)
+        body = request.json or {}
+        self._getDevice(body.get("device"))
+        token = self._createToken(body["device"], body)
+        return {
+            "token": token["token"],
+            "expire_date": token["expire_time"],
+            "permission": token["permission"],
+        }
+
+    def _deleteToken(self, request: _FakeRequest, token: str) -> str:
+        self._accountToken(request)
+        if self.tokens.pop(token, None) is None:
+            raise FakeTagoIOError("Token not found", 404)
+        return "Token Successfully Removed"
+
+    # Data
+
+    def _insert(self, device: dict, body: Any) -> str:
+        records = body if isinstance(body, list) else [body]
+        now = _now()
+        group = self._newID()
+        for record in records:
+            if not isinstance(record, dict) or not record.get("variable"):
+                raise FakeTagoIOError("Variable is required")
+
+        for record in records:
+            self.data[device["id"]].append(
+                {
+                    "group": group,
+                    **record,
+                    "id": self._newID(),
+                    "device": device["id"],
+                    "time": _parseDate(record["time"]) if record.get("time") else now,
+                    "created_at": now,
+                }
+            )
+        device["last_input"] = now
+        return f"{len(records)} Data Added"
+
+    def _query(
+        self, deviceID: str, query: dict, defaultQty: int = DEFAULT_DATA_QTY
+    ) -> list[dict]:
+        records = self.data[deviceID]
+
+        variables = _listParam(query, "variables", "variable")
+        groups = _listParam(query, "groups", "group")
+        ids = _listParam(query, "ids")
+        startDate = _parseDate(query["start_date"]) if query.get("start_date") else None
+        endDate = _parseDate(query["end_date"]) if query.get("end_date") else None
+        records = [
+            record
+            for record in records
+            if (variables is None or record["variable"] in variables)
+            and (groups is None or record.get("group") in groups)
+            and (ids is None or record["id"] in ids)
+            and (startDate is None or record["time"] >= startDate)
+            and (endDate is None or record["time"] <= endDate)
+            and ("value" not in query or str(record.get("value")) == query["value"])
+        ]
+
+        queryType = query.get("query") or "default"
+        if queryType != "default":
+            position, _, kind = queryType.partition("_")
+            if kind == "value":
+                records = [
+                    record for record in records if record.get("value") is not None
+                ]
+            elif kind == "location":
+                records = [record for record in records if record.get("location")]
+            sortKey = "created_at" if kind == "insert" else "time"
+            records = sorted(records, key=lambda record: record[sortKey])
+            if not records:
+                return []
+            return [records[-1] if position == "last" else records[0]]
+
+        descending = (query.get("ordination") or "descending") == "descending"
+        records = sorted(records, key=lambda record: record["time"], reverse=descending)
+        skip = int(query.get("skip") or 0)
+        qty = int(query.get("qty") or defaultQty)
+        return records[skip : skip + qty]
+
+    def _edit(self, deviceID: str, body: Any) -> str:
+        records = body if isinstance(body, list) else [body]
+        byID = {record["id"]: record for record in self.data[deviceID]}
+        updated = 0
+        for change in records:
+            record = byID.get(change.get("id"))
+            if record is None:
+                continue
+            record.update(
+                {
+                    key: value
+                    for key, value in change.items()
+                    if key not in ("id", "device", "created_at")
+                }
+            )
+            if "time" in change:
+                record["time"] = _parseDate(change["time"])
+            updated += 1
+        return f"{updated} item(s) updated"
+
+    def _delete(self, deviceID: str, query: dict) -> str:
+        removed = {record["id"] for record in self._query(deviceID, query)}
+        self.data[deviceID] = [
+            record for record in self.data[deviceID] if record["id"] not in removed
+        ]
+        return f"{len(removed)} Data Removed"
+
+    def _deviceInsertData(self, request: _FakeRequest) -> str:
+        return self._insert(self._deviceToken(request), request.json)
+
+    def _deviceGetData(self, request: _FakeRequest) -> list:
+        return self._query(self._deviceToken(request)["id"], request.query)
+
+    def _deviceEditData(self, request: _FakeRequest) -> str:
+        return self._edit(self._deviceToken(request)["id"], request.json)
+
+    def _deviceDeleteData(self, request: _FakeRequest) -> str:
+        return self._delete(self._deviceToken(request)["id"], request.query)
+
+    def _getData(self, request: _FakeRequest, device: str) -> list:
+        self._accountToken(request)
+        return self._query(self._getDevice(device)["id"], request.query)
+
+    def _insertData(self, request: _FakeRequest, device: str) -> str:
+        self._accountToken(request)
+        return self._insert(self._getDevice(device), request.json)
+
+    def _editData(self, request: _FakeRequest, device: str) -> str:
+        self._accountToken(request)
+        return self._edit(self._getDevice(device)["id"], request.json)
+
+    def _deleteData(self, request: _FakeRequest, device: str) -> str:
+        self._accountToken(request)
+        return self._delete(self._getDevice(device)["id"], request.query)
+
+    def _dataAmount(self, request: _FakeRequest, device: str) -> int:
+        self._accountToken(request)
+        return len(self.data[self._getDevice(device)["id"]])
+
+    def _emptyData(self, request: _FakeRequest, device: str) -> str:
+        self._accountToken(request)
+        self.data[self._getDevice(device)["id"]] = []
+        return "All data has been removed"
+
+    # Configuration parameters
+
+    def _filterParams(self, deviceID: str, query: dict) -> list:
+        params = self.params[deviceID]
+        sentStatus = query.get("sent_status")
+        if sentStatus in ("true", "false"):
+            params = [
+                param for param in params if param["sent"] == (sentStatus == "true")
+            ]
+        return params
+
+    def _deviceGetParams(self, request: _FakeRequest) -> list:
+        return self._filterParams(self._deviceToken(request)["id"], request.query)
+
+    def _deviceMarkParamSent(self, request: _FakeRequest, param: str) -> str:
+        device = self._deviceToken(request)
+        for item in self.params[device["id"]]:
+            if item["id"] == param:
+                item["sent"] = True
+                return "Successfully Updated"
+        raise FakeTagoIOError("Parameter not found", 404)
+
+    def _getParams(self, request: _FakeRequest, device: str) -> list:
+        self._accountToken(request)
+        return self._filterParams(self._getDevice(device)["id"], request.query)
+
+    def _setParams(self, request: _FakeRequest, device: str) -> str:
+        self._accountToken(request)
+        params = self.params[self._getDevice(device)["id"]]
+        body = request.json
+        for change in body if isinstance(body, list) else [body]:
+            existing = next(
+                (
+                    param
+                    for param in params
+                    if change.get("id") and param["id"] == change["id"]
+                ),
+                None,
+            )
+            if existing is not None:
+                existing.update(change)
+            else:
+                params.append({"sent": False, **change, "id": self._newID()})
+        return "Successfully Updated"
+
+    def _removeParam(self, request: _FakeRequest, device: str, param: str) -> str:
+        self._accountToken(request)
+        deviceID = self._getDevice(device)["id"]
+        self.params[deviceID] = [
+            item for item in self.params[deviceID] if item["id"] != param
+        ]
+        return "Successfully Removed"
+
+    # Networks and downlinks
+
+    def _networkInfo(self, request: _FakeRequest, network: str) -> dict:
+        self._accountToken(request)
+        if network not in self.networks:
+            raise FakeTagoIOError("Network not found", 404)
+        return _pick(self.networks[network], _listParam(request.query, "fields"))
+
+    def _downlink(self, request: _FakeRequest) -> str:
+        endpoints = {
+            network["middleware_endpoint"] for network in self.networks.values()
+        }
+        if request.host not in endpoints:
+            raise FakeTagoIOError(f"Unknown middleware {request.host}", 404)
+        self.downlinks.append(
+            {"middleware_endpoint": request.host, **(request.json or {})}
+        )
+        return "Downlink accepted"
+
+    def _consoleLog(self, request: _FakeRequest) -> str:
+        self.console.append((request.json or {}).get("message"))
+        return "Console sent"
+
+    # Files
+
+    def _storeFile(self, filename: str, content: bytes, public: bool = False) -> str:
+        filename = "/" + filename.lstrip("/")
+        self.files[filename] = {
+            "content": content,
+            "public": public,
+            "last_modified": _now(),
+        }
+        return f"https://api.tago.io/file/fake_account{filename}"
+
+    def _listFiles(self, request: _FakeRequest) -> dict:
+        self._accountToken(request)
+        folder = "/" + request.query.get("path", "/").strip("/")
+        prefix = folder.rstrip("/") + "/"
+        files = []
+        folders = set()
+        for filename, file in sorted(self.files.items()):
+            if not filename.startswith(prefix):
+                continue
+            name, _, rest = filename[len(prefix) :].partition("/")
+            if rest:
+                folders.add(name)
+            else:
+                files.append(
+                    {
+                        "filename": filename,
+                        "size": len(file["content"]),
+                        "last_modified": file["last_modified"],
+                    }
+                )
+
+        qty = int(request.query.get("qty") or 300)
+        offset = int(request.query.get("pagination_token") or 0)
+        result = {
+            "total": len(files),
+            "usage": sum(len(file["content"]) for file in self.files.values()),
+            "files": files[offset : offset + qty],
+            "folders": sorted(folders) if offset == 0 else [],
+        }
+        if offset + qty < len(files):
+            result["pagination_token"] = str(offset + qty)
+        return result
+
+    def _uploadFiles(self, request: _FakeRequest) -> Any:
+        self._accountToken(request)
+        if request.headers.get("Content-Type", "").startswith("multipart/form-data"):
+            form = request.form
+            upload = self._uploads.get(form.get("upload_id"))
+            if upload is None:
+                raise FakeTagoIOError("Upload not found", 404)
+            upload["parts"][int(form["part"])] = form["file"]
+            return {"ETag": f'"{uuid.uuid4().hex}"'}
+
+        body = request.json
+        if isinstance(body, list):
+            for file in body:
+                self._storeFile(
+                    file["filename"],
+                    base64.b64decode(file["file"]),
+                    bool(file.get("public")),
+                )
+            return f"{len(body)} file(s) uploaded"
+
+        action = body.get("multipart_action")
+        if action == "start":
+            uploadID = self._newID()
+            self._uploads[uploadID] = {
+                "filename": body["filename"],
+                "public": bool(body.get("public")),
+                "parts": {},
+            }
+            return uploadID
+        if action == "end":
+            upload = self._uploads.pop(body["upload_id"], None)
+            if upload is None:
+                raise FakeTagoIOError("Upload not found", 404)
+            numbers = [part["PartNumber"] for part in body["parts"]]
+            if sorted(numbers) != sorted(upload["parts"]):
+                raise FakeTagoIOError("Parts do not match the uploaded ones")
+            content = b"".join(upload["parts"][number] for number in sorted(numbers))
+            return {
+                "file": self._storeFile(upload["filename"], content, upload["public"])
+            }
+
+        raise FakeTagoIOError("Invalid multipart_action")
+
+    def _moveFiles(self, request: _FakeRequest) -> str:
+        self._accountToken(request)
+        for move in request.json or []:
+            source = "/" + move["from"].lstrip("/")
+            if source not in self.files:
+                raise FakeTagoIOError(f"File {move['from']} not found", 404)
+            self.files["/" + move["to"].lstrip("/")] = self.files.pop(source)
+        return "Successfully Updated"
+
+    def _deleteFiles(self, request: _FakeRequest) -> str:
+        self._accountToken(request)
+        for filename in request.json or []:
+            self.files.pop("/" + filename.lstrip("/"), None)
+        return "Successfully Removed"
+
+
+class FakeTagoIOAdapter(BaseAdapter):
+    """
+    Transport adapter answering the requests of a `requests.Session` from a `FakeTagoIO` backend.
+    """
+
+    def __init__(self, backend: FakeTagoIO) -> None:
+        super().__init__()
+        self.backend = backend
+
+    def send(
+        self, request: requests.PreparedRequest, stream: bool = False, **kwargs
+    ) -> requests.Response:
+        response = self.backend.handle(request)
+        response.connection = self
+        return response
+
+    def close(self) -> None:
+        pass
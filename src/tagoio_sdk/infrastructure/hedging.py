@@ -0,0 +1,295 @@
+import contextvars
+import threading
+import time
+
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED
+from concurrent.futures import Future
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import wait
+from typing import Callable
+from typing import Hashable
+from typing import Optional
+
+import requests
+
+from tagoio_sdk import config
+from tagoio_sdk.infrastructure.rate_limiter import RateLimiter
+from tagoio_sdk.infrastructure.rate_limiter import isThrottled
+
+
+class LatencyTracker(object):
+    """
+    Recent latencies of each endpoint, to know how long a normal request takes.
+
+    :param int window: Latencies kept per endpoint, older ones are forgotten
+    """
+
+    def __init__(self, window: int = 200) -> None:
+        self.window = window
+        self._samples: dict[Hashable, deque] = {}
+        self._lock = threading.Lock()
+
+    def record(self, key: Hashable, seconds: float) -> None:
+        with self._lock:
+            samples = self._samples.get(key)
+            if samples is None:
+                samples = self._samples[key] = deque(maxlen=self.window)
+            samples.append(seconds)
+
+    def percentile(
+        self, key: Hashable, percent: float, minSamples: int = 1
+    ) -> Optional[float]:
+        """
+        Latency under which `percent`% of the recent requests finished, None
+        when there are less than `minSamples` of them.
+        """
+        with self._lock:
+            samples = sorted(self._samples.get(key, ()))
+
+        if not samples or len(samples) < minSamples:
+            return None
+        index = min(int(percent / 100 * len(samples)), len(samples) - 1)
+        return samples[index]
+
+
+class HedgeBudget(object):
+    """
+    Cap the extra requests sent by hedging to a ratio of the requests sent.
+
+    Every request earns `ratio` of a hedge, up to `burst` saved hedges.
+    """
+
+    def __init__(self, ratio: float, burst: float) -> None:
+        self.ratio = ratio
+        self.burst = burst
+        self.tokens = burst
+        self.spent = 0
+        """Hedges sent so far"""
+        self._lock = threading.Lock()
+
+    def onRequest(self) -> None:
+        with self._lock:
+            self.tokens = min(self.burst, self.tokens + self.ratio)
+
+    def available(self) -> bool:
+        with self._lock:
+            return self.tokens >= 1
+
+    def tryAcquire(self) -> bool:
+        with self._lock:
+            if self.tokens < 1:
+                return False
+            self.tokens -= 1
+            self.spent += 1
+            return True
+
+    def refund(self) -> None:
+        """
+        Give back a hedge acquired but not sent.
+        """
+        with self._lock:
+            self.tokens = min(self.burst, self.tokens + 1)
+            self.spent -= 1
+
+
+def _discard(future: Future) -> None:
+    if not future.cancelled() and future.exception() is None:
+        result = future.result()
+        if isinstance(result, requests.Response):
+            result.close()
+
+
+def _failed(future: Future) -> bool:
+    if future.exception() is not None:
+        return True
+    result = future.result()
+    return isinstance(result, requests.Response) and result.status_code >= 500
+
+
+def _limited(
+    func: Callable[[], requests.Response], limiter: RateLimiter
+) -> Callable[[], requests.Response]:
+    """
+    Wrap a request holding a slot of `limiter`, so it's released with its outcome.
+    """
+
+    def request() -> requests.Response:
+        throttled = False
+        try:
+            response = func()
+            throttled = isThrottled(response.status_code)
+            return response
+        finally:
+            limiter.release(throttled)
+
+    return request
+
+
+class Hedger(object):
+    """
+    Send a second, identical request when the first one is slower than usual,
+    and keep whichever answers first.
+
+    A request is hedged once it's been running for longer than the `percentile`
+    latency of its endpoint. Until `minSamples` latencies are known, nothing is
+    hedged. The response of the losing request is closed as soon as it arrives,
+    so its connection goes back to the pool, and a hedge still waiting for a
+    worker is cancelled.
+
+    A request that may be hedged runs on one of `maxPrimaries` threads, so the
+    caller can return as soon as the hedge wins. When they are all busy, the
+    request runs on the calling thread without hedging, so the requests in
+    flight are never capped by the hedger.
+
+    Only use it for idempotent requests.
+
+    :param float percentile: Latency percentile after which a request is hedged
+    :param float minDelay: Min seconds to wait before hedging
+    :param float budget: Max extra requests, as a ratio of the requests sent
+    :param float burst: Hedges that can be sent at once after a quiet period
+    :param int minSamples: Latencies needed before an endpoint is hedged
+    :param int maxWorkers: Threads running the hedges
+    :param int maxPrimaries: Threads running the requests that may be hedged
+    """
+
+    def __init__(
+        self,
+        percentile: float = 95,
+        minDelay: float = 0.01,
+        budget: float = 0.05,
+        burst: float = 10,
+        minSamples: int = 20,
+        maxWorkers: int = 32,
+        maxPrimaries: int = 64,
+    ) -> None:
+        self.percentile = percentile
+        self.minDelay = minDelay
+        self.minSamples = minSamples
+        self.latencies = LatencyTracker()
+        self.budget = HedgeBudget(budget, burst)
+        self._executor = ThreadPoolExecutor(
+            max_workers=maxWorkers, thread_name_prefix="tagoio-hedge"
+        )
+        self._primaries = ThreadPoolExecutor(
+            max_workers=maxPrimaries, thread_name_prefix="tagoio-request"
+        )
+        self._primarySlots = threading.BoundedSemaphore(maxPrimaries)
+
+    def threshold(self, key: Hashable) -> Optional[float]:
+        """
+        Seconds after which a request to the endpoint is hedged, None when it's unknown.
+        """
+        latency = self.latencies.percentile(key, self.percentile, self.minSamples)
+        if latency is None:
+            return None
+        return max(latency, self.minDelay)
+
+    def run(
+        self,
+        key: Hashable,
+        func: Callable[[], requests.Response],
+        hedge: bool = True,
+        limiter: Optional[RateLimiter] = None,
+    ) -> tuple[requests.Response, bool]:
+        """
+        Call `func`, hedging it if it takes too long.
+
+        With `hedge` False, or when no hedge could be sent anyway, `func` runs
+        on the calling thread and is only timed, so the latencies stay known for
+        the calls that do hedge. The hedge takes its own slot of `limiter`, and
+        isn't sent when none is free right away.
+
+        Returns the response of the first request that succeeded, or of the last
+        one to fail, and whether a hedge was sent.
+        """
+        self.budget.onRequest()
+        threshold = self.threshold(key) if hedge else None
+        if (
+            threshold is None
+            or not self.budget.available()
+            or not self._primarySlots.acquire(blocking=False)
+        ):
+            return self._timed(key, func, time.monotonic()), False
+
+        primary = self._primaries.submit(
+            contextvars.copy_context().run, self._timed, key, func, time.monotonic()
+        )
+        primary.add_done_callback(lambda _: self._primarySlots.release())
+        done, _ = wait([primary], timeout=threshold)
+        if done or not self.budget.tryAcquire():
+            return primary.result(), False
+        if limiter is not None and not limiter.acquire(0):
+            self.budget.refund()
+            return primary.result(), False
+
+        hedgeFunc = func if limiter is None else _limited(func, limiter)
+        backup = self._executor.submit(
+            contextvars.copy_context().run,
+            self._timed,
+            key,
+            hedgeFunc,
+            time.monotonic(),
+        )
+        pending = {primary, backup}
+        finished = []
+        winner = None
+        while pending and winner is None:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            finished.extend(done)
+            winner = next((future for future in done if not _failed(future)), None)
+        if winner is None:
+            winner = finished[-1]
+
+        for loser in [*finished, *pending]:
+            if loser is not winner and not loser.cancel():
+                loser.add_done_callback(_discard)
+
+        return winner.result(), True
+
+    def _timed(
+        self, key: Hashable, func: Callable[[], requests.Response], start: float
+    ) -> requests.Response:
+        """
+        Call `func` and record its latency since `start`, which includes the
+        time spent waiting for a worker.
+        """
+        response = func()
+        self.latencies.record(key, time.monotonic() - start)
+        return response
+
+
+_hedger: Optional[Hedger] = None
+_hedgerLock = threading.Lock()
+
+
+def getHedger() -> Optional[Hedger]:
+    """
+    Get the hedger shared by the GET requests, built from the "hedging" config.
+    """
+    global _hedger
+
+    hedgingConfig = config.tagoSDKconfig["hedging"]
+    with _hedgerLock:
+        if _hedger is None:
+            _hedger = Hedger(
+                percentile=hedgingConfig["percentile"],
+                minDelay=hedgingConfig["minDelay"],
+                budget=hedgingConfig["budget"],
+                burst=hedgingConfig["burst"],
+                minSamples=hedgingConfig["minSamples"],
+                maxPrimaries=hedgingConfig["maxPrimaries"],
+            )
+
+    return _hedger
+
+
+def resetHedger() -> None:
+    """
+    Drop the hedger, so the next requests start from the configured values
+    without known latencies.
+    """
+    global _hedger
+
+    with _hedgerLock:
+        _hedger = None
@@ -0,0 +1,207 @@
+import os
+import ssl
+import threading
+
+from typing import Hashable
+from typing import Iterator
+from typing import Optional
+from typing import Union
+
+import certifi
+import requests
+
+from requests.adapters import BaseAdapter
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+from requests.utils import select_proxy
+from urllib3.exceptions import MaxRetryError
+from urllib3.exceptions import NewConnectionError
+
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+HOP_BY_HOP_HEADERS = {
+    "connection",
+    "keep-alive",
+    "proxy-connection",
+    "transfer-encoding",
+    "upgrade",
+}
+"""Headers forbidden on HTTP/2, the connection is managed by httpx"""
+
+UPLOAD_CHUNK_SIZE = 64 * 1024
+
+
+class _HTTPXBody(object):
+    """
+    File-like view of a httpx response body, used as `requests.Response.raw`.
+
+    httpx already decodes gzip/deflate, so `requests` reads the body as is.
+    """
+
+    def __init__(self, response: "httpx.Response") -> None:
+        self._response = response
+        self._chunks = response.iter_bytes()
+        self._buffer = b""
+
+    def read(self, amt: Optional[int] = None, **kwargs) -> bytes:
+        while amt is None or len(self._buffer) < amt:
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                break
+            self._buffer += chunk
+
+        if amt is None:
+            data, self._buffer = self._buffer, b""
+        else:
+            data, self._buffer = self._buffer[:amt], self._buffer[amt:]
+        return data
+
+    def close(self) -> None:
+        self._response.close()
+
+
+def _httpxTimeout(timeout: Union[None, float, tuple]) -> "httpx.Timeout":
+    if isinstance(timeout, tuple):
+        connect, read = timeout
+        return httpx.Timeout(read, connect=connect)
+    return httpx.Timeout(timeout)
+
+
+def _requestContent(body: Union[None, bytes, str, Iterator[bytes]]):
+    if hasattr(body, "read"):
+        # Multipart encoders and open files are sent in chunks
+        return iter(lambda: body.read(UPLOAD_CHUNK_SIZE), b"")
+    return body
+
+
+def _sslContext(
+    verify: Union[bool, str], cert: Union[None, str, tuple]
+) -> ssl.SSLContext:
+    """
+    SSL context matching the `verify` and `cert` settings of `requests`.
+    """
+    if verify is False:
+        context = ssl.create_default_context()
+        context.check_hostname = False
+        context.verify_mode = ssl.CERT_NONE
+    elif isinstance(verify, str) and os.path.isdir(verify):
+        context = ssl.create_default_context(capath=verify)
+    else:
+        context = ssl.create_default_context(
+            cafile=verify if isinstance(verify, str) else certifi.where()
+        )
+
+    if cert:
+        certFile, keyFile = cert if isinstance(cert, tuple) else (cert, None)
+        context.load_cert_chain(certFile, keyFile)
+
+    return context
+
+
+class HTTP2Adapter(BaseAdapter):
+    """
+    Transport adapter sending the requests of a `requests.Session` through httpx over HTTP/2.
+
+    Concurrent requests to the same host are multiplexed over a few connections with
+    compressed headers, instead of one connection per in-flight request. Servers
+    without HTTP/2 are still reached over HTTP/1.1.
+
+    The `verify`, `cert` and proxy settings of the session (and the environment,
+    such as `REQUESTS_CA_BUNDLE` or `HTTPS_PROXY`) are applied as `requests` would,
+    with one httpx client per combination of them.
+
+    Needs the `http2` extra: `pip install tagoio-sdk[http2]`.
+
+    :param int maxConnections: Max connections kept open per client
+    """
+
+    def __init__(self, maxConnections: int = 10) -> None:
+        if httpx is None:
+            raise ImportError(
+                "The HTTP/2 transport needs httpx, install it with `pip install tagoio-sdk[http2]`"
+            )
+
+        super().__init__()
+        self.maxConnections = maxConnections
+        self._clients: dict[Hashable, "httpx.Client"] = {}
+        self._lock = threading.Lock()
+
+    def _getClient(
+        self,
+        verify: Union[bool, str],
+        cert: Union[None, str, tuple],
+        proxy: Optional[str],
+    ) -> "httpx.Client":
+        key = (verify, cert, proxy)
+        with self._lock:
+            client = self._clients.get(key)
+            if client is None:
+                client = self._clients[key] = httpx.Client(
+                    http2=True,
+                    verify=_sslContext(verify, cert),
+                    proxy=proxy,
+                    # requests already resolved the settings of the environment
+                    trust_env=False,
+                    limits=httpx.Limits(
+                        max_connections=self.maxConnections,
+                        max_keepalive_connections=self.maxConnections,
+                    ),
+                )
+        return client
+
+    def send(
+        self,
+        request: requests.PreparedRequest,
+        stream: bool = False,
+        timeout: Union[None, float, tuple] = None,
+        verify: Union[bool, str] = True,
+        cert=None,
+        proxies=None,
+    ) -> requests.Response:
+        client = self._getClient(verify, cert, select_proxy(request.url, proxies or {}))
+        headers = [
+            (key, value)
+            for key, value in request.headers.items()
+            if key.lower() not in HOP_BY_HOP_HEADERS
+        ]
+        httpxRequest = client.build_request(
+            request.method,
+            request.url,
+            headers=headers,
+            content=_requestContent(request.body),
+            timeout=_httpxTimeout(timeout),
+        )
+
+        try:
+            httpxResponse = client.send(httpxRequest, stream=True)
+        except httpx.ConnectTimeout as e:
+            raise requests.exceptions.ConnectTimeout(e, request=request) from e
+        except httpx.TimeoutException as e:
+            raise requests.exceptions.ReadTimeout(e, request=request) from e
+        except httpx.ConnectError as e:
+            reason = MaxRetryError(None, request.url, NewConnectionError(None, str(e)))
+            raise requests.exceptions.ConnectionError(reason, request=request) from e
+        except httpx.TransportError as e:
+            raise requests.exceptions.ConnectionError(e, request=request) from e
+
+        response = requests.Response()
+        response.status_code = httpxResponse.status_code
+        response.headers = CaseInsensitiveDict(httpxResponse.headers.multi_items())
+        response.encoding = get_encoding_from_headers(response.headers)
+        response.reason = httpxResponse.reason_phrase
+        response.raw = _HTTPXBody(httpxResponse)
+        response.url = request.url
+        response.request = request
+        response.connection = self
+
+        return response
+
+    def close(self) -> None:
+        with self._lock:
+            clients, self._clients = list(self._clients.values()), {}
+        for client in clients:
+            client.close()
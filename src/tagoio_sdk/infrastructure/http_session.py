@@ -0,0 +1,93 @@
+import threading
+
+from collections import OrderedDict
+from typing import Callable
+from typing import Optional
+from typing import Union
+
+import requests
+
+from requests.adapters import BaseAdapter
+from requests.adapters import HTTPAdapter
+
+from tagoio_sdk import config
+from tagoio_sdk.infrastructure.http2_adapter import HTTP2Adapter
+
+
+_sessions: "OrderedDict[tuple[str, Optional[str]], requests.Session]" = OrderedDict()
+_sessionsLock = threading.Lock()
+
+
+def _createSession() -> requests.Session:
+    poolConfig = config.tagoSDKconfig["connectionPool"]
+    transport = config.tagoSDKconfig["transport"]
+    if callable(transport):
+        adapter = transport()
+    elif transport == "http2":
+        adapter = HTTP2Adapter(maxConnections=poolConfig["poolMaxsize"])
+    else:
+        adapter = HTTPAdapter(
+            pool_connections=poolConfig["poolConnections"],
+            pool_maxsize=poolConfig["poolMaxsize"],
+            pool_block=poolConfig["poolBlock"],
+        )
+
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+
+    return session
+
+
+def getSession(url: str, token: Optional[str] = None) -> requests.Session:
+    """
+    Get the keep-alive session shared by every request to the same API URL and token.
+
+    Sessions are created on first use and the least recently used one is closed
+    once more than `connectionPool.maxSessions` are alive.
+
+    Args:
+        url: Base URL of the TagoIO API (region)
+        token: Token used on the requests, if any
+
+    Returns:
+        A pooled `requests.Session`
+    """
+    key = (url, token)
+
+    with _sessionsLock:
+        session = _sessions.get(key)
+        if session is not None:
+            _sessions.move_to_end(key)
+            return session
+
+        session = _createSession()
+        _sessions[key] = session
+
+        while len(_sessions) > config.tagoSDKconfig["connectionPool"]["maxSessions"]:
+            _, oldSession = _sessions.popitem(last=False)
+            oldSession.close()
+
+    return session
+
+
+def closeSessions() -> None:
+    """
+    Close every pooled session and its open connections.
+    """
+    with _sessionsLock:
+        for session in _sessions.values():
+            session.close()
+        _sessions.clear()
+
+
+def setTransport(transport: Union[str, Callable[[], BaseAdapter]]) -> None:
+    """
+    Select how every request is sent, closing the current sessions.
+
+    Args:
+        transport: "http1" (urllib3), "http2" (httpx) or a factory of
+            `requests` transport adapters, called once per session
+    """
+    config.tagoSDKconfig["transport"] = transport
+    closeSessions()
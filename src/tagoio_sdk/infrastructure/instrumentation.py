@@ -0,0 +1,371 @@
+import re
+import threading
+import time
+import warnings
+
+from typing import Callable
+from typing import Optional
+
+import requests
+
+from tagoio_sdk import config
+from tagoio_sdk.infrastructure.tracing import currentSpan
+
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60)
+"""Upper bounds in seconds of the latency histogram buckets"""
+
+_idSegment = re.compile(
+    r"^(?:[0-9a-fA-F]{24}|[0-9a-fA-F]{8}(?:-?[0-9a-fA-F]{4}){3}-?[0-9a-fA-F]{12}|\d+)$"
+)
+
+
+def endpointName(path: str) -> str:
+    """
+    Template a request path, replacing IDs and tokens by `{id}`, so every device
+    shares the same endpoint: `/device/63f50a69fd802b000ac1aa76/data` -> `/device/{id}/data`.
+    """
+    return "/".join(
+        "{id}" if _idSegment.match(segment) else segment for segment in path.split("/")
+    )
+
+
+class RequestInfo(object):
+    """
+    Details of one SDK call, filled in while it runs and passed to the request hooks.
+
+    A call is counted once, no matter how many attempts it took.
+    """
+
+    def __init__(
+        self, method: str, url: str, path: str, bytesSent: int = 0, stream: bool = False
+    ) -> None:
+        self.method = method.upper()
+        self.url = url
+        self.path = path
+        self.endpoint = endpointName(path)
+        self.stream = stream
+        self.startTime = time.monotonic()
+        self.duration: Optional[float] = None
+        """Seconds from the first attempt until the response was handled (or fully streamed)"""
+        self.attempts = 0
+        self.statusCode: Optional[int] = None
+        self.bytesSent = bytesSent
+        """Size of the request body, after compression"""
+        self.bytesReceived = 0
+        """Size of the response body, as sent by the server when it has a Content-Length"""
+        self.cacheHit = False
+        self.hedged = False
+        """A second request was sent because the first one was slow"""
+        self.error: Optional[Exception] = None
+
+    @property
+    def retries(self) -> int:
+        return max(self.attempts - 1, 0)
+
+    @property
+    def errorClass(self) -> Optional[str]:
+        """
+        Category of the error: "connection", "timeout", "throttled", "client_error",
+        "server_error" or the exception class name. None when the call succeeded.
+        """
+        if self.error is None:
+            return None
+
+        if isinstance(self.error, requests.exceptions.Timeout):
+            return "timeout"
+        if isinstance(self.error, requests.exceptions.ConnectionError):
+            return "connection"
+        if self.statusCode == 429:
+            return "throttled"
+        if self.statusCode is not None and self.statusCode >= 500:
+            return "server_error"
+        if self.statusCode is not None and self.statusCode >= 400:
+            return "client_error"
+        return type(self.error).__name__
+
+    def __repr__(self) -> str:
+        return f"<RequestInfo {self.method} {self.endpoint} {self.statusCode}>"
+
+
+RequestHook = Callable[[RequestInfo], None]
+
+_beforeHooks: list[RequestHook] = []
+_afterHooks: list[RequestHook] = []
+_hooksLock = threading.Lock()
+
+
+def addRequestHook(
+    before: Optional[RequestHook] = None, after: Optional[RequestHook] = None
+) -> Callable[[], None]:
+    """
+    Call functions around every request sent by the SDK.
+
+    `before` gets the RequestInfo before the first attempt, `after` once the call
+    succeeded or failed, with its duration, status, sizes, retries and error.
+    Exceptions raised by hooks are turned into warnings.
+
+    Args:
+        before: Called before the request is sent
+        after: Called after the request ends
+
+    Returns:
+        A function removing the hooks
+
+    Example:
+        ```python
+        def logSlowCalls(info):
+            if info.duration > 1:
+                print(f"{info.method} {info.endpoint} took {info.duration:.1f}s")
+
+        removeHook = addRequestHook(after=logSlowCalls)
+        ```
+    """
+    with _hooksLock:
+        if before is not None:
+            _beforeHooks.append(before)
+        if after is not None:
+            _afterHooks.append(after)
+
+    def removeHooks() -> None:
+        with _hooksLock:
+            if before in _beforeHooks:
+                _beforeHooks.remove(before)
+            if after in _afterHooks:
+                _afterHooks.remove(after)
+
+    return removeHooks
+
+
+def _callHooks(hooks: list[RequestHook], info: RequestInfo) -> None:
+    for hook in list(hooks):
+        try:
+            hook(info)
+        except Exception as e:
+            warnings.warn(f"Request hook {hook!r} failed: {e!r}", stacklevel=3)
+
+
+def beforeRequest(info: RequestInfo) -> None:
+    _callHooks(_beforeHooks, info)
+
+
+def afterRequest(info: RequestInfo) -> None:
+    info.duration = time.monotonic() - info.startTime
+    if config.tagoSDKconfig["metrics"]["enabled"]:
+        requestMetrics.record(info)
+
+    current = currentSpan()
+    if current.is_recording():
+        current.set_attributes(
+            {
+                "http.response.status_code": info.statusCode or 0,
+                "tagoio.attempts": info.attempts,
+                "tagoio.cache_hit": info.cacheHit,
+                "tagoio.hedged": info.hedged,
+                "tagoio.bytes_sent": info.bytesSent,
+                "tagoio.bytes_received": info.bytesReceived,
+            }
+        )
+        if info.error is not None:
+            current.set_attribute("error.type", info.errorClass)
+
+    _callHooks(_afterHooks, info)
+
+
+class _EndpointMetrics(object):
+    def __init__(self, buckets: tuple) -> None:
+        self.requests = 0
+        self.errors: dict[str, int] = {}
+        self.retries = 0
+        self.bytesSent = 0
+        self.bytesReceived = 0
+        self.cacheHits = 0
+        self.hedges = 0
+        self.latencyBuckets = [0] * len(buckets)
+        self.latencySum = 0.0
+
+
+class RequestMetrics(object):
+    """
+    Per-endpoint request metrics: latency histogram, retries, hedges, bytes sent
+    and received, cache hits and errors by class.
+
+    Cache hits are only counted as such, they don't take part in the latency.
+
+    :param tuple buckets: Upper bounds in seconds of the latency buckets
+    """
+
+    def __init__(self, buckets: tuple = LATENCY_BUCKETS) -> None:
+        self.buckets = tuple(sorted(buckets))
+        self._endpoints: dict[tuple[str, str], _EndpointMetrics] = {}
+        self._lock = threading.Lock()
+
+    def record(self, info: RequestInfo) -> None:
+        key = (info.method, info.endpoint)
+        with self._lock:
+            metrics = self._endpoints.get(key)
+            if metrics is None:
+                metrics = self._endpoints[key] = _EndpointMetrics(self.buckets)
+
+            if info.cacheHit:
+                metrics.cacheHits += 1
+                return
+
+            metrics.requests += 1
+            metrics.retries += info.retries
+            metrics.hedges += int(info.hedged)
+            metrics.bytesSent += info.bytesSent
+            metrics.bytesReceived += info.bytesReceived
+            metrics.latencySum += info.duration
+            for index, bound in enumerate(self.buckets):
+                if info.duration <= bound:
+                    metrics.latencyBuckets[index] += 1
+                    break
+
+            errorClass = info.errorClass
+            if errorClass is not None:
+                metrics.errors[errorClass] = metrics.errors.get(errorClass, 0) + 1
+
+    def reset(self) -> None:
+        with self._lock:
+            self._endpoints.clear()
+
+    def snapshot(self) -> dict[str, dict]:
+        """
+        Metrics as a plain dict keyed by "METHOD /endpoint". Latency buckets are
+        cumulative, like Prometheus ones.
+        """
+        with self._lock:
+            endpoints = {
+                key: _copyMetrics(metrics) for key, metrics in self._endpoints.items()
+            }
+
+        result = {}
+        for (method, endpoint), metrics in sorted(endpoints.items()):
+            cumulative = 0
+            buckets = {}
+            for bound, count in zip(self.buckets, metrics.latencyBuckets, strict=True):
+                cumulative += count
+                buckets[f"{bound:g}"] = cumulative
+            buckets["+Inf"] = metrics.requests
+
+            result[f"{method} {endpoint}"] = {
+                "requests": metrics.requests,
+                "errors": metrics.errors,
+                "retries": metrics.retries,
+                "bytes_sent": metrics.bytesSent,
+                "bytes_received": metrics.bytesReceived,
+                "cache_hits": metrics.cacheHits,
+                "hedges": metrics.hedges,
+                "latency": {
+                    "count": metrics.requests,
+                    "sum": metrics.latencySum,
+                    "buckets": buckets,
+                },
+            }
+
+        return result
+
+    def toPrometheus(self, prefix: str = "tagoio_sdk") -> str:
+        """
+        Metrics in the Prometheus text exposition format.
+        """
+        snapshot = self.snapshot()
+        counters = [
+            ("requests_total", "requests", "Requests sent, retries excluded"),
+            ("request_retries_total", "retries", "Extra attempts of failed requests"),
+            ("request_bytes_sent_total", "bytes_sent", "Bytes of request bodies"),
+            (
+                "request_bytes_received_total",
+                "bytes_received",
+                "Bytes of response bodies",
+            ),
+            (
+                "cache_hits_total",
+                "cache_hits",
+                "Requests served from the response cache",
+            ),
+            (
+                "request_hedges_total",
+                "hedges",
+                "Requests sent twice because the first try was slow",
+            ),
+        ]
+
+        lines = []
+        for name, field, description in counters:
+            lines.append(f"# HELP {prefix}_{name} {description}")
+            lines.append(f"# TYPE {prefix}_{name} counter")
+            for key, metrics in snapshot.items():
+                lines.append(f"{prefix}_{name}{{{_labels(key)}}} {metrics[field]}")
+
+        lines.append(
+            f"# HELP {prefix}_request_errors_total Failed requests by error class"
+        )
+        lines.append(f"# TYPE {prefix}_request_errors_total counter")
+        for key, metrics in snapshot.items():
+            for errorClass, count in sorted(metrics["errors"].items()):
+                lines.append(
+                    f'{prefix}_request_errors_total{{{_labels(key)},error_class="{errorClass}"}} {count}'
+                )
+
+        lines.append(
+            f"# HELP {prefix}_request_duration_seconds Request latency, retries included"
+        )
+        lines.append(f"# TYPE {prefix}_request_duration_seconds histogram")
+        for key, metrics in snapshot.items():
+            latency = metrics["latency"]
+            for bound, count in latency["buckets"].items():
+                lines.append(
+                    f'{prefix}_request_duration_seconds_bucket{{{_labels(key)},le="{bound}"}} {count}'
+                )
+            lines.append(
+                f"{prefix}_request_duration_seconds_sum{{{_labels(key)}}} {latency['sum']}"
+            )
+            lines.append(
+                f"{prefix}_request_duration_seconds_count{{{_labels(key)}}} {latency['count']}"
+            )
+
+        return "\n".join(lines) + "\n"
+
+
+def _copyMetrics(metrics: _EndpointMetrics) -> _EndpointMetrics:
+    copied = _EndpointMetrics(())
+    copied.__dict__.update(metrics.__dict__)
+    copied.errors = dict(metrics.errors)
+    copied.latencyBuckets = list(metrics.latencyBuckets)
+    return copied
+
+
+def _labels(key: str) -> str:
+    method, endpoint = key.split(" ", 1)
+    endpoint = endpoint.replace("\\", "\\\\").replace('"', '\\"')
+    return f'method="{method}",endpoint="{endpoint}"'
+
+
+requestMetrics = RequestMetrics()
+
+
+def getMetrics() -> dict[str, dict]:
+    """
+    Snapshot of the request metrics collected since start or the last reset.
+
+    Example:
+        ```python
+        def my_analysis(context, scope):
+            ...
+            context.log(getMetrics())
+        ```
+    """
+    return requestMetrics.snapshot()
+
+
+def exportPrometheus() -> str:
+    """
+    Request metrics in the Prometheus text format, ready to be pushed or served.
+    """
+    return requestMetrics.toPrometheus()
+
+
+def resetMetrics() -> None:
+    requestMetrics.reset()
@@ -0,0 +1,107 @@
+import datetime
+import json
+
+from typing import Any
+from typing import Callable
+from typing import Union
+
+from tagoio_sdk import config
+
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ujson
+except ImportError:
+    ujson = None
+
+
+def _default(obj: Any) -> Any:
+    if isinstance(obj, (datetime.datetime, datetime.date, datetime.time)):
+        return obj.isoformat()
+    return str(obj)
+
+
+class JSONCodec(object):
+    """
+    Encoder and decoder of request and response bodies.
+
+    Dates are encoded as ISO-8601 and other unknown objects through `str()`.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        dumps: Callable[[Any], bytes],
+        loads: Callable[[Union[bytes, str]], Any],
+    ) -> None:
+        self.name = name
+        self._dumps = dumps
+        self.loads = loads
+
+    def dumps(self, obj: Any) -> bytes:
+        try:
+            return self._dumps(obj)
+        except (TypeError, OverflowError):
+            # orjson and ujson reject a few inputs the stdlib accepts, such as big integers
+            return _stdlibDumps(obj)
+
+    def __repr__(self) -> str:
+        return f"<JSONCodec {self.name}>"
+
+
+def _stdlibDumps(obj: Any) -> bytes:
+    return json.dumps(obj, default=_default, separators=(",", ":")).encode()
+
+
+def _orjsonDumps(obj: Any) -> bytes:
+    return orjson.dumps(obj, default=_default, option=orjson.OPT_NON_STR_KEYS)
+
+
+def _ujsonDumps(obj: Any) -> bytes:
+    return ujson.dumps(obj, default=_default, ensure_ascii=False).encode()
+
+
+_codecs: dict[str, JSONCodec] = {"json": JSONCodec("json", _stdlibDumps, json.loads)}
+if orjson is not None:
+    _codecs["orjson"] = JSONCodec("orjson", _orjsonDumps, orjson.loads)
+if ujson is not None:
+    _codecs["ujson"] = JSONCodec("ujson", _ujsonDumps, ujson.loads)
+
+
+def getJSONCodec() -> JSONCodec:
+    """
+    Get the codec selected by `tagoSDKconfig["jsonCodec"]`.
+
+    "auto" picks orjson, then ujson, when installed and falls back to the stdlib.
+    """
+    name = config.tagoSDKconfig["jsonCodec"]
+
+    if name == "auto":
+        return _codecs.get("orjson") or _codecs.get("ujson") or _codecs["json"]
+
+    if name not in _codecs:
+        raise ValueError(
+            f"JSON codec {name} is not available, install it or use one of {list(_codecs)}"
+        )
+
+    return _codecs[name]
+
+
+def dumps(obj: Any) -> bytes:
+    """
+    Serialize an object with the configured codec.
+
+    The result can be passed as a request body, it's sent as is.
+    """
+    return getJSONCodec().dumps(obj)
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    """
+    Parse JSON with the configured codec.
+    """
+    return getJSONCodec().loads(data)
@@ -0,0 +1,135 @@
+import codecs
+import json
+
+from typing import Any
+from typing import Iterable
+from typing import Iterator
+from typing import Sequence
+
+
+STREAM_CHUNK_SIZE = 64 * 1024
+"""Bytes read from the socket at a time when streaming responses"""
+
+_WHITESPACE = " \t\r\n"
+
+
+class JSONResultStream(object):
+    """
+    Iterate the items of an array inside a JSON document while the document is read.
+
+    Only the current item is kept in memory. Values found before or after the
+    array are stored in `envelope`, which is complete once the iteration ends.
+    A value at `path` that is not an array is yielded as a single item.
+
+    Args:
+        chunks: Bytes of the document, in any chunk size
+        path: Keys leading to the array, starting at the root object
+    """
+
+    def __init__(
+        self, chunks: Iterable[bytes], path: Sequence[str] = ("result",)
+    ) -> None:
+        self.envelope: dict[str, Any] = {}
+        self._chunks = iter(chunks)
+        self._path = tuple(path)
+        self._textDecoder = codecs.getincrementaldecoder("utf-8")()
+        self._jsonDecoder = json.JSONDecoder()
+        self._buffer = ""
+        self._pos = 0
+        self._eof = False
+
+    def __iter__(self) -> Iterator[Any]:
+        yield from self._object(self._path, self.envelope)
+
+        if self._peek():
+            raise ValueError("Extra data after the JSON document")
+
+    def _read(self) -> bool:
+        if self._eof:
+            return False
+
+        try:
+            chunk = next(self._chunks)
+        except StopIteration:
+            self._eof = True
+            chunk = b""
+
+        # Drop the parsed part, so the buffer only holds the item being read
+        if self._pos > STREAM_CHUNK_SIZE:
+            self._buffer = self._buffer[self._pos :]
+            self._pos = 0
+
+        self._buffer += self._textDecoder.decode(chunk, final=self._eof)
+        return True
+
+    def _peek(self) -> str:
+        while True:
+            while (
+                self._pos < len(self._buffer) and self._buffer[self._pos] in _WHITESPACE
+            ):
+                self._pos += 1
+            if self._pos < len(self._buffer):
+                return self._buffer[self._pos]
+            if not self._read():
+                return ""
+
+    def _expect(self, chars: str) -> str:
+        char = self._peek()
+        if not char or char not in chars:
+            raise ValueError(f"Expected one of '{chars}' but found '{char}'")
+        self._pos += 1
+        return char
+
+    def _value(self) -> Any:
+        self._peek()
+        while True:
+            try:
+                value, end = self._jsonDecoder.raw_decode(self._buffer, self._pos)
+            except json.JSONDecodeError:
+                if not self._read():
+                    raise
+                continue
+
+            # A number at the end of the buffer may continue in the next chunk
+            if end == len(self._buffer) and self._read():
+                continue
+
+            self._pos = end
+            return value
+
+    def _array(self) -> Iterator[Any]:
+        self._expect("[")
+        if self._peek() == "]":
+            self._pos += 1
+            return
+
+        while True:
+            yield self._value()
+            if self._expect(",]") == "]":
+                return
+
+    def _object(self, path: tuple[str, ...], target: dict[str, Any]) -> Iterator[Any]:
+        self._expect("{")
+        if self._peek() == "}":
+            self._pos += 1
+            return
+
+        while True:
+            key = self._value()
+            if not isinstance(key, str):
+                raise ValueError("Object keys must be strings")
+            self._expect(":")
+
+            char = self._peek()
+            if path and key == path[0] and len(path) == 1 and char == "[":
+                yield from self._array()
+            elif path and key == path[0] and len(path) > 1 and char == "{":
+                target[key] = {}
+                yield from self._object(path[1:], target[key])
+            elif path and key == path[0] and len(path) == 1:
+                yield self._value()
+            else:
+                target[key] = self._value()
+
+            if self._expect(",}") == "}":
+                return
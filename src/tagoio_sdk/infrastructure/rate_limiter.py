@@ -0,0 +1,198 @@
+import threading
+import time
+
+from collections import OrderedDict
+from typing import Optional
+
+from tagoio_sdk import config
+
+
+LIMIT_ERROR_MESSAGE = "You have exceeded the maximum limit"
+
+
+def isThrottled(
+    statusCode: Optional[int] = None, message: Optional[str] = None
+) -> bool:
+    """
+    Check if TagoIO rejected a request because of the profile request limits.
+    """
+    return statusCode == 429 or str(message or "").startswith(LIMIT_ERROR_MESSAGE)
+
+
+class TokenBucket(object):
+    """
+    Allow `rate` requests per second on average and bursts up to `burst` requests.
+    """
+
+    def __init__(self, rate: float, burst: float) -> None:
+        if rate <= 0:
+            raise ValueError("The rate of a token bucket must be positive")
+
+        self.rate = rate
+        self.burst = burst
+        self._tokens = burst
+        self._updatedAt = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self, timeout: Optional[float] = None) -> bool:
+        """
+        Block until a request can be sent. Returns False right away, without
+        waiting, when it can't be sent within `timeout` seconds.
+        """
+        endTime = time.monotonic() + timeout if timeout is not None else None
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(
+                    self.burst, self._tokens + (now - self._updatedAt) * self.rate
+                )
+                self._updatedAt = now
+
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return True
+
+                wait = (1 - self._tokens) / self.rate
+
+            if endTime is not None and now + wait > endTime:
+                return False
+            time.sleep(wait)
+
+
+class AdaptiveConcurrency(object):
+    """
+    Additive-increase/multiplicative-decrease limit of in-flight requests.
+
+    Every successful request raises the limit by `1 / limit` (about one more
+    request per round trip), every throttled request halves it.
+    """
+
+    def __init__(
+        self, initial: float, minimum: float, maximum: float, decrease: float = 0.5
+    ) -> None:
+        self.minimum = minimum
+        self.maximum = maximum
+        self.decrease = decrease
+        self.limit = min(max(initial, minimum), maximum)
+        self.inFlight = 0
+        self._condition = threading.Condition()
+
+    def acquire(self, timeout: Optional[float] = None) -> bool:
+        """
+        Block until the amount of in-flight requests is under the current limit.
+        Returns False when it's still over the limit after `timeout` seconds.
+        """
+        endTime = time.monotonic() + timeout if timeout is not None else None
+        with self._condition:
+            while self.inFlight >= int(self.limit):
+                remaining = endTime - time.monotonic() if endTime is not None else None
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._condition.wait(remaining)
+            self.inFlight += 1
+            return True
+
+    def cancel(self) -> None:
+        """
+        Give back a slot that wasn't used to send a request, leaving the limit as is.
+        """
+        with self._condition:
+            self.inFlight -= 1
+            self._condition.notify_all()
+
+    def release(self, throttled: bool = False) -> None:
+        """
+        Mark a request as finished and adjust the limit from its outcome.
+        """
+        with self._condition:
+            self.inFlight -= 1
+            if throttled:
+                self.limit = max(self.minimum, self.limit * self.decrease)
+            else:
+                self.limit = min(self.maximum, self.limit + 1 / self.limit)
+            self._condition.notify_all()
+
+
+class RateLimiter(object):
+    """
+    Client-side limiter of the requests sent with one token to one region.
+    """
+
+    def __init__(
+        self,
+        requestsPerSecond: float,
+        burst: float,
+        initialConcurrency: float,
+        minConcurrency: float,
+        maxConcurrency: float,
+    ) -> None:
+        self.bucket = TokenBucket(requestsPerSecond, burst)
+        self.concurrency = AdaptiveConcurrency(
+            initialConcurrency, minConcurrency, maxConcurrency
+        )
+
+    def acquire(self, timeout: Optional[float] = None) -> bool:
+        """
+        Block until a request can be sent. Returns False, holding nothing, when
+        it can't be sent within `timeout` seconds.
+        """
+        endTime = time.monotonic() + timeout if timeout is not None else None
+        if not self.concurrency.acquire(timeout):
+            return False
+        try:
+            acquired = self.bucket.acquire(
+                endTime - time.monotonic() if endTime is not None else None
+            )
+        except BaseException:
+            self.concurrency.cancel()
+            raise
+        if not acquired:
+            self.concurrency.cancel()
+        return acquired
+
+    def release(self, throttled: bool = False) -> None:
+        self.concurrency.release(throttled)
+
+
+_limiters: "OrderedDict[tuple[str, Optional[str]], RateLimiter]" = OrderedDict()
+_limitersLock = threading.Lock()
+
+
+def getRateLimiter(url: str, token: Optional[str] = None) -> Optional[RateLimiter]:
+    """
+    Get the limiter for a region and token, None when rate limiting is disabled.
+
+    Args:
+        url: Base URL of the TagoIO API (region)
+        token: Token used on the requests, if any
+    """
+    rateConfig = config.tagoSDKconfig["rateLimit"]
+    if not rateConfig["enabled"]:
+        return None
+
+    key = (url, token)
+    with _limitersLock:
+        limiter = _limiters.get(key)
+        if limiter is None:
+            limiter = RateLimiter(
+                requestsPerSecond=rateConfig["requestsPerSecond"],
+                burst=rateConfig["burst"],
+                initialConcurrency=rateConfig["initialConcurrency"],
+                minConcurrency=rateConfig["minConcurrency"],
+                maxConcurrency=rateConfig["maxConcurrency"],
+            )
+            _limiters[key] = limiter
+        _limiters.move_to_end(key)
+
+        while len(_limiters) > config.tagoSDKconfig["connectionPool"]["maxSessions"]:
+            _limiters.popitem(last=False)
+
+    return limiter
+
+
+def clearRateLimiters() -> None:
+    """
+    Drop every limiter, so the next requests start from the configured values.
+    """
+    with _limitersLock:
+        _limiters.clear()
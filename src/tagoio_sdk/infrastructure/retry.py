@@ -0,0 +1,200 @@
+import random
+
+from datetime import datetime
+from datetime import timezone
+from email.utils import parsedate_to_datetime
+from typing import Optional
+
+import requests
+
+from urllib3.exceptions import NewConnectionError
+
+from tagoio_sdk import config
+
+
+RETRYABLE_STATUS = (429, 500, 502, 503, 504)
+"""Status codes that are worth retrying"""
+
+IDEMPOTENT_METHODS = ("GET", "HEAD", "OPTIONS", "PUT", "DELETE")
+"""Methods that can be replayed without side effects"""
+
+
+def parseRetryAfter(value: Optional[str]) -> Optional[float]:
+    """
+    Convert a `Retry-After` header (seconds or HTTP date) to seconds.
+    """
+    if not value:
+        return None
+
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+
+    try:
+        retryDate = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+
+    if retryDate.tzinfo is None:
+        retryDate = retryDate.replace(tzinfo=timezone.utc)
+
+    return max((retryDate - datetime.now(timezone.utc)).total_seconds(), 0.0)
+
+
+def isConnectionFailure(error: Exception) -> bool:
+    """
+    Check if the request failed before reaching the server, so it was never sent.
+    """
+    if isinstance(error, requests.exceptions.ConnectTimeout):
+        return True
+
+    if isinstance(error, requests.exceptions.ConnectionError) and error.args:
+        return isinstance(getattr(error.args[0], "reason", None), NewConnectionError)
+
+    return False
+
+
+class RetryPolicy(object):
+    """
+    Decide if and when a failed request is retried.
+
+    Connection errors, timeouts, 429 and 5xx responses are retried with exponential
+    backoff and full jitter. A `Retry-After` is waited for in full, and the request
+    isn't retried when it's longer than `maxDelay` or the time left before the
+    deadline. Other 4xx are never retried.
+    Non-idempotent methods (POST) are only replayed when the server surely did not
+    process them: connection failures and 429.
+
+    Subclass and override `isRetryable` or `backoff` to customize it.
+
+    :param int attempts: Max amount of attempts, defaults to `requestAttempts`
+    :param float baseDelay: First backoff in seconds
+    :param float maxDelay: Max backoff in seconds
+    :param float budget: Max seconds a call can spend, including retries
+    :param float minAttemptTime: Min seconds left before the deadline for another attempt
+    :param bool retryNonIdempotent: Replay POST requests as if they were idempotent
+    """
+
+    def __init__(
+        self,
+        attempts: Optional[int] = None,
+        baseDelay: Optional[float] = None,
+        maxDelay: Optional[float] = None,
+        budget: Optional[float] = None,
+        retryStatus: tuple[int, ...] = RETRYABLE_STATUS,
+        retryNonIdempotent: bool = False,
+        minAttemptTime: Optional[float] = None,
+    ) -> None:
+        retryConfig = config.tagoSDKconfig["retry"]
+        self.attempts = (
+            attempts
+            if attempts is not None
+            else config.tagoSDKconfig["requestAttempts"]
+        )
+        self.baseDelay = (
+            baseDelay if baseDelay is not None else retryConfig["baseDelay"]
+        )
+        self.maxDelay = maxDelay if maxDelay is not None else retryConfig["maxDelay"]
+        self.budget = budget if budget is not None else retryConfig["budget"]
+        self.retryStatus = retryStatus
+        self.retryNonIdempotent = retryNonIdempotent
+        self.minAttemptTime = (
+            minAttemptTime
+            if minAttemptTime is not None
+            else retryConfig["minAttemptTime"]
+        )
+
+    def isRetryable(
+        self,
+        method: str,
+        statusCode: Optional[int] = None,
+        error: Optional[Exception] = None,
+    ) -> bool:
+        """
+        Classify a failure as retryable or not.
+
+        :param str method: HTTP method of the request
+        :param int statusCode: Status code of the response, if there was one
+        :param Exception error: Exception raised by the request, if any
+        """
+        idempotent = self.retryNonIdempotent or method.upper() in IDEMPOTENT_METHODS
+
+        if error is not None:
+            if isConnectionFailure(error):
+                return True
+            if isinstance(
+                error,
+                (requests.exceptions.ConnectionError, requests.exceptions.Timeout),
+            ):
+                return idempotent
+            return False
+
+        if statusCode == 429:
+            return 429 in self.retryStatus
+
+        return statusCode in self.retryStatus and idempotent
+
+    def backoff(self, attempt: int, retryAfter: Optional[float] = None) -> float:
+        """
+        Seconds to wait before the next attempt.
+
+        :param int attempt: Number of the attempt that just failed, starting at 0
+        :param float retryAfter: Delay requested by the server, if any
+        """
+        if retryAfter is not None:
+            return retryAfter
+
+        return random.uniform(0, min(self.maxDelay, self.baseDelay * (2**attempt)))
+
+    def nextDelay(
+        self,
+        attempt: int,
+        elapsed: float,
+        method: str,
+        statusCode: Optional[int] = None,
+        error: Optional[Exception] = None,
+        retryAfter: Optional[float] = None,
+        remaining: Optional[float] = None,
+    ) -> Optional[float]:
+        """
+        Seconds to wait before retrying, or None when the request must not be retried.
+
+        :param int attempt: Number of the attempt that just failed, starting at 0
+        :param float elapsed: Seconds spent on the call so far
+        :param float remaining: Seconds left before the deadline, if there is one
+        """
+        if attempt + 1 >= self.attempts or not self.isRetryable(
+            method, statusCode, error
+        ):
+            return None
+        if retryAfter is not None and retryAfter > self.maxDelay:
+            return None
+
+        delay = self.backoff(attempt, retryAfter)
+        if elapsed + delay > self.budget:
+            return None
+        if remaining is not None and delay + self.minAttemptTime > remaining:
+            return None
+
+        return delay
+
+
+_defaultPolicy: Optional[RetryPolicy] = None
+
+
+def setRetryPolicy(policy: Optional[RetryPolicy]) -> None:
+    """
+    Replace the retry policy used by requests that don't set their own.
+
+    Pass None to go back to the one built from `tagoSDKconfig`.
+    """
+    global _defaultPolicy
+    _defaultPolicy = policy
+
+
+def getRetryPolicy() -> RetryPolicy:
+    """
+    Get the retry policy used by requests that don't set their own.
+    """
+    return _defaultPolicy or RetryPolicy()
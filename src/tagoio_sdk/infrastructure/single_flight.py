@@ -0,0 +1,94 @@
+import copy
+import threading
+
+from typing import Any
+from typing import Callable
+from typing import Hashable
+from typing import Optional
+
+from tagoio_sdk.infrastructure.api_request import TagoIODeadlineError
+from tagoio_sdk.infrastructure.deadline import remainingTime
+
+
+class _Call(object):
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.waiters = 0
+        self.result: Any = None
+        self.error: Any = None
+
+
+class SingleFlight(object):
+    """
+    Share the result of a call among every concurrent caller asking for the same key.
+
+    The first caller runs the function, the ones arriving while it's still running
+    wait for it and receive a copy of its result (or its exception). A waiting caller
+    gives up with TagoIODeadlineError once its own deadline is over. When the first
+    caller runs out of its own deadline, the waiting ones with time left try again
+    instead of failing with it.
+    """
+
+    def __init__(self) -> None:
+        self._calls: dict[Hashable, _Call] = {}
+        self._lock = threading.Lock()
+
+    def do(
+        self,
+        key: Hashable,
+        func: Callable[[], Any],
+        callDeadline: Optional[float] = None,
+    ) -> Any:
+        while True:
+            call, leader = self._join(key)
+            if leader:
+                return self._lead(key, call, func)
+
+            remaining = remainingTime(callDeadline)
+            if not call.done.wait(None if remaining is None else max(remaining, 0)):
+                with self._lock:
+                    call.waiters -= 1
+                raise TagoIODeadlineError(
+                    "Deadline exceeded while waiting for an identical request"
+                )
+
+            if isinstance(call.error, TagoIODeadlineError):
+                remaining = remainingTime(callDeadline)
+                if remaining is None or remaining > 0:
+                    # The deadline of the caller that sent the request was over, not ours
+                    continue
+            if call.error is not None:
+                raise call.error
+            return copy.deepcopy(call.result)
+
+    def _join(self, key: Hashable) -> tuple[_Call, bool]:
+        leader = False
+        with self._lock:
+            call = self._calls.get(key)
+            if call is None:
+                call = _Call()
+                self._calls[key] = call
+                leader = True
+            else:
+                call.waiters += 1
+
+        return call, leader
+
+    def _lead(self, key: Hashable, call: _Call, func: Callable[[], Any]) -> Any:
+        try:
+            result = func()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            if call.error is not None:
+                call.done.set()
+
+        # Followers get their own copy, the leader's caller may mutate the result
+        if call.waiters > 0:
+            call.result = copy.deepcopy(result)
+        call.done.set()
+
+        return result
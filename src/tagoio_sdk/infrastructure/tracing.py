@@ -0,0 +1,138 @@
+import contextvars
+import functools
+
+from typing import Any
+from typing import Callable
+from typing import Optional
+
+from tagoio_sdk import __version__
+from tagoio_sdk import config
+
+
+try:
+    from opentelemetry import trace as otelTrace
+except ImportError:
+    otelTrace = None
+
+
+class _NoopSpan(object):
+    """Stand-in for spans when tracing is off, every method does nothing"""
+
+    def __enter__(self) -> "_NoopSpan":
+        return self
+
+    def __exit__(self, *args) -> bool:
+        return False
+
+    def is_recording(self) -> bool:
+        return False
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        pass
+
+    def set_attributes(self, attributes: dict) -> None:
+        pass
+
+    def add_event(self, name: str, attributes: Optional[dict] = None) -> None:
+        pass
+
+    def record_exception(
+        self, exception: BaseException, attributes: Optional[dict] = None
+    ) -> None:
+        pass
+
+
+NOOP_SPAN = _NoopSpan()
+
+_tracer = None
+_providerTracer: tuple = (None, None)
+
+
+def setTracer(tracer: Any) -> None:
+    """
+    Use an OpenTelemetry tracer for the SDK spans.
+
+    By default the tracer of the global OpenTelemetry provider is used, once one
+    is configured. Pass None to go back to it.
+    """
+    global _tracer
+    _tracer = tracer
+
+
+def getTracer() -> Any:
+    """
+    Get the tracer of the SDK spans, None when tracing is off or no OpenTelemetry
+    provider is configured.
+    """
+    global _providerTracer
+
+    if not config.tagoSDKconfig["tracing"]["enabled"]:
+        return None
+    if _tracer is not None:
+        return _tracer
+    if otelTrace is None:
+        return None
+
+    provider = otelTrace.get_tracer_provider()
+    if isinstance(provider, otelTrace.ProxyTracerProvider):
+        return None
+    if _providerTracer[0] is not provider:
+        _providerTracer = (provider, provider.get_tracer("tagoio_sdk", __version__))
+    return _providerTracer[1]
+
+
+def span(name: str, attributes: Optional[dict] = None):
+    """
+    Start a span as a child of the current one, to be used as a context manager.
+
+    Without a tracer it's a shared no-op object, so spans cost nearly nothing.
+    Exceptions raised inside are recorded on the span.
+
+    Example:
+        ```python
+        with span("TagoIO sendDownlink", {"tagoio.device_id": deviceID}) as current:
+            current.set_attribute("tagoio.port", 1)
+        ```
+    """
+    tracer = getTracer()
+    if tracer is None:
+        return NOOP_SPAN
+    return tracer.start_as_current_span(name, attributes=attributes)
+
+
+def currentSpan() -> Any:
+    """
+    Get the active span, to add attributes or events to it.
+    """
+    if otelTrace is None or getTracer() is None:
+        return NOOP_SPAN
+    return otelTrace.get_current_span()
+
+
+def propagateContext(func: Callable) -> Callable:
+    """
+    Bind a function to the current context, so spans it starts in another thread
+    are children of the current span. Each call runs in its own copy of the context.
+    """
+    context = contextvars.copy_context()
+
+    def run(*args, **kwargs):
+        return context.copy().run(func, *args, **kwargs)
+
+    return run
+
+
+def traced(name: str) -> Callable[[Callable], Callable]:
+    """
+    Decorator running every call of the function in a span.
+    """
+
+    def decorator(func: Callable) -> Callable:
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with span(name):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
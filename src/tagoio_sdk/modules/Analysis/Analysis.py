@@ -8,9 +8,12 @@ from typing import Any
 from typing import List
 from typing import Optional
 
+from tagoio_sdk import config
 from tagoio_sdk.common.JSON_Parse_Safe import JSONParseSafe
 from tagoio_sdk.common.tagoio_module import TagoIOModule
 from tagoio_sdk.infrastructure.api_sse import openSSEListening
+from tagoio_sdk.infrastructure.deadline import deadline
+from tagoio_sdk.infrastructure.tracing import span
 from tagoio_sdk.modules.Analysis.Analysis_Type import AnalysisConstructorParams
 from tagoio_sdk.modules.Analysis.Analysis_Type import AnalysisEnvironment
 from tagoio_sdk.modules.Analysis.Analysis_Type import AnalysisFunction
@@ -77,6 +80,20 @@ class Analysis(TagoIOModule):
         )
         ```
 
+    Example: Async analysis with concurrent requests
+        ```python
+        import asyncio
+
+        from tagoio_sdk import Analysis, AsyncResources
+
+        async def my_analysis(context, scope):
+            resources = AsyncResources({"token": "your-profile-token"})
+            devices = await asyncio.gather(*(resources.devices.info(d["device"]) for d in scope))
+            context.log(f"Loaded {len(devices)} devices")
+
+        Analysis.use(analysis=my_analysis, params={"token": "your-analysis-token"})
+        ```
+
     Example: Environment variables
         ```python
         def my_analysis(context, scope):
@@ -125,7 +142,13 @@ class Analysis(TagoIOModule):
 
         data = JSONParseSafe(os.environ.get("T_ANALYSIS_DATA", "[]"), [])
 
-        self.analysis(context, data)
+        with deadline(self._runDeadline()):
+            self.analysis(context, data)
+
+    def _runDeadline(self) -> Optional[float]:
+        if self.params.get("deadline") is not None:
+            return self.params["deadline"]
+        return config.tagoSDKconfig["analysisDeadline"]
 
     def _stringifyMsg(self, msg: Any) -> str:
         if isinstance(msg, dict) and not isinstance(msg, list):
@@ -175,19 +198,25 @@ class Analysis(TagoIOModule):
         context.environment = environment
         context.analysis_id = analysisID
 
-        # Execute analysis function
-        if inspect.iscoroutinefunction(self.analysis):
-            # Async function
-            try:
-                asyncio.run(self.analysis(context, data or []))
-            except Exception as error:
-                log(error)
-        else:
-            # Sync function
-            try:
-                self.analysis(context, data or [])
-            except Exception as error:
-                log(error)
+        # Execute analysis function. The deadline only wraps the run, so the error
+        # is still logged to the console when the deadline is already over
+        with span("TagoIO Analysis.run", {"tagoio.analysis_id": analysisID}) as current:
+            if inspect.iscoroutinefunction(self.analysis):
+                # Async function
+                try:
+                    with deadline(self._runDeadline()):
+                        asyncio.run(self.analysis(context, data or []))
+                except Exception as error:
+                    current.record_exception(error)
+                    log(error)
+            else:
+                # Sync function
+                try:
+                    with deadline(self._runDeadline()):
+                        self.analysis(context, data or [])
+                except Exception as error:
+                    current.record_exception(error)
+                    log(error)
 
     def _localRuntime(self) -> None:
         """Set up local runtime environment for development"""
@@ -34,6 +34,13 @@ class AnalysisConstructorParams(TypedDict, total=False):
 
     Default: False
     """
+    deadline: Optional[float]
+    """
+    Max seconds the SDK calls of a run may take altogether, retries included.
+    Calls fail fast once it's over, instead of eating the analysis runtime.
+
+    Default: config "analysisDeadline" (env TAGOIO_ANALYSIS_DEADLINE), no deadline when unset
+    """
 
 
 AnalysisEnvironment = Dict[str, str]
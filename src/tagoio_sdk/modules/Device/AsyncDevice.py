@@ -0,0 +1,19 @@
+from tagoio_sdk.common.async_module import ThreadOffloadModule
+from tagoio_sdk.common.tagoio_module import GenericModuleParams
+from tagoio_sdk.modules.Device.Device import Device
+
+
+class AsyncDevice(ThreadOffloadModule[Device]):
+    """
+    Asyncio version of `Device`, every method returns an awaitable.
+    The calls run on a thread pool (see `ThreadOffloadModule`).
+
+    :example:
+
+        myDevice = AsyncDevice({ "token": "my_device_token" })
+
+        result = await myDevice.sendData({ "variable": "temperature", "value": 55 })
+    """
+
+    def __init__(self, params: GenericModuleParams):
+        super().__init__(Device(params))
@@ -1,4 +1,5 @@
 from datetime import datetime
+from typing import Iterator
 from typing import Optional
 from typing import Union
 
@@ -8,6 +9,9 @@ from tagoio_sdk.common.tagoio_module import TagoIOModule
 from tagoio_sdk.modules.Device.Device_Type import DataQuery
 from tagoio_sdk.modules.Device.Device_Type import DeviceInfo
 from tagoio_sdk.modules.Resources.Device_Type import ConfigurationParams
+from tagoio_sdk.modules.Utils.dataHistory import DEFAULT_HISTORY_PAGE_SIZE
+from tagoio_sdk.modules.Utils.dataHistory import iterDataHistory
+from tagoio_sdk.modules.Utils.dateParser import dateParser
 from tagoio_sdk.modules.Utils.dateParser import dateParserList
 
 
@@ -33,12 +37,13 @@ class Device(TagoIOModule):
         result = self.doRequest({"path": "/info", "method": "get"})
         return result
 
-    def sendData(self, data: Union[Data, list[Data]]) -> str:
+    def sendData(self, data: Union[Data, list[Data], bytes], compress: bool = False) -> str:
         """
         Send data to device
 
-        :param Union[Data, list[Data]] data: An array or one object with data to be send to
-        TagoIO using device token
+        :param Union[Data, list[Data], bytes] data: An array or one object with data to be send to
+        TagoIO using device token, or the same already serialized to JSON bytes
+        :param bool compress: Gzip the body when it's larger than the compression threshold
 
         :example:
 
@@ -54,7 +59,7 @@ class Device(TagoIOModule):
 
         :rtype: str
         """
-        result = self.doRequest({"path": "/data", "method": "post", "body": data})
+        result = self.doRequest({"path": "/data", "method": "post", "body": data, "compress": compress})
         return result
 
     def getData(self, queryParams: DataQuery = None) -> list[Data]:
@@ -93,12 +98,63 @@ class Device(TagoIOModule):
         result = dateParserList(result, ["time"])
         return result
 
-    def editData(self, data: Union[Data, list[Data]]) -> str:
+    def getDataStream(self, queryParams: DataQuery = None, spillToFile: bool = False) -> Iterator[Data]:
+        """
+        Get data from TagoIO Device, yielding each record while the response is
+        downloaded, so memory stays flat for large `qty` values.
+
+        :param DataQuery queryParams: Object with query params
+        :param bool spillToFile: Download the response to a temporary file first,
+            releasing the connection before the records are parsed
+
+        :example:
+
+            myDevice = Device({ "token": "my_device_token" })
+
+            for data in myDevice.getDataStream({"variable": "humidity", "qty": 10000}):
+                print(data["value"], data["time"])
+
+        :rtype: Iterator[Data]
+        """
+        stream = self.doRequestStream(
+            {"path": "/data", "method": "get", "params": queryParams, "spillToFile": spillToFile}
+        )
+
+        for data in stream:
+            yield dateParser(data, ["time"]) if isinstance(data, dict) else data
+
+    def iterData(
+        self, queryParams: DataQuery = None, pageSize: int = DEFAULT_HISTORY_PAGE_SIZE, prefetch: bool = False
+    ) -> Iterator[Data]:
+        """
+        Go through the whole data history matching the query, page by page.
+
+        Each page starts at the time of the last record read instead of using `skip`,
+        so pages deep into the history are as fast as the first one.
+
+        :param DataQuery queryParams: Object with query params, oldest records first
+            unless `ordination` is "descending". `qty` and `skip` are ignored
+        :param int pageSize: Records requested per page
+        :param bool prefetch: Request the next page while the current one is processed
+
+        :example:
+
+            myDevice = Device({ "token": "my_device_token" })
+
+            for data in myDevice.iterData({"variables": ["temperature"], "start_date": "2024-01-01"}):
+                print(data["value"], data["time"])
+
+        :rtype: Iterator[Data]
+        """
+        yield from iterDataHistory(self.getData, queryParams, pageSize, prefetch)
+
+    def editData(self, data: Union[Data, list[Data]], compress: bool = False) -> str:
         """
         Edit data in a Mutable-type device.
 
         :param Union[Data, list[Data]] data: Array or object with the data to be edited,
         each object with the data's ID.
+        :param bool compress: Gzip the body when it's larger than the compression threshold
 
         :example:
 
@@ -122,6 +178,7 @@ class Device(TagoIOModule):
                 "path": "/data",
                 "method": "PUT",
                 "body": data,
+                "compress": compress,
             }
         )
         return result
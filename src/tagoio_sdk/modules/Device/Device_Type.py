@@ -1,3 +1,4 @@
+from datetime import datetime
 from typing import Literal
 from typing import Optional
 from typing import TypedDict
@@ -24,6 +25,8 @@ class DataQueryDefault(DataQueryBase):
     details: bool
     ordination: Literal["descending", "ascending"]
     skip: int
+    start_date: Union[str, datetime]
+    end_date: Union[str, datetime]
 
 
 class DataQueryFirstLast(DataQueryBase):
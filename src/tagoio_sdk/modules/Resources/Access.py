@@ -1,3 +1,8 @@
+from typing import Iterator
+from typing import Optional
+
+from tagoio_sdk.common.pagination import DEFAULT_PAGE_SIZE
+from tagoio_sdk.common.pagination import paginate
 from tagoio_sdk.common.tagoio_module import TagoIOModule
 from tagoio_sdk.modules.Resources.Access_Types import AccessCreateInfo
 from tagoio_sdk.modules.Resources.Access_Types import AccessInfo
@@ -50,6 +55,34 @@ class Access(TagoIOModule):
 
         return result
 
+    def iterAccess(
+        self,
+        queryObj: Optional[AccessQuery] = None,
+        pageSize: int = DEFAULT_PAGE_SIZE,
+        prefetch: bool = False,
+    ) -> Iterator[AccessInfo]:
+        """
+        @description:
+            Same as `list`, but walks through every page of access rules, requesting them
+            as the items are consumed. Pass `prefetch=True` to request the next page while
+            the current one is processed.
+
+        @example:
+            If receive an error "Authorization Denied", check policy **Access Management** / **Access** in Access Management.
+            ```python
+            resources = Resources()
+            for item in resources.access.iterAccess({"fields": ["id", "name"]}):
+                print(item)
+            ```
+        """
+        queryObj = {**(queryObj or {}), "amount": pageSize}
+        yield from paginate(
+            lambda page: self.list({**queryObj, "page": page}),
+            pageSize,
+            queryObj.get("page") or 1,
+            prefetch,
+        )
+
     def create(self, accessObj: AccessCreateInfo) -> dict:
         """
         @description:
@@ -1,8 +1,11 @@
 from typing import Dict
+from typing import Iterator
 from typing import List
 from typing import Optional
 
 from tagoio_sdk.common.Common_Type import GenericID
+from tagoio_sdk.common.pagination import DEFAULT_PAGE_SIZE
+from tagoio_sdk.common.pagination import paginate
 from tagoio_sdk.common.tagoio_module import TagoIOModule
 from tagoio_sdk.modules.Resources.Actions_Types import ActionCreateInfo
 from tagoio_sdk.modules.Resources.Actions_Types import ActionInfo
@@ -59,6 +62,34 @@ class Actions(TagoIOModule):
 
         return result
 
+    def iterActions(
+        self,
+        queryObj: Optional[ActionQuery] = None,
+        pageSize: int = DEFAULT_PAGE_SIZE,
+        prefetch: bool = False,
+    ) -> Iterator[ActionInfo]:
+        """
+        @description:
+            Same as `list`, but walks through every page of actions, requesting them
+            as the items are consumed. Pass `prefetch=True` to request the next page while
+            the current one is processed.
+
+        @example:
+            If receive an error "Authorization Denied", check policy **Action** / **Access** in Access Management.
+            ```python
+            resources = Resources()
+            for item in resources.actions.iterActions({"fields": ["id", "name"]}):
+                print(item)
+            ```
+        """
+        queryObj = {**(queryObj or {}), "amount": pageSize}
+        yield from paginate(
+            lambda page: self.list({**queryObj, "page": page}),
+            pageSize,
+            queryObj.get("page") or 1,
+            prefetch,
+        )
+
     def create(self, actionObj: ActionCreateInfo) -> Dict[str, str]:
         """
         @description:
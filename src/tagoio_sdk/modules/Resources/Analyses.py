@@ -1,5 +1,6 @@
 from typing import Any
 from typing import Dict
+from typing import Iterator
 from typing import List
 from typing import Literal
 from typing import Optional
@@ -8,6 +9,8 @@ import requests
 
 from tagoio_sdk.common.Common_Type import GenericID
 from tagoio_sdk.common.Common_Type import GenericToken
+from tagoio_sdk.common.pagination import DEFAULT_PAGE_SIZE
+from tagoio_sdk.common.pagination import paginate
 from tagoio_sdk.common.tagoio_module import TagoIOModule
 from tagoio_sdk.modules.Resources.Analysis_Types import AnalysisCreateInfo
 from tagoio_sdk.modules.Resources.Analysis_Types import AnalysisInfo
@@ -71,6 +74,34 @@ class Analyses(TagoIOModule):
         result = dateParserList(result, ["created_at", "updated_at", "last_run"])
         return result
 
+    def iterAnalyses(
+        self,
+        queryObj: Optional[AnalysisQuery] = None,
+        pageSize: int = DEFAULT_PAGE_SIZE,
+        prefetch: bool = False,
+    ) -> Iterator[AnalysisListItem]:
+        """
+        @description:
+            Same as `list`, but walks through every page of analyses, requesting them
+            as the items are consumed. Pass `prefetch=True` to request the next page while
+            the current one is processed.
+
+        @example:
+            If receive an error "Authorization Denied", check policy **Analysis** / **Access** in Access Management.
+            ```python
+            resources = Resources()
+            for item in resources.analysis.iterAnalyses({"fields": ["id", "name"]}):
+                print(item)
+            ```
+        """
+        queryObj = {**(queryObj or {}), "amount": pageSize}
+        yield from paginate(
+            lambda page: self.list({**queryObj, "page": page}),
+            pageSize,
+            queryObj.get("page") or 1,
+            prefetch,
+        )
+
     def create(self, analysisObj: AnalysisCreateInfo) -> Dict[str, GenericID | GenericToken]:
         """
         @description:
@@ -0,0 +1,63 @@
+from typing import Optional
+
+from tagoio_sdk.common.async_module import ThreadOffloadModule
+from tagoio_sdk.common.tagoio_module import GenericModuleParams
+
+from .Access import Access
+from .Account import Account
+from .Actions import Actions
+from .Analyses import Analyses
+from .Billing import Billing
+from .Buckets import Buckets
+from .Dashboards import Dashboards
+from .Devices import Devices
+from .Dictionaries import Dictionaries
+from .Files import Files
+from .Integration import Integration
+from .Notifications import Notifications
+from .Profile import Profile
+from .Resources import Resources
+from .Run import Run
+from .Secrets import Secrets
+from .Service_Authorization import ServiceAuthorization
+
+
+class AsyncResources(ThreadOffloadModule[Resources]):
+    """
+    Asyncio version of `Resources`, every method returns an awaitable.
+
+    The calls run on a thread pool (see `ThreadOffloadModule`), with as many
+    threads as pooled connections per host (`TAGOIO_POOL_MAXSIZE`).
+
+    Example:
+        ```python
+        import asyncio
+
+        from tagoio_sdk import AsyncResources
+
+        async def main():
+            resources = AsyncResources({"token": "my-profile-token"})
+            devices = await resources.devices.listDevice({"amount": 100})
+            infos = await asyncio.gather(*(resources.devices.info(d["id"]) for d in devices))
+        ```
+    """
+
+    access: ThreadOffloadModule[Access]
+    account: ThreadOffloadModule[Account]
+    actions: ThreadOffloadModule[Actions]
+    analysis: ThreadOffloadModule[Analyses]
+    billing: ThreadOffloadModule[Billing]
+    buckets: ThreadOffloadModule[Buckets]
+    dashboards: ThreadOffloadModule[Dashboards]
+    devices: ThreadOffloadModule[Devices]
+    dictionaries: ThreadOffloadModule[Dictionaries]
+    files: ThreadOffloadModule[Files]
+    integration: ThreadOffloadModule[Integration]
+    notifications: ThreadOffloadModule[Notifications]
+    profile: ThreadOffloadModule[Profile]
+    run: ThreadOffloadModule[Run]
+    secrets: ThreadOffloadModule[Secrets]
+    serviceAuthorization: ThreadOffloadModule[ServiceAuthorization]
+
+    def __init__(self, params: Optional[GenericModuleParams] = None):
+        super().__init__(Resources(params))
@@ -1,5 +1,6 @@
 from typing import Any
 from typing import Dict
+from typing import Iterator
 from typing import List
 from typing import Optional
 from typing import TypedDict
@@ -7,6 +8,8 @@ from typing import TypedDict
 from tagoio_sdk.common.Common_Type import ExpireTimeOption
 from tagoio_sdk.common.Common_Type import GenericID
 from tagoio_sdk.common.Common_Type import Query
+from tagoio_sdk.common.pagination import DEFAULT_PAGE_SIZE
+from tagoio_sdk.common.pagination import paginate
 from tagoio_sdk.common.tagoio_module import TagoIOModule
 from tagoio_sdk.modules.Resources.Dashboard_Widgets import Widgets
 from tagoio_sdk.modules.Resources.Dashboards_Type import AnalysisRelated
@@ -67,6 +70,34 @@ class Dashboards(TagoIOModule):
         result = dateParserList(result, ["created_at", "updated_at", "last_access"])
         return result
 
+    def iterDashboards(
+        self,
+        queryObj: Optional[Query] = None,
+        pageSize: int = DEFAULT_PAGE_SIZE,
+        prefetch: bool = False,
+    ) -> Iterator[DashboardInfo]:
+        """
+        @description:
+            Same as `listDashboard`, but walks through every page of dashboards, requesting them
+            as the items are consumed. Pass `prefetch=True` to request the next page while
+            the current one is processed.
+
+        @example:
+            If receive an error "Authorization Denied", check policy **Dashboard** / **Access** in Access Management.
+            ```python
+            resources = Resources()
+            for item in resources.dashboards.iterDashboards({"fields": ["id", "label"]}):
+                print(item)
+            ```
+        """
+        queryObj = {**(queryObj or {}), "amount": pageSize}
+        yield from paginate(
+            lambda page: self.listDashboard({**queryObj, "page": page}),
+            pageSize,
+            queryObj.get("page") or 1,
+            prefetch,
+        )
+
     class CreateDashboardResponse(TypedDict):
         dashboard: GenericID
 
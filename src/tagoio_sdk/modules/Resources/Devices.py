@@ -1,3 +1,4 @@
+from typing import Iterator
 from typing import List
 from typing import Optional
 from typing import Union
@@ -8,6 +9,10 @@ from tagoio_sdk.common.Common_Type import DataEdit
 from tagoio_sdk.common.Common_Type import GenericID
 from tagoio_sdk.common.Common_Type import GenericToken
 from tagoio_sdk.common.Common_Type import TokenCreateResponse
+from tagoio_sdk.common.pagination import DEFAULT_MAX_WORKERS
+from tagoio_sdk.common.pagination import DEFAULT_PAGE_SIZE
+from tagoio_sdk.common.pagination import fetchAllPages
+from tagoio_sdk.common.pagination import paginate
 from tagoio_sdk.common.tagoio_module import TagoIOModule
 from tagoio_sdk.modules.Device.Device_Type import DataQuery
 from tagoio_sdk.modules.Device.Device_Type import DeviceInfo
@@ -24,11 +29,37 @@ from tagoio_sdk.modules.Resources.Device_Type import DeviceQuery
 from tagoio_sdk.modules.Resources.Device_Type import DeviceTokenDataList
 from tagoio_sdk.modules.Resources.Device_Type import ListDeviceTokenQuery
 from tagoio_sdk.modules.Resources.Device_Type import TokenData
+from tagoio_sdk.modules.Utils.dataHistory import DEFAULT_EXPORT_SHARDS
+from tagoio_sdk.modules.Utils.dataHistory import DEFAULT_HISTORY_PAGE_SIZE
+from tagoio_sdk.modules.Utils.dataHistory import exportDataHistory
+from tagoio_sdk.modules.Utils.dataHistory import iterDataHistory
 from tagoio_sdk.modules.Utils.dateParser import dateParser
 from tagoio_sdk.modules.Utils.dateParser import dateParserList
 
 
+DEVICE_DATE_FIELDS = ["last_input", "last_output", "updated_at", "created_at", "inspected_at"]
+
+
 class Devices(TagoIOModule):
+    def _listDeviceParams(self, queryObj: Optional[DeviceQuery]) -> dict:
+        if queryObj is None:
+            queryObj = {}
+        if "orderBy" in queryObj:
+            firstArgument = queryObj["orderBy"][0]
+            seccondArgument = queryObj["orderBy"][1]
+            orderBy = f"{firstArgument},{seccondArgument}"
+        else:
+            orderBy = "name,asc"
+
+        return {
+            "page": queryObj.get("page") or 1,
+            "fields": queryObj.get("fields") or ["id", "name"],
+            "filter": queryObj.get("filter") or {},
+            "amount": queryObj.get("amount") or 20,
+            "orderBy": orderBy,
+            "resolveBucketName": queryObj.get("resolveBucketName") or False,
+        }
+
     def listDevice(self, queryObj: DeviceQuery = None) -> list[DeviceListItem]:
         """
         @description:
@@ -51,43 +82,95 @@ class Devices(TagoIOModule):
             print(devices)  # [{'id': 'device-id-123', 'name': 'Temperature Sensor', ...}]
             ```
         """
-        if queryObj is None:
-            queryObj = {}
-        if "orderBy" in queryObj:
-            firstArgument = queryObj["orderBy"][0]
-            seccondArgument = queryObj["orderBy"][1]
-            orderBy = f"{firstArgument},{seccondArgument}"
-        else:
-            orderBy = "name,asc"
-
         result = self.doRequest(
             {
                 "path": "/device",
                 "method": "GET",
-                "params": {
-                    "page": queryObj.get("page") or 1,
-                    "fields": queryObj.get("fields") or ["id", "name"],
-                    "filter": queryObj.get("filter") or {},
-                    "amount": queryObj.get("amount") or 20,
-                    "orderBy": orderBy,
-                    "resolveBucketName": queryObj.get("resolveBucketName") or False,
-                },
+                "params": self._listDeviceParams(queryObj),
             }
         )
 
-        result = dateParserList(
-            result,
-            [
-                "last_input",
-                "last_output",
-                "updated_at",
-                "created_at",
-                "inspected_at",
-            ],
-        )
+        result = dateParserList(result, DEVICE_DATE_FIELDS)
 
         return result
 
+    def listDeviceStream(self, queryObj: DeviceQuery = None, spillToFile: bool = False) -> Iterator[DeviceListItem]:
+        """
+        @description:
+            Same as `listDevice`, but yields the devices while the response is downloaded,
+            so memory stays flat for large `amount` values.
+            Pass `spillToFile=True` to download the response to a temporary file first.
+
+        @example:
+            If receive an error "Authorization Denied", check policy **Device** / **Access** in Access Management.
+            ```python
+            resources = Resources()
+            for device in resources.devices.listDeviceStream({"amount": 10000, "fields": ["id", "name"]}):
+                print(device["name"])
+            ```
+        """
+        stream = self.doRequestStream(
+            {
+                "path": "/device",
+                "method": "GET",
+                "params": self._listDeviceParams(queryObj),
+                "spillToFile": spillToFile,
+            }
+        )
+
+        for device in stream:
+            yield dateParser(device, DEVICE_DATE_FIELDS)
+
+    def iterDevices(
+        self, queryObj: DeviceQuery = None, pageSize: int = DEFAULT_PAGE_SIZE, prefetch: bool = False
+    ) -> Iterator[DeviceListItem]:
+        """
+        @description:
+            Same as `listDevice`, but walks through every page, requesting them as the
+            devices are consumed. Pass `prefetch=True` to request the next page while
+            the current one is processed.
+
+        @example:
+            If receive an error "Authorization Denied", check policy **Device** / **Access** in Access Management.
+            ```python
+            resources = Resources()
+            for device in resources.devices.iterDevices({"filter": {"tags": [{"key": "site", "value": "north"}]}}):
+                print(device["name"])
+            ```
+        """
+        queryObj = {**(queryObj or {}), "amount": pageSize}
+        yield from paginate(
+            lambda page: self.listDevice({**queryObj, "page": page}),
+            pageSize,
+            queryObj.get("page") or 1,
+            prefetch,
+        )
+
+    def listAllDevices(
+        self, queryObj: DeviceQuery = None, pageSize: int = DEFAULT_PAGE_SIZE, maxWorkers: int = DEFAULT_MAX_WORKERS
+    ) -> list[DeviceListItem]:
+        """
+        @description:
+            Same as `listDevice`, but returns the devices of every page, requesting up to
+            `maxWorkers` pages at once. Devices are in page order, and a device moving to
+            another page during the scan is only returned once (by `id`, so keep it in `fields`).
+
+        @example:
+            If receive an error "Authorization Denied", check policy **Device** / **Access** in Access Management.
+            ```python
+            resources = Resources()
+            inventory = resources.devices.listAllDevices({"fields": ["id", "name", "last_input"]}, pageSize=1000)
+            print(len(inventory))
+            ```
+        """
+        queryObj = {**(queryObj or {}), "amount": pageSize}
+        return fetchAllPages(
+            lambda page: self.listDevice({**queryObj, "page": page}),
+            pageSize,
+            queryObj.get("page") or 1,
+            maxWorkers,
+        )
+
     def create(self, deviceObj: DeviceCreateInfo) -> DeviceCreateResponse:
         """
         @description:
@@ -364,6 +447,33 @@ class Devices(TagoIOModule):
 
         return result
 
+    def iterTokens(
+        self,
+        deviceID: GenericID,
+        queryObj: ListDeviceTokenQuery = None,
+        pageSize: int = DEFAULT_PAGE_SIZE,
+        prefetch: bool = False,
+    ) -> Iterator[DeviceTokenDataList]:
+        """
+        @description:
+            Same as `tokenList`, but walks through every page of tokens of the device.
+
+        @example:
+            If receive an error "Authorization Denied", check policy **Device** / **Access** in Access Management.
+            ```python
+            resources = Resources()
+            for token in resources.devices.iterTokens("device-id-123", {"fields": ["name", "token"]}):
+                print(token["name"])
+            ```
+        """
+        queryObj = {**(queryObj or {}), "amount": pageSize}
+        yield from paginate(
+            lambda page: self.tokenList(deviceID, {**queryObj, "page": page}),
+            pageSize,
+            queryObj.get("page") or 1,
+            prefetch,
+        )
+
     def tokenCreate(self, deviceID: GenericID, tokenParams: TokenData) -> TokenCreateResponse:
         """
         @description:
@@ -451,6 +561,97 @@ class Devices(TagoIOModule):
         )
         return dateParserList(result, ["time", "created_at"])
 
+    def iterDeviceData(
+        self,
+        deviceID: GenericID,
+        queryParams: DataQuery = None,
+        pageSize: int = DEFAULT_HISTORY_PAGE_SIZE,
+        prefetch: bool = False,
+    ) -> Iterator[Data]:
+        """
+        @description:
+            Goes through the whole data history of the device matching the query, oldest
+            records first unless `ordination` is "descending". Each page starts at the time
+            of the last record read instead of using `skip`, so pages deep into the history
+            are as fast as the first one. Pass `prefetch=True` to request the next page while
+            the current one is processed.
+
+        @example:
+            If receive an error "Authorization Denied", check policy **Device** / **Access** in Access Management.
+            ```python
+            resources = Resources()
+            for data in resources.devices.iterDeviceData("device-id-123", {
+                "variables": ["temperature"],
+                "start_date": "2024-01-01T00:00:00Z",
+            }, pageSize=5000, prefetch=True):
+                print(data["time"], data["value"])
+            ```
+        """
+        yield from iterDataHistory(
+            lambda query: self.getDeviceData(deviceID, query), queryParams, pageSize, prefetch
+        )
+
+    def exportDeviceData(
+        self,
+        deviceID: GenericID,
+        queryParams: DataQuery,
+        shards: int = DEFAULT_EXPORT_SHARDS,
+        maxWorkers: int = DEFAULT_MAX_WORKERS,
+        splitVariables: bool = False,
+        pageSize: int = DEFAULT_HISTORY_PAGE_SIZE,
+    ) -> Iterator[Data]:
+        """
+        @description:
+            Same as `iterDeviceData`, but splits the `start_date`/`end_date` range of the query
+            in `shards` time ranges (and by variable with `splitVariables`) and requests up to
+            `maxWorkers` of them at once. Records still come in time order, and a record at the
+            boundary of two shards is only returned once. `end_date` defaults to now.
+
+        @example:
+            If receive an error "Authorization Denied", check policy **Device** / **Access** in Access Management.
+            ```python
+            resources = Resources()
+            for data in resources.devices.exportDeviceData("device-id-123", {
+                "variables": ["temperature", "humidity"],
+                "start_date": "2024-01-01T00:00:00Z",
+                "end_date": "2025-01-01T00:00:00Z",
+            }, shards=52, maxWorkers=8, splitVariables=True):
+                print(data["time"], data["variable"], data["value"])
+            ```
+        """
+        yield from exportDataHistory(
+            lambda query: self.getDeviceData(deviceID, query), queryParams, shards, maxWorkers, splitVariables, pageSize
+        )
+
+    def getDeviceDataStream(
+        self, deviceID: GenericID, queryParams: DataQuery = None, spillToFile: bool = False
+    ) -> Iterator[Data]:
+        """
+        @description:
+            Same as `getDeviceData`, but yields each data record while the response is
+            downloaded and parses its dates, so memory stays flat for large `qty` values.
+            Pass `spillToFile=True` to download the response to a temporary file first.
+
+        @example:
+            If receive an error "Authorization Denied", check policy **Device** / **Access** in Access Management.
+            ```python
+            resources = Resources()
+            for data in resources.devices.getDeviceDataStream("device-id-123", {"qty": 10000}):
+                print(data["variable"], data["value"], data["time"])
+            ```
+        """
+        stream = self.doRequestStream(
+            {
+                "path": f"/device/{deviceID}/data",
+                "method": "GET",
+                "params": queryParams or {},
+                "spillToFile": spillToFile,
+            }
+        )
+
+        for data in stream:
+            yield dateParser(data, ["time", "created_at"])
+
     def emptyDeviceData(self, deviceID: GenericID) -> str:
         """
         @description:
@@ -475,10 +676,14 @@ class Devices(TagoIOModule):
         )
         return result
 
-    def sendDeviceData(self, deviceID: GenericID, data: Union[DataCreate, list[DataCreate]]) -> str:
+    def sendDeviceData(
+        self, deviceID: GenericID, data: Union[DataCreate, list[DataCreate], bytes], compress: bool = False
+    ) -> str:
         """
         @description:
             Sends data to a device. Accepts a single data object or an array of data objects.
+            Data already serialized to JSON bytes is sent as is. Pass `compress=True` to gzip
+            bodies larger than the compression threshold, saving bandwidth on metered links.
 
         @see:
             https://help.tago.io/portal/en/kb/articles/device-data Device Data Management
@@ -500,6 +705,9 @@ class Devices(TagoIOModule):
                 {"variable": "humidity", "value": 60}
             ])
             print(result)  # Successfully Inserted
+            # Send a batch serialized beforehand
+            from tagoio_sdk.infrastructure.json_codec import dumps
+            result = resources.devices.sendDeviceData("device-id-123", dumps(batch))
             ```
         """
         result = self.doRequest(
@@ -507,15 +715,19 @@ class Devices(TagoIOModule):
                 "path": f"/device/{deviceID}/data",
                 "method": "POST",
                 "body": data,
+                "compress": compress,
             }
         )
 
         return result
 
-    def editDeviceData(self, deviceID: GenericID, updatedData: Union[DataEdit, list[DataEdit]]) -> str:
+    def editDeviceData(
+        self, deviceID: GenericID, updatedData: Union[DataEdit, list[DataEdit]], compress: bool = False
+    ) -> str:
         """
         @description:
             Modifies existing data records in a device. Requires the data record ID.
+            Pass `compress=True` to gzip bodies larger than the compression threshold.
 
         @see:
             https://help.tago.io/portal/en/kb/articles/device-data Device Data Management
@@ -542,6 +754,7 @@ class Devices(TagoIOModule):
                 "path": f"/device/{deviceID}/data",
                 "method": "PUT",
                 "body": updatedData,
+                "compress": compress,
             }
         )
 
@@ -1,9 +1,12 @@
 from typing import Dict
+from typing import Iterator
 from typing import List
 from typing import Optional
 
 from tagoio_sdk.common import Cache
 from tagoio_sdk.common.Common_Type import GenericID
+from tagoio_sdk.common.pagination import DEFAULT_PAGE_SIZE
+from tagoio_sdk.common.pagination import paginate
 from tagoio_sdk.common.tagoio_module import TagoIOModule
 from tagoio_sdk.modules.Resources.Dictionaries_Types import DictionaryCreateInfo
 from tagoio_sdk.modules.Resources.Dictionaries_Types import DictionaryInfo
@@ -61,6 +64,34 @@ class Dictionaries(TagoIOModule):
 
         return result
 
+    def iterDictionaries(
+        self,
+        queryObj: Optional[DictionaryQuery] = None,
+        pageSize: int = DEFAULT_PAGE_SIZE,
+        prefetch: bool = False,
+    ) -> Iterator[DictionaryInfo]:
+        """
+        @description:
+            Same as `list`, but walks through every page of dictionaries, requesting them
+            as the items are consumed. Pass `prefetch=True` to request the next page while
+            the current one is processed.
+
+        @example:
+            If receive an error "Authorization Denied", check policy **Dictionary** / **Access** in Access Management.
+            ```python
+            resources = Resources()
+            for item in resources.dictionaries.iterDictionaries({"fields": ["id", "slug"]}):
+                print(item)
+            ```
+        """
+        queryObj = {**(queryObj or {}), "amount": pageSize}
+        yield from paginate(
+            lambda page: self.list({**queryObj, "page": page}),
+            pageSize,
+            queryObj.get("page") or 1,
+            prefetch,
+        )
+
     def create(self, dictionaryObj: DictionaryCreateInfo) -> Dict[str, str]:
         """
         @description:
@@ -1,18 +1,37 @@
+import contextvars
+import fnmatch
 import time
 
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import wait
 from typing import Any
 from typing import Dict
+from typing import Iterator
 from typing import List
 from typing import Optional
+from typing import Tuple
 
+from tagoio_sdk import config
 from tagoio_sdk.common.tagoio_module import TagoIOModule
+from tagoio_sdk.infrastructure.api_request import TagoIODeadlineError
+from tagoio_sdk.infrastructure.deadline import attemptTimeout
+from tagoio_sdk.infrastructure.deadline import remainingTime
+from tagoio_sdk.infrastructure.rate_limiter import isThrottled
+from tagoio_sdk.infrastructure.tracing import currentSpan
+from tagoio_sdk.infrastructure.tracing import propagateContext
+from tagoio_sdk.infrastructure.tracing import span
+from tagoio_sdk.infrastructure.tracing import traced
 from tagoio_sdk.modules.Resources.Files_Types import Base64File
 from tagoio_sdk.modules.Resources.Files_Types import CopyFiles
+from tagoio_sdk.modules.Resources.Files_Types import FileInfo
 from tagoio_sdk.modules.Resources.Files_Types import FileListInfo
 from tagoio_sdk.modules.Resources.Files_Types import FileQuery
 from tagoio_sdk.modules.Resources.Files_Types import FilesPermission
 from tagoio_sdk.modules.Resources.Files_Types import MoveFiles
 from tagoio_sdk.modules.Resources.Files_Types import UploadOptions
+from tagoio_sdk.modules.Resources.Files_Types import WalkOptions
 from tagoio_sdk.modules.Utils.dateParser import dateParserList
 from tagoio_sdk.regions import getConnectionURI
 
@@ -58,6 +77,71 @@ class Files(TagoIOModule):
 
         return result
 
+    def walk(self, path: str = "/", options: Optional[WalkOptions] = None) -> Iterator[Tuple[str, FileInfo]]:
+        """
+        @description:
+            Walks through a folder and all its sub-folders, yielding `(path, file_info)`
+            for every file. Folders are listed concurrently and every page of a folder
+            is followed, so the files come in no particular order.
+            Filter with `include`/`exclude` globs and stop at `maxDepth` levels of sub-folders.
+
+        @see:
+            https://help.tago.io/portal/en/kb/articles/127-files Files
+
+        @example:
+            If receive an error "Authorization Denied", check policy **File** / **Access** in Access Management.
+            ```python
+            resources = Resources()
+            for path, file in resources.files.walk("/reports", {"include": ["*.csv"], "exclude": ["/reports/tmp/*"]}):
+                print(path, file["size"])
+            ```
+        """
+        options = options or {}
+        include = options.get("include")
+        exclude = options.get("exclude") or []
+        maxDepth = options.get("maxDepth")
+        quantity = options.get("quantity", 300)
+        maxWorkers = options.get("maxWorkers", 8)
+
+        def matches(filePath: str, patterns: List[str]) -> bool:
+            return any(fnmatch.fnmatchcase(filePath, pattern) for pattern in patterns)
+
+        def listPage(folder: str, depth: int, paginationToken: Optional[str]) -> Tuple[str, int, FileListInfo]:
+            query = {"path": folder, "quantity": quantity, "paginationToken": paginationToken}
+            return folder, depth, self.list(query)
+
+        root = "/" + path.strip("/")
+        queue = deque([(root, 0, None)])
+        executor = ThreadPoolExecutor(max_workers=maxWorkers, thread_name_prefix="tagoio-walk")
+        pending = set()
+        try:
+            while queue or pending:
+                while queue and len(pending) < maxWorkers:
+                    pending.add(executor.submit(contextvars.copy_context().run, listPage, *queue.popleft()))
+
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    folder, depth, result = future.result()
+                    if result.get("pagination_token"):
+                        queue.append((folder, depth, result["pagination_token"]))
+
+                    if maxDepth is None or depth < maxDepth:
+                        for name in result.get("folders") or []:
+                            subfolder = f"{folder.rstrip('/')}/{name.strip('/')}"
+                            if not matches(subfolder, exclude) and not matches(subfolder + "/", exclude):
+                                queue.append((subfolder, depth + 1, None))
+
+                    for file in result.get("files") or []:
+                        filename = file["filename"]
+                        filePath = filename if filename.startswith("/") else f"{folder.rstrip('/')}/{filename}"
+                        if include is not None and not matches(filePath, include):
+                            continue
+                        if matches(filePath, exclude):
+                            continue
+                        yield filePath, file
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
     def uploadBase64(self, fileList: List[Base64File]) -> str:
         """
         @description:
@@ -370,8 +454,6 @@ class Files(TagoIOModule):
 
         import io
 
-        import requests
-
         from requests_toolbelt.multipart.encoder import MultipartEncoder
 
         # Create multipart form data with proper content type
@@ -394,7 +476,7 @@ class Files(TagoIOModule):
         api_url = getConnectionURI(self.region)["api"]
         url = f"{api_url}{path}"
 
-        response = requests.post(url=url, data=multipart, headers=headers)
+        response = self.session.post(url=url, data=multipart, headers=headers, timeout=attemptTimeout())
 
         if response.status_code >= 200 and response.status_code < 300:
             result = response.json().get("result", {})
@@ -420,7 +502,8 @@ class Files(TagoIOModule):
         """
         Adds an upload to the queue.
         It will try to upload for 'opts.maxTriesForEachChunk' and fail
-        if it couldn't upload after those many tries.
+        if it couldn't upload after those many tries, or as soon as the
+        deadline leaves no time for another try.
         """
         options = options or {}
         max_tries = options.get("maxTriesForEachChunk", 5)
@@ -436,6 +519,11 @@ class Files(TagoIOModule):
                 if is_limit_error(ex):
                     raise ValueError(str(ex)) from ex
 
+                remaining = remainingTime()
+                if remaining is not None and timeout / 1000 + config.tagoSDKconfig["retry"]["minAttemptTime"] > remaining:
+                    raise TagoIODeadlineError(f"Deadline exceeded uploading part number {part_number}: {ex}") from ex
+
+                currentSpan().add_event("retry", {"tagoio.attempt": tries + 1, "tagoio.delay": timeout / 1000})
                 time.sleep(timeout / 1000)  # Convert ms to seconds
 
                 tries += 1
@@ -475,6 +563,7 @@ class Files(TagoIOModule):
 
         return result
 
+    @traced("TagoIO Files.uploadFile")
     def uploadFile(self, file: bytes, filename: str, options: Optional[UploadOptions] = None) -> Dict[str, str]:
         """
         @description:
@@ -540,7 +629,8 @@ class Files(TagoIOModule):
         def process_chunk(start: int, end: int, p_num: int) -> None:
             try:
                 sliced = file[start:end]
-                part_data = self._addToQueue(filename, upload_id, p_num, sliced, options)
+                with span("TagoIO Files.uploadPart", {"tagoio.part_number": p_num, "tagoio.part_size": len(sliced)}):
+                    part_data = self._addToQueue(filename, upload_id, p_num, sliced, options)
                 result_queue.put(("success", part_data, p_num))
             except Exception as e:
                 result_queue.put(("error", str(e), p_num))
@@ -582,7 +672,7 @@ class Files(TagoIOModule):
 
             # Start a new upload thread
             thread = threading.Thread(
-                target=process_chunk, args=(offset_start, min(offset_end, file_size), part_number)
+                target=propagateContext(process_chunk), args=(offset_start, min(offset_end, file_size), part_number)
             )
             thread.start()
             active_threads.add(thread)
@@ -662,7 +752,4 @@ def is_limit_error(error: Exception) -> bool:
     if not hasattr(error, "message") and not isinstance(error, Exception):
         return False
 
-    message = str(error)
-
-    # TODO: Use status code instead of string error message when available.
-    return message.startswith("You have exceeded the maximum limit")
+    return isThrottled(getattr(error, "statusCode", None), str(error))
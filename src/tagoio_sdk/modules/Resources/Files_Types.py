@@ -2,6 +2,7 @@ from datetime import datetime
 from typing import Any
 from typing import Callable
 from typing import List
+from typing import NotRequired
 from typing import Optional
 from typing import TypedDict
 
@@ -19,8 +20,34 @@ class FileInfo(TypedDict):
 
 
 class FileListInfo(TypedDict):
+    total: NotRequired[int]
+    usage: NotRequired[float]
     files: List[FileInfo]
     folders: List[str]
+    pagination_token: NotRequired[Optional[str]]
+    """Token of the next page, missing on the last one"""
+
+
+class WalkOptions(TypedDict, total=False):
+    include: List[str]
+    """
+    Glob patterns of the file paths to yield, such as "*.csv" or "/reports/*".
+    `*` also matches `/`. Default: every file
+    """
+    exclude: List[str]
+    """Glob patterns of the file paths to skip, folders matching them aren't listed"""
+    maxDepth: int
+    """
+    Levels of sub-folders to go into, 0 only lists the starting folder.
+    Default: no limit
+    """
+    quantity: int
+    """Files asked for each page, up to 300"""
+    maxWorkers: int
+    """
+    Folder pages requested at once
+    Default: 8
+    """
 
 
 class Base64File(TypedDict, total=False):
@@ -1,4 +1,5 @@
 from typing import Dict
+from typing import Iterator
 from typing import List
 from typing import Optional
 
@@ -8,8 +9,11 @@ from tagoio_sdk.common.Common_Type import Query
 from tagoio_sdk.common.Common_Type import TokenCreateResponse
 from tagoio_sdk.common.Common_Type import TokenData
 from tagoio_sdk.common.Common_Type import TokenDataList
+from tagoio_sdk.common.pagination import DEFAULT_PAGE_SIZE
+from tagoio_sdk.common.pagination import paginate
 from tagoio_sdk.common.tagoio_module import TagoIOModule
 from tagoio_sdk.modules.Resources.Profile_Type import AuditLog
+from tagoio_sdk.modules.Resources.Profile_Type import AuditLogEvent
 from tagoio_sdk.modules.Resources.Profile_Type import AuditLogFilter
 from tagoio_sdk.modules.Resources.Profile_Type import ProfileCreateInfo
 from tagoio_sdk.modules.Resources.Profile_Type import ProfileCredentials
@@ -148,6 +152,35 @@ class Profile(TagoIOModule):
 
         return result
 
+    def iterTokens(
+        self,
+        profileID: GenericID,
+        queryObj: Optional[Query] = None,
+        pageSize: int = DEFAULT_PAGE_SIZE,
+        prefetch: bool = False,
+    ) -> Iterator[TokenDataList]:
+        """
+        @description:
+            Same as `tokenList`, but walks through every page of tokens, requesting them
+            as the items are consumed. Pass `prefetch=True` to request the next page while
+            the current one is processed.
+
+        @example:
+            If receive an error "Authorization Denied", check policy **Profile** / **Access** in Access Management.
+            ```python
+            resources = Resources()
+            for item in resources.profile.iterTokens("profile-id-123", {"fields": ["name", "token"]}):
+                print(item)
+            ```
+        """
+        queryObj = {**(queryObj or {}), "amount": pageSize}
+        yield from paginate(
+            lambda page: self.tokenList(profileID, {**queryObj, "page": page}),
+            pageSize,
+            queryObj.get("page") or 1,
+            prefetch,
+        )
+
     def create(self, profileObj: ProfileCreateInfo, allocate_free_resources: bool = False) -> Dict[str, GenericID]:
         """
         @description:
@@ -274,6 +307,35 @@ class Profile(TagoIOModule):
 
         return result
 
+    def auditLogStream(
+        self, profileID: GenericID, filterObj: Optional[AuditLogFilter] = None, spillToFile: bool = False
+    ) -> Iterator[AuditLogEvent]:
+        """
+        @description:
+            Same as `auditLog`, but yields the events while the response is downloaded,
+            so memory stays flat for large audit logs.
+            Pass `spillToFile=True` to download the response to a temporary file first.
+
+        @example:
+            ```python
+            resources = Resources({"token": "YOUR-PROFILE-TOKEN"})
+            for event in resources.profile.auditLogStream("profile-id-123", {"start_date": "2024-12-01"}):
+                print(event["date"], event["actionType"])
+            ```
+        """
+        stream = self.doRequestStream(
+            {
+                "path": f"/profile/{profileID}/auditlog",
+                "method": "GET",
+                "params": filterObj or {},
+                "spillToFile": spillToFile,
+            },
+            itemsPath=("result", "events"),
+        )
+
+        for event in stream:
+            yield dateParser(event, ["date"])
+
     def auditLogQuery(self, profileID: GenericID, queryId: str) -> AuditLog:
         """
         @description:
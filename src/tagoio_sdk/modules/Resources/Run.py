@@ -1,8 +1,11 @@
 from typing import Dict
+from typing import Iterator
 from typing import Optional
 
 from tagoio_sdk.common.Common_Type import GenericID
 from tagoio_sdk.common.Common_Type import Query
+from tagoio_sdk.common.pagination import DEFAULT_PAGE_SIZE
+from tagoio_sdk.common.pagination import paginate
 from tagoio_sdk.common.tagoio_module import TagoIOModule
 from tagoio_sdk.modules.Resources.Notification_Type import NotificationCreate
 from tagoio_sdk.modules.Resources.Notification_Type import NotificationCreateReturn
@@ -95,32 +98,90 @@ class Run(TagoIOModule):
             print(result)  # [{'id': 'user-id-123', 'name': 'John Doe', 'email': 'example@email.com'}]
             ```
         """
-        if query is None:
-            query = {}
-        if "orderBy" in query:
-            firstArgument = query["orderBy"][0]
-            secondArgument = query["orderBy"][1]
-            orderBy = f"{firstArgument},{secondArgument}"
-        else:
-            orderBy = "name,asc"
-
         result = self.doRequest(
             {
                 "path": "/run/users",
                 "method": "GET",
-                "params": {
-                    "page": query.get("page") or 1,
-                    "fields": query.get("fields") or ["id", "name"],
-                    "filter": query.get("filter") or {},
-                    "amount": query.get("amount") or 20,
-                    "orderBy": orderBy,
-                },
+                "params": self._listUsersParams(query),
             }
         )
         result = dateParserList(result, ["created_at", "updated_at", "last_login"])
 
         return result
 
+    def listUsersStream(self, query: Optional[Query] = None, spillToFile: bool = False) -> Iterator[UserInfo]:
+        """
+        @description:
+            Same as `listUsers`, but yields the users while the response is downloaded,
+            so memory stays flat for large `amount` values.
+            Pass `spillToFile=True` to download the response to a temporary file first.
+
+        @example:
+            If receive an error "Authorization Denied", or return empty list check policy **Run User** / **Access** in Access Management.
+            ```python
+            resources = Resources()
+            for user in resources.run.listUsersStream({"amount": 10000, "fields": ["id", "email"]}):
+                print(user["email"])
+            ```
+        """
+        stream = self.doRequestStream(
+            {
+                "path": "/run/users",
+                "method": "GET",
+                "params": self._listUsersParams(query),
+                "spillToFile": spillToFile,
+            }
+        )
+
+        for user in stream:
+            yield dateParser(user, ["created_at", "updated_at", "last_login"])
+
+    def iterUsers(
+        self,
+        query: Optional[Query] = None,
+        pageSize: int = DEFAULT_PAGE_SIZE,
+        prefetch: bool = False,
+    ) -> Iterator[UserInfo]:
+        """
+        @description:
+            Same as `listUsers`, but walks through every page of users, requesting them
+            as the items are consumed. Pass `prefetch=True` to request the next page while
+            the current one is processed.
+
+        @example:
+            If receive an error "Authorization Denied", check policy **Run User** / **Access** in Access Management.
+            ```python
+            resources = Resources()
+            for item in resources.run.iterUsers({"fields": ["id", "email"]}):
+                print(item)
+            ```
+        """
+        query = {**(query or {}), "amount": pageSize}
+        yield from paginate(
+            lambda page: self.listUsers({**query, "page": page}),
+            pageSize,
+            query.get("page") or 1,
+            prefetch,
+        )
+
+    def _listUsersParams(self, query: Optional[Query]) -> dict:
+        if query is None:
+            query = {}
+        if "orderBy" in query:
+            firstArgument = query["orderBy"][0]
+            secondArgument = query["orderBy"][1]
+            orderBy = f"{firstArgument},{secondArgument}"
+        else:
+            orderBy = "name,asc"
+
+        return {
+            "page": query.get("page") or 1,
+            "fields": query.get("fields") or ["id", "name"],
+            "filter": query.get("filter") or {},
+            "amount": query.get("amount") or 20,
+            "orderBy": orderBy,
+        }
+
     def userInfo(self, userID: GenericID) -> UserInfo:
         """
         @description:
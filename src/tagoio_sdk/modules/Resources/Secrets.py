@@ -1,8 +1,11 @@
 from typing import Dict
+from typing import Iterator
 from typing import List
 from typing import Optional
 
 from tagoio_sdk.common.Common_Type import GenericID
+from tagoio_sdk.common.pagination import DEFAULT_PAGE_SIZE
+from tagoio_sdk.common.pagination import paginate
 from tagoio_sdk.common.tagoio_module import TagoIOModule
 from tagoio_sdk.modules.Resources.Secrets_Type import SecretsCreate
 from tagoio_sdk.modules.Resources.Secrets_Type import SecretsEdit
@@ -54,6 +57,34 @@ class Secrets(TagoIOModule):
 
         return result
 
+    def iterSecrets(
+        self,
+        queryObj: Optional[SecretsQuery] = None,
+        pageSize: int = DEFAULT_PAGE_SIZE,
+        prefetch: bool = False,
+    ) -> Iterator[SecretsInfo]:
+        """
+        @description:
+            Same as `list`, but walks through every page of secrets, requesting them
+            as the items are consumed. Pass `prefetch=True` to request the next page while
+            the current one is processed.
+
+        @example:
+            If receive an error "Authorization Denied", check policy **Secrets** / **Access** in Access Management.
+            ```python
+            resources = Resources()
+            for item in resources.secrets.iterSecrets({"fields": ["id", "key"]}):
+                print(item)
+            ```
+        """
+        queryObj = {**(queryObj or {}), "amount": pageSize}
+        yield from paginate(
+            lambda page: self.list({**queryObj, "page": page}),
+            pageSize,
+            queryObj.get("page") or 1,
+            prefetch,
+        )
+
     def info(self, secretID: GenericID) -> SecretsInfo:
         """
         @description:
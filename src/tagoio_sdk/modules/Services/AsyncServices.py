@@ -0,0 +1,15 @@
+from typing import Optional
+
+from tagoio_sdk.common.async_module import ThreadOffloadModule
+from tagoio_sdk.common.tagoio_module import GenericModuleParams
+from tagoio_sdk.modules.Services.Services import Services
+
+
+class AsyncServices(ThreadOffloadModule[Services]):
+    """
+    Asyncio version of `Services`, every method returns an awaitable.
+    The calls run on a thread pool (see `ThreadOffloadModule`).
+    """
+
+    def __init__(self, params: Optional[GenericModuleParams] = None):
+        super().__init__(Services(params))
@@ -2,9 +2,8 @@ from typing import Optional
 from typing import TypedDict
 from typing import Union
 
-import requests
-
 from tagoio_sdk.common.tagoio_module import TagoIOModule
+from tagoio_sdk.infrastructure.deadline import attemptTimeout
 
 
 class PDFResult(TypedDict):
@@ -130,9 +129,10 @@ class PDFService(TagoIOModule):
         """
         Generate a PDF from html, url or base64
         """
-        result = requests.post(
+        result = self.session.post(
             "https://pdf.middleware.tago.io",
             json=params,
             headers={"token": self.token},
+            timeout=attemptTimeout(),
         )
         return result
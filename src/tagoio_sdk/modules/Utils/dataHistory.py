@@ -0,0 +1,290 @@
+import contextvars
+import heapq
+
+from collections import deque
+from concurrent.futures import Future
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from datetime import timedelta
+from datetime import timezone
+from typing import Any
+from typing import Callable
+from typing import Iterator
+from typing import NamedTuple
+from typing import Optional
+
+import dateutil.parser
+
+from tagoio_sdk.common.Common_Type import Data
+from tagoio_sdk.common.pagination import DEFAULT_MAX_WORKERS
+from tagoio_sdk.common.pagination import paginateCursor
+from tagoio_sdk.modules.Device.Device_Type import DataQuery
+
+
+DEFAULT_HISTORY_PAGE_SIZE = 1000
+DEFAULT_EXPORT_SHARDS = 32
+
+
+class _HistoryCursor(NamedTuple):
+    time: Any
+    """Time of the last record read, the next page starts there"""
+    ids: frozenset
+    """IDs of the records already read at that time"""
+    skip: int
+    """Records at that time to skip, when a whole page shares the same time"""
+
+
+def _formatTime(value: Any) -> Any:
+    if isinstance(value, datetime):
+        if value.tzinfo is None:
+            return f"{value.isoformat(timespec='milliseconds')}Z"
+        return value.isoformat(timespec="milliseconds")
+    return value
+
+
+def _parseTime(value: Any) -> datetime:
+    date = value if isinstance(value, datetime) else dateutil.parser.parse(value)
+    if date.tzinfo is not None:
+        date = date.astimezone(timezone.utc).replace(tzinfo=None)
+    return date - timedelta(microseconds=date.microsecond % 1000)
+
+
+def _checkDefaultQuery(queryParams: DataQuery) -> None:
+    if queryParams.get("query", "default") != "default":
+        raise ValueError(
+            "Only default queries can be paged through, not " + queryParams["query"]
+        )
+
+
+def iterDataHistory(
+    getData: Callable[[dict], list[Data]],
+    queryParams: Optional[DataQuery] = None,
+    pageSize: int = DEFAULT_HISTORY_PAGE_SIZE,
+    prefetch: bool = False,
+) -> Iterator[Data]:
+    """
+    Yield every record matching a data query, one page at a time.
+
+    Instead of a growing `skip`, each page starts at the time of the last record
+    read (`start_date`, or `end_date` when descending), and the records already
+    read at that time are left out by ID. Every request costs the same no matter
+    how deep into the history it is, and only one page (two when prefetching) is
+    held in memory.
+
+    Args:
+        getData: Request one page of data with a query, such as `Device.getData`
+        queryParams: Filters of the data (variables, groups, start_date, end_date...).
+            Records come oldest first unless `ordination` is "descending". `qty` and
+            `skip` are replaced by the paging.
+        pageSize: Records requested per page
+        prefetch: Request the next page while the current one is consumed
+    """
+    queryParams = {
+        key: value
+        for key, value in (queryParams or {}).items()
+        if key not in ("qty", "skip")
+    }
+    _checkDefaultQuery(queryParams)
+
+    descending = queryParams.get("ordination") == "descending"
+    baseQuery = {
+        **queryParams,
+        "ordination": "descending" if descending else "ascending",
+        "qty": pageSize,
+    }
+    if "start_date" in baseQuery:
+        baseQuery["start_date"] = _formatTime(baseQuery["start_date"])
+    if "end_date" in baseQuery:
+        baseQuery["end_date"] = _formatTime(baseQuery["end_date"])
+
+    def fetchPage(
+        cursor: Optional[_HistoryCursor],
+    ) -> tuple[list[Data], Optional[_HistoryCursor]]:
+        query = dict(baseQuery)
+        if cursor is not None:
+            query["end_date" if descending else "start_date"] = _formatTime(cursor.time)
+            query["skip"] = cursor.skip
+
+        records = getData(query)
+        if cursor is not None:
+            newRecords = [
+                record
+                for record in records
+                if record.get("time") != cursor.time
+                or record.get("id") not in cursor.ids
+            ]
+        else:
+            newRecords = records
+
+        if len(records) < pageSize:
+            return newRecords, None
+
+        lastTime = records[-1].get("time")
+        lastIDs = frozenset(
+            record.get("id") for record in records if record.get("time") == lastTime
+        )
+        if cursor is not None and lastTime == cursor.time:
+            # The whole page shares the time of the cursor, the next one must skip past it
+            return newRecords, _HistoryCursor(
+                lastTime, cursor.ids | lastIDs, cursor.skip + len(records)
+            )
+
+        return newRecords, _HistoryCursor(lastTime, lastIDs, 0)
+
+    return paginateCursor(fetchPage, prefetch=prefetch)
+
+
+def planDataShards(
+    queryParams: DataQuery,
+    shards: int = DEFAULT_EXPORT_SHARDS,
+    splitVariables: bool = False,
+) -> list[list[DataQuery]]:
+    """
+    Split the `start_date`/`end_date` range of a data query into `shards` time
+    ranges of the same length, in the order of the query (oldest first unless
+    `ordination` is "descending").
+
+    Each time shard is a list of queries: only one, or one per variable with
+    `splitVariables`. Both dates are inclusive, so two neighbour shards share
+    the time at their boundary. `end_date` defaults to now.
+
+    Args:
+        queryParams: Data query with at least a `start_date`
+        shards: Amount of time ranges, less when the range is shorter than that in milliseconds
+        splitVariables: Also split each time range by the `variables` of the query
+    """
+    _checkDefaultQuery(queryParams)
+    if not queryParams.get("start_date"):
+        raise ValueError("A start_date is needed to split the query in shards")
+    if shards < 1:
+        raise ValueError("The amount of shards must be at least 1")
+
+    startDate = _parseTime(queryParams["start_date"])
+    endDate = _parseTime(queryParams.get("end_date") or datetime.now(timezone.utc))
+    if endDate < startDate:
+        raise ValueError("The end_date of the query is before its start_date")
+
+    step = (endDate - startDate) / shards
+    bounds = [startDate]
+    for index in range(1, shards):
+        bound = _parseTime(startDate + step * index)
+        if bound > bounds[-1]:
+            bounds.append(bound)
+    if endDate > bounds[-1] or len(bounds) == 1:
+        bounds.append(endDate)
+
+    variableGroups: list[Any] = [queryParams.get("variables")]
+    if splitVariables:
+        variables = queryParams.get("variables")
+        if not variables:
+            raise ValueError(
+                "The variables of the query are needed to split it by variable"
+            )
+        variableGroups = [variables] if isinstance(variables, str) else list(variables)
+
+    plan = []
+    for shardStart, shardEnd in zip(bounds, bounds[1:], strict=False):
+        queries = []
+        for variables in variableGroups:
+            query = {
+                **queryParams,
+                "start_date": _formatTime(shardStart),
+                "end_date": _formatTime(shardEnd),
+            }
+            if variables is not None:
+                query["variables"] = variables
+            queries.append(query)
+        plan.append(queries)
+
+    if queryParams.get("ordination") == "descending":
+        plan.reverse()
+    return plan
+
+
+def exportDataHistory(
+    getData: Callable[[dict], list[Data]],
+    queryParams: DataQuery,
+    shards: int = DEFAULT_EXPORT_SHARDS,
+    maxWorkers: int = DEFAULT_MAX_WORKERS,
+    splitVariables: bool = False,
+    pageSize: int = DEFAULT_HISTORY_PAGE_SIZE,
+) -> Iterator[Data]:
+    """
+    Yield every record matching a data query, fetching shards of its time range
+    (see `planDataShards`) concurrently.
+
+    Up to `maxWorkers` shard queries are requested at once, each one paged with
+    `iterDataHistory`. Shards are yielded in time order as soon as they and the
+    ones before them are complete, so at most `maxWorkers` shards are held in
+    memory. The queries of a time shard are merged by time, and a record
+    returned by both shards of a boundary is only yielded once (by ID).
+
+    Args:
+        getData: Request one page of data with a query, such as `Device.getData`
+        queryParams: Data query with at least a `start_date`. `qty` and `skip`
+            are replaced by the paging.
+        shards: Amount of time ranges the query is split in
+        maxWorkers: Max shard queries requested at once
+        splitVariables: Also split each time range by the `variables` of the query
+        pageSize: Records requested per page of a shard
+    """
+    plan = planDataShards(queryParams, shards, splitVariables)
+    descending = queryParams.get("ordination") == "descending"
+    tasks = iter(
+        [(index, query) for index, queries in enumerate(plan) for query in queries]
+    )
+
+    def fetchShard(query: DataQuery) -> list[Data]:
+        return list(iterDataHistory(getData, query, pageSize))
+
+    lastTime = None
+    lastIDs: set = set()
+
+    def merge(results: list[list[Data]]) -> Iterator[Data]:
+        nonlocal lastTime, lastIDs
+
+        for record in heapq.merge(
+            *results, key=lambda record: record.get("time"), reverse=descending
+        ):
+            time = record.get("time")
+            if time != lastTime:
+                lastTime, lastIDs = time, set()
+            elif record.get("id") in lastIDs:
+                continue
+            lastIDs.add(record.get("id"))
+            yield record
+
+    with ThreadPoolExecutor(
+        max_workers=maxWorkers, thread_name_prefix="tagoio-export"
+    ) as executor:
+        window: deque[tuple[int, Future]] = deque()
+        try:
+            current = 0
+            results: list[list[Data]] = []
+            while True:
+                while len(window) < maxWorkers:
+                    task = next(tasks, None)
+                    if task is None:
+                        break
+                    index, query = task
+                    window.append(
+                        (
+                            index,
+                            executor.submit(
+                                contextvars.copy_context().run, fetchShard, query
+                            ),
+                        )
+                    )
+                if not window:
+                    break
+
+                index, future = window.popleft()
+                if index != current:
+                    yield from merge(results)
+                    current, results = index, []
+                results.append(future.result())
+
+            yield from merge(results)
+        finally:
+            for _, future in window:
+                future.cancel()
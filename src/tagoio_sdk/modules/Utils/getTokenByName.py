@@ -20,11 +20,9 @@ def getTokenByName(
             "The parameter 'account' must be an instance of a TagoIO Account."
         )
 
-    tokens = account.devices.tokenList(
+    tokens = account.devices.iterTokens(
         deviceID,
         {
-            "page": 1,
-            "amount": 20,
             "fields": [
                 "name",
                 "token",
@@ -36,22 +34,15 @@ def getTokenByName(
         },
     )
 
-    if tokens is None or len(tokens) == 0:
-        return None
-
-    if names is None:
-        return tokens[0]["token"]
-
-    names = names if isinstance(names, list) else [names]
-
-    if len(names) == 0:
-        return tokens[0]["token"]
+    names = names if isinstance(names, list) or names is None else [names]
 
+    found = False
     for token in tokens:
-        if token["name"] == names[0]:
-            token = token
+        found = True
+        if not names or token["name"] in names:
+            return token["token"]
 
-    if token is None or "token" not in token:
-        raise ValueError(f"Can't find Token for {deviceID} in {names}")
+    if not found:
+        return None
 
-    return token["token"]
+    raise ValueError(f"Can't find Token for {deviceID} in {names}")
@@ -2,8 +2,9 @@ import json
 
 from typing import Union
 
-import requests
-
+from tagoio_sdk.infrastructure.deadline import attemptTimeout
+from tagoio_sdk.infrastructure.tracing import span
+from tagoio_sdk.infrastructure.tracing import traced
 from tagoio_sdk.modules.Resources.AccountDeprecated import AccountDeprecated as Account
 from tagoio_sdk.modules.Resources.Device_Type import ConfigurationParams
 from tagoio_sdk.modules.Resources.Device_Type import DeviceTokenDataList
@@ -11,6 +12,7 @@ from tagoio_sdk.modules.Resources.Resources import Resources
 from tagoio_sdk.modules.Utils.utilsType import DownlinkOptions
 
 
+@traced("TagoIO sendDownlink.getDeviceToken")
 def getDeviceToken(
     resource: Union[Account, Resources], device_id: str
 ) -> DeviceTokenDataList:
@@ -44,6 +46,7 @@ def getDeviceToken(
     )
 
 
+@traced("TagoIO sendDownlink.getNetworkId")
 def getNetworkId(resource: Union[Account, Resources], device_id: str) -> str:
     """Get the network id of a device.
 
@@ -57,6 +60,7 @@ def getNetworkId(resource: Union[Account, Resources], device_id: str) -> str:
     return device["network"]
 
 
+@traced("TagoIO sendDownlink.getMiddlewareEndpoint")
 def getMiddlewareEndpoint(resource: Union[Account, Resources], network_id: str) -> str:
     """Get the middleware endpoint of a device.
 
@@ -72,6 +76,7 @@ def getMiddlewareEndpoint(resource: Union[Account, Resources], network_id: str)
     return network["middleware_endpoint"]
 
 
+@traced("TagoIO sendDownlink.getDownlinkParams")
 def getDownlinkParams(
     resource: Union[Account, Resources], device_id: str
 ) -> Union[list[ConfigurationParams], list[None]]:
@@ -86,6 +91,7 @@ def getDownlinkParams(
     return downlink_param
 
 
+@traced("TagoIO sendDownlink.putParamInDevice")
 def putParamInDevice(
     resource: Union[Account, Resources], device_id: str, param_obj: ConfigurationParams
 ) -> None:
@@ -94,6 +100,7 @@ def putParamInDevice(
     resource.devices.paramSet(deviceID=device_id, configObj=param_obj)
 
 
+@traced("TagoIO sendDownlink")
 def sendDownlink(
     resource: Union[Account, Resources], device_id: str, dn_options: DownlinkOptions
 ) -> str:
@@ -133,11 +140,14 @@ def sendDownlink(
     if dn_options.get("confirmed") is not None:
         data.update({"confirmed": dn_options["confirmed"]})
 
-    result = requests.post(
-        url=f"https://{middleware_endpoint}/downlink",
-        data=json.dumps(data),
-        headers={"Content-Type": "application/json"},
-    )
+    with span("TagoIO sendDownlink.post", {"server.address": middleware_endpoint}) as current:
+        result = resource.devices.session.post(
+            url=f"https://{middleware_endpoint}/downlink",
+            data=json.dumps(data),
+            headers={"Content-Type": "application/json"},
+            timeout=attemptTimeout(),
+        )
+        current.set_attribute("http.response.status_code", result.status_code)
 
     if result.status_code in range(400, 500):
         raise TypeError(
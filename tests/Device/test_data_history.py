@@ -0,0 +1,148 @@
+import pytest
+
+from tagoio_sdk.infrastructure.fake_backend import FakeTagoIO
+from tagoio_sdk.modules.Device.Device import Device
+from tagoio_sdk.modules.Resources.Resources import Resources
+from tagoio_sdk.modules.Utils.dataHistory import planDataShards
+
+
+@pytest.fixture
+def tago():
+    with FakeTagoIO() as backend:
+        yield backend
+
+
+def sendHistory(token: str) -> list[int]:
+    # Records 10 to 19 share the same time, more than a page of them
+    times = [f"2024-01-01T00:00:{i:02d}Z" for i in range(10)]
+    times += ["2024-01-01T00:01:00Z"] * 10
+    times += [f"2024-01-01T00:02:{i:02d}Z" for i in range(10)]
+    Device({"token": token}).sendData(
+        [
+            {"variable": "temperature", "value": i, "time": time}
+            for i, time in enumerate(times)
+        ]
+    )
+    return list(range(len(times)))
+
+
+def testIterDataWalksTheWholeHistory(tago: FakeTagoIO):
+    _, token = tago.addDevice("Sensor")
+    values = sendHistory(token)
+    device = Device({"token": token})
+
+    result = [
+        data["value"]
+        for data in device.iterData({"variables": ["temperature"]}, pageSize=4)
+    ]
+
+    assert sorted(result) == values
+    assert result[:10] == values[:10]
+    assert result[20:] == values[20:]
+
+
+def testIterDeviceDataDescendingWithPrefetch(tago: FakeTagoIO):
+    deviceID, token = tago.addDevice("Sensor")
+    values = sendHistory(token)
+    devices = Resources({"token": "account_token"}).devices
+
+    result = list(
+        devices.iterDeviceData(
+            deviceID,
+            {"ordination": "descending", "end_date": "2024-01-01T00:02:04Z", "qty": 1},
+            pageSize=3,
+            prefetch=True,
+        )
+    )
+
+    assert sorted(data["value"] for data in result) == values[:25]
+    assert [data["value"] for data in result[:5]] == [24, 23, 22, 21, 20]
+
+
+def testIterDataRejectsFirstLastQueries(tago: FakeTagoIO):
+    _, token = tago.addDevice("Sensor")
+
+    with pytest.raises(ValueError, match="last_value"):
+        list(Device({"token": token}).iterData({"query": "last_value"}))
+
+
+def testPlanDataShards():
+    plan = planDataShards(
+        {
+            "variables": ["temperature", "humidity"],
+            "start_date": "2024-01-01T00:00:00Z",
+            "end_date": "2024-01-01T01:00:00Z",
+        },
+        shards=4,
+        splitVariables=True,
+    )
+
+    assert len(plan) == 4
+    assert [query["variables"] for query in plan[0]] == ["temperature", "humidity"]
+    assert [(queries[0]["start_date"], queries[0]["end_date"]) for queries in plan] == [
+        ("2024-01-01T00:00:00.000Z", "2024-01-01T00:15:00.000Z"),
+        ("2024-01-01T00:15:00.000Z", "2024-01-01T00:30:00.000Z"),
+        ("2024-01-01T00:30:00.000Z", "2024-01-01T00:45:00.000Z"),
+        ("2024-01-01T00:45:00.000Z", "2024-01-01T01:00:00.000Z"),
+    ]
+
+    descending = planDataShards(
+        {
+            "start_date": "2024-01-01T00:00:00Z",
+            "end_date": "2024-01-01T00:00:00.002Z",
+            "ordination": "descending",
+        },
+        shards=10,
+    )
+    assert [queries[0]["start_date"] for queries in descending] == [
+        "2024-01-01T00:00:00.001Z",
+        "2024-01-01T00:00:00.000Z",
+    ]
+
+    with pytest.raises(ValueError, match="start_date"):
+        planDataShards({"end_date": "2024-01-01T00:00:00Z"})
+
+
+def testExportDeviceDataMergesShardsInOrder(tago: FakeTagoIO):
+    deviceID, token = tago.addDevice("Sensor")
+    values = sendHistory(token)
+    Device({"token": token}).sendData(
+        [
+            {
+                "variable": "humidity",
+                "value": 100 + i,
+                "time": f"2024-01-01T00:00:{i:02d}Z",
+            }
+            for i in range(10)
+        ]
+    )
+    devices = Resources({"token": "account_token"}).devices
+    query = {
+        "variables": ["temperature", "humidity"],
+        "start_date": "2024-01-01T00:00:00Z",
+        "end_date": "2024-01-01T00:02:09Z",
+    }
+
+    result = list(
+        devices.exportDeviceData(
+            deviceID, query, shards=13, maxWorkers=4, splitVariables=True, pageSize=3
+        )
+    )
+
+    assert len(result) == len({data["id"] for data in result}) == len(values) + 10
+    assert [data["time"] for data in result] == sorted(data["time"] for data in result)
+    assert [data["value"] for data in result if data["variable"] == "humidity"] == list(
+        range(100, 110)
+    )
+
+    descending = list(
+        devices.exportDeviceData(
+            deviceID, {**query, "ordination": "descending"}, shards=5
+        )
+    )
+    assert [data["id"] for data in descending] == [
+        data["id"]
+        for data in devices.iterDeviceData(
+            deviceID, {**query, "ordination": "descending"}
+        )
+    ]
@@ -0,0 +1,74 @@
+import gzip
+import io
+import json
+
+from requests_mock.mocker import Mocker
+
+from tagoio_sdk.modules.Device.Device import Device
+from tagoio_sdk.modules.Resources.Resources import Resources
+
+
+def mockDataList(amount: int) -> list:
+    return [{"variable": "temperature", "value": i, "unit": "C"} for i in range(amount)]
+
+
+def testCompressLargeBody(requests_mock: Mocker) -> None:
+    requests_mock.post(
+        "https://api.tago.io/device/device1/data",
+        json={"status": True, "result": "500 Data Added"},
+    )
+
+    resources = Resources({"token": "your_token_value"})
+    result = resources.devices.sendDeviceData(
+        "device1", mockDataList(500), compress=True
+    )
+
+    request = requests_mock.last_request
+    assert result == "500 Data Added"
+    assert request.headers["Content-Encoding"] == "gzip"
+    assert json.loads(gzip.decompress(request.body)) == mockDataList(500)
+
+
+def testCompressSkipsSmallBody(requests_mock: Mocker) -> None:
+    requests_mock.put(
+        "https://api.tago.io/data", json={"status": True, "result": "1 item(s) updated"}
+    )
+
+    device = Device({"token": "your_token_value"})
+    device.editData({"id": "data1", "value": 1}, compress=True)
+
+    request = requests_mock.last_request
+    assert "Content-Encoding" not in request.headers
+    assert json.loads(request.body) == {"id": "data1", "value": 1}
+
+
+def testCompressIsOptIn(requests_mock: Mocker) -> None:
+    requests_mock.post(
+        "https://api.tago.io/data", json={"status": True, "result": "500 Data Added"}
+    )
+
+    device = Device({"token": "your_token_value"})
+    device.sendData(mockDataList(500))
+
+    request = requests_mock.last_request
+    assert "Content-Encoding" not in request.headers
+    assert "gzip" in request.headers["Accept-Encoding"]
+
+
+def testStreamCompressedResponse(requests_mock: Mocker) -> None:
+    document = {
+        "status": True,
+        "result": [
+            {"id": str(i), "variable": "temperature", "value": i} for i in range(1000)
+        ],
+    }
+    requests_mock.get(
+        "https://api.tago.io/data",
+        body=io.BytesIO(gzip.compress(json.dumps(document).encode())),
+        headers={"Content-Encoding": "gzip"},
+    )
+
+    device = Device({"token": "your_token_value"})
+    stream = device.doRequestStream({"path": "/data", "method": "GET"})
+
+    assert list(stream) == document["result"]
@@ -0,0 +1,110 @@
+import asyncio
+import time
+
+import pytest
+import requests
+
+from requests_mock.mocker import Mocker
+
+from tagoio_sdk.infrastructure.api_request import TagoIODeadlineError
+from tagoio_sdk.infrastructure.api_request import TagoIORequestError
+from tagoio_sdk.infrastructure.api_request import apiRequest
+from tagoio_sdk.infrastructure.deadline import deadline
+from tagoio_sdk.infrastructure.deadline import getDeadline
+from tagoio_sdk.infrastructure.deadline import remainingTime
+from tagoio_sdk.infrastructure.retry import RetryPolicy
+from tagoio_sdk.infrastructure.retry import setRetryPolicy
+from tagoio_sdk.modules.Device.AsyncDevice import AsyncDevice
+from tagoio_sdk.modules.Device.Device import Device
+
+
+@pytest.fixture(autouse=True)
+def retryPolicy():
+    setRetryPolicy(RetryPolicy(attempts=5, baseDelay=0, maxDelay=0, minAttemptTime=0.5))
+    yield
+    setRetryPolicy(None)
+
+
+def testNestedDeadlinesOnlyShorten():
+    assert remainingTime() is None
+
+    with deadline(10) as outer:
+        with deadline(60) as inner:
+            assert inner == outer
+        with deadline(1):
+            assert remainingTime() <= 1
+        with deadline(None):
+            assert getDeadline() == outer
+
+    assert getDeadline() is None
+
+
+def testTimeoutsBoundedByDeadline(requests_mock: Mocker):
+    requests_mock.get("https://api.tago.io/info", json={"status": True, "result": {}})
+
+    Device({"token": "fake_token"}).info()
+    assert requests_mock.request_history[0].timeout == (10, 60)
+
+    with deadline(5):
+        Device({"token": "fake_token"}).info()
+    connectTimeout, readTimeout = requests_mock.request_history[1].timeout
+    assert 4 < connectTimeout <= 5
+    assert 4 < readTimeout <= 5
+
+
+def testExpiredDeadlineFailsWithoutSending(requests_mock: Mocker):
+    requests_mock.get("https://api.tago.io/info", json={"status": True, "result": {}})
+
+    with deadline(0), pytest.raises(TagoIODeadlineError):
+        Device({"token": "fake_token"}).info()
+
+    assert requests_mock.call_count == 0
+
+
+def testNoRetryWhenTheTimeLeftIsTooShort(requests_mock: Mocker):
+    setRetryPolicy(RetryPolicy(attempts=5, maxDelay=5, minAttemptTime=0.5))
+    requests_mock.get(
+        "https://api.tago.io/info",
+        status_code=503,
+        headers={"Retry-After": "1"},
+        text="",
+    )
+
+    start = time.monotonic()
+    with deadline(1), pytest.raises(TagoIORequestError):
+        Device({"token": "fake_token"}).info()
+
+    assert requests_mock.call_count == 1
+    assert time.monotonic() - start < 0.5
+
+
+def testTimeoutAtTheDeadline(requests_mock: Mocker):
+    def slowResponse(request, context):
+        time.sleep(0.2)
+        raise requests.exceptions.ReadTimeout("read timed out")
+
+    requests_mock.get("https://api.tago.io/info", json=slowResponse)
+
+    with pytest.raises(TagoIODeadlineError, match="read timed out"):
+        apiRequest(
+            {
+                "url": "https://api.tago.io",
+                "path": "/info",
+                "method": "get",
+                "headers": {},
+                "deadline": 0.1,
+            }
+        )
+
+    assert requests_mock.call_count == 1
+
+
+def testDeadlineFollowsAsyncCalls(requests_mock: Mocker):
+    requests_mock.get("https://api.tago.io/info", json={"status": True, "result": {}})
+
+    async def main():
+        with deadline(5):
+            await AsyncDevice({"token": "fake_token"}).info()
+
+    asyncio.run(main())
+    assert requests_mock.request_history[0].timeout[1] <= 5
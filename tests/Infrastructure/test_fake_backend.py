@@ -0,0 +1,169 @@
+import threading
+import time
+
+import pytest
+
+from tagoio_sdk import config
+from tagoio_sdk.infrastructure.api_request import TagoIORequestError
+from tagoio_sdk.infrastructure.api_sse import openSSEListening
+from tagoio_sdk.infrastructure.fake_backend import FakeTagoIO
+from tagoio_sdk.modules.Analysis.Analysis import Analysis
+from tagoio_sdk.modules.Device.Device import Device
+from tagoio_sdk.modules.Resources.Resources import Resources
+from tagoio_sdk.modules.Utils.sendDownlink import sendDownlink
+
+
+@pytest.fixture
+def tago():
+    with FakeTagoIO() as backend:
+        yield backend
+
+
+def testDeviceData(tago: FakeTagoIO):
+    deviceID, token = tago.addDevice("Sensor")
+    device = Device({"token": token})
+    resources = Resources({"token": "account_token"})
+
+    device.sendData(
+        [
+            {"variable": "temperature", "value": i, "time": f"2024-01-01 00:00:{i:02d}"}
+            for i in range(30)
+        ]
+    )
+    device.sendData({"variable": "humidity", "value": 50}, compress=True)
+
+    assert resources.devices.amount(deviceID) == 31
+    assert len(device.getData({"variable": "temperature"})) == 15
+
+    page = resources.devices.getDeviceData(
+        deviceID, {"variables": ["temperature"], "qty": 5, "skip": 5}
+    )
+    assert [data["value"] for data in page] == [24, 23, 22, 21, 20]
+
+    ascending = device.getData(
+        {"variable": "temperature", "qty": 3, "ordination": "ascending"}
+    )
+    assert [data["value"] for data in ascending] == [0, 1, 2]
+
+    last = device.getData({"variable": "temperature", "query": "last_value"})
+    assert last[0]["value"] == 29
+
+    assert (
+        device.deleteData({"variable": "temperature", "qty": 10}) == "10 Data Removed"
+    )
+    assert resources.devices.amount(deviceID) == 21
+
+    streamed = list(resources.devices.getDeviceDataStream(deviceID, {"qty": 100}))
+    assert len(streamed) == 21
+
+
+def testDevicesTokensAndParams(tago: FakeTagoIO):
+    resources = Resources({"token": "account_token"})
+
+    created = resources.devices.create(
+        {"name": "Gateway", "tags": [{"key": "site", "value": "north"}]}
+    )
+    resources.devices.create({"name": "Sensor"})
+
+    devices = resources.devices.listDevice(
+        {"filter": {"name": "Gate*"}, "fields": ["id", "name"]}
+    )
+    assert devices == [{"id": created["device_id"], "name": "Gateway"}]
+
+    token = resources.devices.tokenCreate(
+        created["device_id"], {"name": "Second", "permission": "write"}
+    )
+    tokens = resources.devices.tokenList(created["device_id"])
+    assert {item["name"] for item in tokens} == {"Default", "Second"}
+    assert resources.devices.tokenDelete(token["token"])
+
+    resources.devices.paramSet(
+        created["device_id"], {"key": "threshold", "value": "25", "sent": False}
+    )
+    device = Device({"token": created["token"]})
+    params = device.getParameters()
+    assert params[0]["key"] == "threshold"
+
+    device.setParameterAsRead(params[0]["id"])
+    assert (
+        resources.devices.paramList(created["device_id"], sentStatus=True)[0]["sent"]
+        is True
+    )
+
+    with pytest.raises(TagoIORequestError, match="Authorization Denied"):
+        Resources({"token": created["token"]}).devices.listDevice()
+
+
+def testFilesMultipartUpload(tago: FakeTagoIO):
+    resources = Resources({"token": "account_token"})
+    content = bytes(range(256)) * 100
+
+    result = resources.files.uploadFile(
+        content, "/reports/file.bin", {"chunkSize": 10 * 1024 * 1024}
+    )
+
+    assert result["file"].endswith("/reports/file.bin")
+    assert tago.files["/reports/file.bin"]["content"] == content
+    assert resources.files.list({"path": "/reports"})["files"][0]["size"] == len(
+        content
+    )
+
+
+def testSendDownlink(tago: FakeTagoIO):
+    networkID = tago.addNetwork("LoRaWAN", "lorawan.middleware.test")
+    deviceID, token = tago.addDevice("Sensor", network=networkID)
+    tago.tokens[token]["serie_number"] = "0011223344556677"
+    Device({"token": token}).sendData({"variable": "uplink", "value": 1})
+
+    result = sendDownlink(
+        Resources({"token": "account_token"}), deviceID, {"payload": "01FF", "port": 1}
+    )
+
+    assert result == "Downlink accepted with status code - 200"
+    assert tago.downlinks[0]["device"] == "0011223344556677"
+
+
+def testSSEChannel(tago: FakeTagoIO):
+    client = openSSEListening({"token": "account_token", "channel": "notification"})
+
+    tago.publish("notification", {"title": "hello"})
+    tago.closeStreams()
+
+    events = [event.data for event in client.events()]
+    assert events == ['{"title": "hello"}']
+
+
+def testAnalysisTrigger(tago: FakeTagoIO, monkeypatch):
+    monkeypatch.delenv("T_ANALYSIS_TOKEN", raising=False)
+    analysisToken = tago.addAnalysis("My Analysis")
+    received = []
+
+    analysis = Analysis({"token": analysisToken})
+    thread = threading.Thread(
+        target=analysis.init, args=(lambda context, scope: received.append(scope),)
+    )
+    thread.start()
+
+    deadline = time.monotonic() + 5
+    while not tago.triggerAnalysis(analysisToken, data=[{"variable": "temperature"}]):
+        assert time.monotonic() < deadline
+        time.sleep(0.01)
+    while not received:
+        assert time.monotonic() < deadline
+        time.sleep(0.01)
+
+    tago.closeStreams()
+    thread.join(5)
+
+    assert received == [[{"variable": "temperature"}]]
+
+
+def testInstallRestoresTransport():
+    previous = config.tagoSDKconfig["transport"]
+
+    with FakeTagoIO(latency=0.001) as backend:
+        assert config.tagoSDKconfig["transport"] == backend.adapter
+        Resources({"token": "account_token"}).devices.listDevice()
+
+    assert config.tagoSDKconfig["transport"] == previous
+    assert backend.requestCount == 1
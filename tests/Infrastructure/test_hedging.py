@@ -0,0 +1,212 @@
+import itertools
+import threading
+import time
+
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock
+
+import pytest
+import requests
+
+from tagoio_sdk.infrastructure.fake_backend import FakeTagoIO
+from tagoio_sdk.infrastructure.hedging import HedgeBudget
+from tagoio_sdk.infrastructure.hedging import Hedger
+from tagoio_sdk.infrastructure.hedging import LatencyTracker
+from tagoio_sdk.infrastructure.hedging import getHedger
+from tagoio_sdk.infrastructure.hedging import resetHedger
+from tagoio_sdk.infrastructure.instrumentation import getMetrics
+from tagoio_sdk.infrastructure.instrumentation import resetMetrics
+from tagoio_sdk.infrastructure.rate_limiter import RateLimiter
+from tagoio_sdk.modules.Resources.Resources import Resources
+
+
+def fakeResponse(statusCode: int = 200) -> MagicMock:
+    response = MagicMock(spec=requests.Response)
+    response.status_code = statusCode
+    return response
+
+
+def warmedHedger(**kwargs) -> Hedger:
+    hedger = Hedger(minSamples=5, **kwargs)
+    for _ in range(5):
+        hedger.latencies.record("key", 0.02)
+    return hedger
+
+
+def testLatencyPercentile():
+    tracker = LatencyTracker(window=100)
+    for i in range(1, 101):
+        tracker.record("key", i / 1000)
+
+    assert tracker.percentile("key", 50) == 0.051
+    assert tracker.percentile("key", 99) == 0.1
+    assert tracker.percentile("key", 50, minSamples=101) is None
+    assert tracker.percentile("other", 50) is None
+
+
+def testBudgetCapsHedges():
+    budget = HedgeBudget(ratio=0.5, burst=1)
+
+    assert budget.tryAcquire()
+    assert not budget.tryAcquire()
+    budget.onRequest()
+    assert not budget.tryAcquire()
+    budget.onRequest()
+    assert budget.tryAcquire()
+    assert budget.spent == 2
+
+
+def testNoHedgeWithoutLatencies():
+    hedger = Hedger(minSamples=5)
+    response = fakeResponse()
+
+    assert hedger.run("key", lambda: response) == (response, False)
+    assert hedger.threshold("key") is None
+
+
+def testSlowRequestIsHedged():
+    hedger = warmedHedger()
+    slow, fast = fakeResponse(), fakeResponse()
+    calls = itertools.count()
+
+    def request():
+        if next(calls) == 0:
+            time.sleep(0.3)
+            return slow
+        return fast
+
+    start = time.monotonic()
+    assert hedger.run("key", request) == (fast, True)
+    assert time.monotonic() - start < 0.2
+
+    time.sleep(0.5)
+    slow.close.assert_called_once()
+    fast.close.assert_not_called()
+
+
+def testFailedHedgeWaitsForTheOther():
+    hedger = warmedHedger()
+    slow = fakeResponse()
+    calls = itertools.count()
+
+    def request():
+        if next(calls) == 0:
+            time.sleep(0.1)
+            return slow
+        raise requests.exceptions.ConnectionError("refused")
+
+    assert hedger.run("key", request) == (slow, True)
+
+
+def testNoHedgeOverBudget():
+    hedger = warmedHedger(budget=0, burst=0)
+    response = fakeResponse()
+
+    def request():
+        time.sleep(0.05)
+        return response
+
+    assert hedger.run("key", request) == (response, False)
+    assert hedger.budget.spent == 0
+
+
+def testPrimaryRequestsAreNotCappedByWorkers():
+    hedger = warmedHedger(minDelay=1, maxWorkers=1, maxPrimaries=2)
+    response = fakeResponse()
+
+    def request():
+        time.sleep(0.1)
+        return response
+
+    with ThreadPoolExecutor(max_workers=10) as executor:
+        start = time.monotonic()
+        results = list(executor.map(lambda _: hedger.run("key", request), range(10)))
+
+    assert time.monotonic() - start < 0.5
+    assert results == [(response, False)] * 10
+
+
+def testUnhedgedRequestRunsOnTheCallingThread():
+    hedger = warmedHedger(budget=0, burst=0)
+    caller = threading.current_thread()
+    threads = []
+
+    def request():
+        threads.append(threading.current_thread())
+        return fakeResponse()
+
+    hedger.run("key", request)
+    hedger.run("key", request, hedge=False)
+    assert threads == [caller, caller]
+
+
+def testHedgeTakesARateLimiterSlot():
+    hedger = warmedHedger()
+    limiter = RateLimiter(
+        requestsPerSecond=100,
+        burst=1,
+        initialConcurrency=1,
+        minConcurrency=1,
+        maxConcurrency=1,
+    )
+    delays = iter([0.05, 0.3])
+
+    def request():
+        # The primary request of both runs is slow, the hedge isn't
+        time.sleep(next(delays, 0))
+        return fakeResponse()
+
+    # The slot of the first request is held by the caller, so no hedge is sent
+    assert limiter.acquire()
+    assert hedger.run("key", request, limiter=limiter)[1] is False
+    assert hedger.budget.spent == 0
+    limiter.release()
+
+    assert hedger.run("key", request, limiter=limiter)[1] is True
+    assert limiter.concurrency.inFlight == 0
+
+
+@pytest.fixture
+def hedger():
+    resetHedger()
+    resetMetrics()
+    hedger = getHedger()
+    yield hedger
+    resetHedger()
+
+
+def testResourcesHedgeSlowGets(hedger: Hedger):
+    with FakeTagoIO() as tago:
+        deviceID, _ = tago.addDevice("Sensor")
+        devices = Resources({"token": "account_token"}).devices
+        devices.info(deviceID)
+        assert hedger.threshold(("GET", "/device/{id}")) is None
+
+        for _ in range(hedger.minSamples):
+            devices.doRequest(
+                {"path": f"/device/{deviceID}", "method": "GET", "hedge": True}
+            )
+
+        handle = tago.handle
+        calls = itertools.count()
+
+        def slowFirst(request):
+            if next(calls) == 0:
+                time.sleep(0.3)
+            return handle(request)
+
+        tago.handle = slowFirst
+        start = time.monotonic()
+        assert (
+            devices.doRequest(
+                {"path": f"/device/{deviceID}", "method": "GET", "hedge": True}
+            )["id"]
+            == deviceID
+        )
+        assert time.monotonic() - start < 0.25
+        assert getMetrics()["GET /device/{id}"]["hedges"] == 1
+
+        devices.doRequest(
+            {"path": f"/device/{deviceID}", "method": "GET", "hedge": False}
+        )
+        assert hedger.budget.spent == 1
@@ -0,0 +1,132 @@
+import gzip
+import json
+import ssl
+import threading
+
+from http.server import BaseHTTPRequestHandler
+from http.server import ThreadingHTTPServer
+
+import pytest
+import requests
+
+from tagoio_sdk import config
+from tagoio_sdk.infrastructure import http2_adapter
+from tagoio_sdk.infrastructure.api_request import apiRequest
+from tagoio_sdk.infrastructure.http_session import closeSessions
+from tagoio_sdk.infrastructure.http_session import getSession
+from tagoio_sdk.infrastructure.retry import isConnectionFailure
+
+
+pytest.importorskip("httpx")
+
+
+class EchoHandler(BaseHTTPRequestHandler):
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers["Content-Length"]))
+        if self.headers.get("Content-Encoding") == "gzip":
+            body = gzip.decompress(body)
+
+        payload = gzip.compress(
+            json.dumps({"status": True, "result": json.loads(body)}).encode()
+        )
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Encoding", "gzip")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def do_GET(self):
+        # Proxied requests carry the absolute URL
+        payload = json.dumps({"status": True, "result": self.path}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), EchoHandler)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{httpd.server_address[1]}"
+    httpd.shutdown()
+    httpd.server_close()
+
+
+@pytest.fixture
+def http2Transport(monkeypatch):
+    monkeypatch.setitem(config.tagoSDKconfig, "transport", "http2")
+    closeSessions()
+    yield
+    closeSessions()
+
+
+def testSessionUsesHTTP2Adapter(http2Transport):
+    session = getSession("https://api.tago.io", "token")
+
+    assert isinstance(
+        session.get_adapter("https://api.tago.io/info"), http2_adapter.HTTP2Adapter
+    )
+
+
+def testApiRequestThroughHTTP2Adapter(http2Transport, server):
+    data = [{"variable": "temperature", "value": i} for i in range(200)]
+
+    result = apiRequest(
+        {
+            "url": server,
+            "path": "/data",
+            "method": "post",
+            "headers": {"token": "token"},
+            "body": data,
+            "compress": True,
+        }
+    )
+
+    assert result == data
+
+
+def testSessionProxiesAreUsed(http2Transport, server):
+    session = getSession("http://tago.invalid")
+    session.proxies = {"http": server}
+
+    response = session.get("http://tago.invalid/info", timeout=2)
+
+    assert response.json()["result"] == "http://tago.invalid/info"
+
+
+def testVerifySettingsGetTheirOwnClient():
+    adapter = http2_adapter.HTTP2Adapter()
+
+    default = adapter._getClient(True, None, None)
+    insecure = adapter._getClient(False, None, None)
+
+    assert adapter._getClient(True, None, None) is default
+    assert insecure is not default
+    assert http2_adapter._sslContext(False, None).verify_mode == ssl.CERT_NONE
+    assert http2_adapter._sslContext(True, None).verify_mode == ssl.CERT_REQUIRED
+    with pytest.raises(FileNotFoundError):
+        http2_adapter._sslContext("/missing/ca-bundle.pem", None)
+    adapter.close()
+
+
+def testConnectionFailureIsRetryable(http2Transport):
+    session = getSession("http://127.0.0.1:1")
+
+    with pytest.raises(requests.exceptions.ConnectionError) as error:
+        session.get("http://127.0.0.1:1/info", timeout=2)
+
+    assert isConnectionFailure(error.value)
+
+
+def testMissingHttpx(monkeypatch):
+    monkeypatch.setattr(http2_adapter, "httpx", None)
+
+    with pytest.raises(ImportError, match="tagoio-sdk\\[http2\\]"):
+        http2_adapter.HTTP2Adapter()
@@ -0,0 +1,31 @@
+from requests_mock.mocker import Mocker
+
+from tagoio_sdk.infrastructure.http_session import closeSessions
+from tagoio_sdk.infrastructure.http_session import getSession
+from tagoio_sdk.modules.Device.Device import Device
+from tagoio_sdk.modules.Resources.Resources import Resources
+
+
+def testGetSessionReusedPerUrlAndToken():
+    closeSessions()
+
+    session = getSession("https://api.tago.io", "token_a")
+
+    assert getSession("https://api.tago.io", "token_a") is session
+    assert getSession("https://api.tago.io", "token_b") is not session
+    assert getSession("https://api.eu-w1.tago.io", "token_a") is not session
+
+
+def testModulesShareSessionForSameToken(requests_mock: Mocker):
+    closeSessions()
+    requests_mock.get(
+        "https://api.tago.io/info", json={"status": True, "result": {"id": "1"}}
+    )
+
+    resources = Resources({"token": "fake_token"})
+    device = Device({"token": "fake_token"})
+
+    assert resources.devices.session is resources.files.session
+    assert device.session is resources.session
+    assert device.info() == {"id": "1"}
+    assert requests_mock.last_request.headers["token"] == "fake_token"
@@ -0,0 +1,134 @@
+import pytest
+
+from requests_mock.mocker import Mocker
+
+from tagoio_sdk import config
+from tagoio_sdk.common.Cache import clear_cache
+from tagoio_sdk.infrastructure.api_request import TagoIORequestError
+from tagoio_sdk.infrastructure.instrumentation import addRequestHook
+from tagoio_sdk.infrastructure.instrumentation import endpointName
+from tagoio_sdk.infrastructure.instrumentation import exportPrometheus
+from tagoio_sdk.infrastructure.instrumentation import getMetrics
+from tagoio_sdk.infrastructure.instrumentation import resetMetrics
+from tagoio_sdk.infrastructure.retry import RetryPolicy
+from tagoio_sdk.infrastructure.retry import setRetryPolicy
+from tagoio_sdk.modules.Resources.Resources import Resources
+
+
+@pytest.fixture(autouse=True)
+def cleanMetrics():
+    resetMetrics()
+    setRetryPolicy(RetryPolicy(attempts=3, baseDelay=0))
+    yield
+    setRetryPolicy(None)
+    resetMetrics()
+
+
+def testEndpointName():
+    assert endpointName("/device/63f50a69fd802b000ac1aa76/data") == "/device/{id}/data"
+    assert (
+        endpointName("/device/token/c2a5e0d6-8d37-4f8e-b8a4-9c1d2e3f4a5b")
+        == "/device/token/{id}"
+    )
+    assert endpointName("/files/copy") == "/files/copy"
+
+
+def testMetricsPerEndpoint(requests_mock: Mocker):
+    requests_mock.get(
+        "https://api.tago.io/device/63f50a69fd802b000ac1aa76/data",
+        [
+            {"status_code": 503, "json": {"status": False, "message": "Busy"}},
+            {"json": {"status": True, "result": []}},
+        ],
+    )
+    requests_mock.post(
+        "https://api.tago.io/device/63f50a69fd802b000ac1aa76/data",
+        json={"status": True, "result": "1 Data Added"},
+    )
+    requests_mock.get(
+        "https://api.tago.io/device/63f50a69fd802b000ac1aa76",
+        status_code=404,
+        json={"status": False, "message": "Not found"},
+    )
+
+    resources = Resources({"token": "your_token_value"})
+    resources.devices.getDeviceData("63f50a69fd802b000ac1aa76")
+    resources.devices.sendDeviceData(
+        "63f50a69fd802b000ac1aa76", {"variable": "temperature", "value": 1}
+    )
+    with pytest.raises(TagoIORequestError):
+        resources.devices.info("63f50a69fd802b000ac1aa76")
+
+    metrics = getMetrics()
+    getData = metrics["GET /device/{id}/data"]
+    assert getData["requests"] == 1
+    assert getData["retries"] == 1
+    assert getData["errors"] == {}
+    assert getData["latency"]["buckets"]["+Inf"] == 1
+
+    sendData = metrics["POST /device/{id}/data"]
+    assert sendData["bytes_sent"] == len(b'{"variable":"temperature","value":1}')
+    assert sendData["bytes_received"] > 0
+
+    assert metrics["GET /device/{id}"]["errors"] == {"client_error": 1}
+
+    prometheus = exportPrometheus()
+    assert (
+        'tagoio_sdk_requests_total{method="GET",endpoint="/device/{id}/data"} 1'
+        in prometheus
+    )
+    assert (
+        'tagoio_sdk_request_errors_total{method="GET",endpoint="/device/{id}",error_class="client_error"} 1'
+        in prometheus
+    )
+    assert (
+        'tagoio_sdk_request_duration_seconds_bucket{method="GET",endpoint="/device/{id}/data",le="+Inf"} 1'
+        in prometheus
+    )
+
+
+def testCacheHitsAndHooks(requests_mock: Mocker, monkeypatch):
+    monkeypatch.setitem(config.tagoSDKconfig["cache"], "enabled", True)
+    clear_cache()
+    requests_mock.get(
+        "https://api.tago.io/device/63f50a69fd802b000ac1aa76",
+        json={"status": True, "result": {"id": "1"}},
+    )
+
+    before = []
+    after = []
+    removeHooks = addRequestHook(before=before.append, after=after.append)
+    try:
+        resources = Resources({"token": "your_token_value"})
+        resources.devices.doRequest(
+            {"path": "/device/63f50a69fd802b000ac1aa76", "method": "GET"}
+        )
+        resources.devices.doRequest(
+            {"path": "/device/63f50a69fd802b000ac1aa76", "method": "GET"}
+        )
+    finally:
+        removeHooks()
+        clear_cache()
+
+    assert len(before) == len(after) == 2
+    assert [info.cacheHit for info in after] == [False, True]
+    assert after[0].statusCode == 200 and after[0].duration is not None
+    assert getMetrics()["GET /device/{id}"]["cache_hits"] == 1
+
+
+def testFailingHookWarns(requests_mock: Mocker):
+    requests_mock.get(
+        "https://api.tago.io/info", json={"status": True, "result": {"id": "1"}}
+    )
+
+    def brokenHook(info):
+        raise RuntimeError("broken")
+
+    removeHooks = addRequestHook(after=brokenHook)
+    try:
+        with pytest.warns(UserWarning, match="broken"):
+            assert Resources({"token": "your_token_value"}).devices.doRequest(
+                {"path": "/info", "method": "GET"}
+            )
+    finally:
+        removeHooks()
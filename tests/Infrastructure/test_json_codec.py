@@ -0,0 +1,54 @@
+from datetime import datetime
+
+import pytest
+
+from requests_mock.mocker import Mocker
+
+from tagoio_sdk import config
+from tagoio_sdk.infrastructure.json_codec import dumps
+from tagoio_sdk.infrastructure.json_codec import getJSONCodec
+from tagoio_sdk.infrastructure.json_codec import loads
+from tagoio_sdk.modules.Device.Device import Device
+
+
+@pytest.fixture(params=["json", "auto"])
+def codec(request, monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setitem(config.tagoSDKconfig, "jsonCodec", request.param)
+    return getJSONCodec()
+
+
+def testDatetimeSerializedAsISO(codec):
+    body = loads(
+        dumps({"variable": "temperature", "time": datetime(2023, 2, 21, 18, 16, 9)})
+    )
+
+    assert body["time"] == "2023-02-21T18:16:09"
+
+
+def testBigIntegersFallBackToStdlib(codec):
+    assert loads(dumps({"value": 2**70})) == {"value": 2**70}
+
+
+def testUnknownCodec(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setitem(config.tagoSDKconfig, "jsonCodec", "invalid")
+
+    with pytest.raises(ValueError):
+        getJSONCodec()
+
+
+def testPreSerializedBodySentAsIs(requests_mock: Mocker, codec):
+    requests_mock.post(
+        "https://api.tago.io/data", json={"status": True, "result": "2 Data Added"}
+    )
+    body = dumps(
+        [
+            {"variable": "temperature", "value": 1},
+            {"variable": "temperature", "value": 2},
+        ]
+    )
+
+    result = Device({"token": "fake_token"}).sendData(body)
+
+    assert result == "2 Data Added"
+    assert requests_mock.last_request.body == body
+    assert requests_mock.last_request.headers["content-type"] == "application/json"
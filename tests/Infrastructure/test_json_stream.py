@@ -0,0 +1,101 @@
+import asyncio
+import json
+
+from datetime import datetime
+
+import pytest
+
+from requests_mock.mocker import Mocker
+
+from tagoio_sdk import AsyncResources
+from tagoio_sdk.infrastructure.api_request import TagoIORequestError
+from tagoio_sdk.infrastructure.json_stream import JSONResultStream
+from tagoio_sdk.modules.Resources.Resources import Resources
+
+
+def mockDeviceData(amount: int) -> dict:
+    return {
+        "status": True,
+        "result": [
+            {
+                "id": str(i),
+                "variable": "temperature",
+                "value": i * 1.5,
+                "time": "2023-02-21T18:16:09.817Z",
+            }
+            for i in range(amount)
+        ],
+    }
+
+
+@pytest.mark.parametrize("chunkSize", [1, 7, 4096])
+def testStreamAnyChunkSize(chunkSize: int):
+    document = {**mockDeviceData(50), "extra": {"text": 'çã€ "quoted"'}}
+    raw = json.dumps(document, ensure_ascii=False).encode()
+
+    stream = JSONResultStream(
+        raw[i : i + chunkSize] for i in range(0, len(raw), chunkSize)
+    )
+
+    assert list(stream) == document["result"]
+    assert stream.envelope == {"status": True, "extra": document["extra"]}
+
+
+def testStreamNestedPathAndScalars():
+    audit = JSONResultStream(
+        [
+            b'{"status": true, "result": {"queryId": "q1", "events": [{"date": "2024"}, 1, 23]}}'
+        ],
+        ("result", "events"),
+    )
+
+    assert list(audit) == [{"date": "2024"}, 1, 23]
+    assert audit.envelope["result"] == {"queryId": "q1"}
+    assert list(JSONResultStream([b'{"status":true,"result":42}'])) == [42]
+
+
+def testStreamInvalidDocument():
+    with pytest.raises(ValueError):
+        list(JSONResultStream([b'{"status":true,"result":[{"id": 1}']))
+
+
+def testGetDeviceDataStream(requests_mock: Mocker):
+    requests_mock.get(
+        "https://api.tago.io/device/device_id/data", json=mockDeviceData(100)
+    )
+    resources = Resources({"token": "fake_token"})
+
+    stream = resources.devices.getDeviceDataStream("device_id", {"qty": 100})
+    assert requests_mock.call_count == 0
+
+    data = list(stream)
+    assert len(data) == 100
+    assert data[10]["value"] == 15
+    assert isinstance(data[0]["time"], datetime)
+    assert requests_mock.last_request.qs["qty"] == ["100"]
+
+
+def testStreamApiError(requests_mock: Mocker):
+    requests_mock.get(
+        "https://api.tago.io/run/users",
+        status_code=401,
+        json={"status": False, "message": "Authorization Denied"},
+    )
+
+    with pytest.raises(TagoIORequestError) as error:
+        list(Resources({"token": "fake_token"}).run.listUsersStream())
+
+    assert error.value.message == "Authorization Denied"
+
+
+def testAsyncStream(requests_mock: Mocker):
+    requests_mock.get(
+        "https://api.tago.io/device",
+        json={"status": True, "result": [{"id": "1"}, {"id": "2"}]},
+    )
+    resources = AsyncResources({"token": "fake_token"})
+
+    async def collect():
+        return [device["id"] async for device in resources.devices.listDeviceStream()]
+
+    assert asyncio.run(collect()) == ["1", "2"]
@@ -0,0 +1,86 @@
+import io
+import json
+
+import pytest
+
+from requests_mock.mocker import Mocker
+
+from tagoio_sdk import config
+from tagoio_sdk.infrastructure.api_request import TagoIORequestError
+from tagoio_sdk.modules.Resources.Resources import Resources
+
+
+def mockDeviceData(amount: int) -> dict:
+    return {
+        "status": True,
+        "result": [
+            {
+                "id": str(i),
+                "variable": "temperature",
+                "value": i,
+                "time": "2023-02-21T18:16:09.817Z",
+            }
+            for i in range(amount)
+        ],
+    }
+
+
+def testMaxContentLengthFromHeader(requests_mock: Mocker) -> None:
+    requests_mock.get("https://api.tago.io/device", json=mockDeviceData(100))
+
+    resources = Resources({"token": "your_token_value"})
+    with pytest.raises(TagoIORequestError, match="exceeds maxContentLength"):
+        resources.devices.doRequest(
+            {"path": "/device", "method": "GET", "maxContentLength": 512}
+        )
+
+
+def testMaxContentLengthWithoutHeader(requests_mock: Mocker) -> None:
+    body = json.dumps(mockDeviceData(100)).encode()
+    requests_mock.get("https://api.tago.io/device", body=io.BytesIO(body))
+
+    resources = Resources({"token": "your_token_value"})
+    with pytest.raises(TagoIORequestError, match="exceeds maxContentLength"):
+        resources.devices.doRequest(
+            {"path": "/device", "method": "GET", "maxContentLength": 512}
+        )
+
+
+def testMaxContentLengthAllowsSmallResponses(requests_mock: Mocker) -> None:
+    requests_mock.get("https://api.tago.io/device", json=mockDeviceData(2))
+
+    resources = Resources({"token": "your_token_value"})
+    result = resources.devices.doRequest(
+        {"path": "/device", "method": "GET", "maxContentLength": 1024 * 1024}
+    )
+
+    assert result == mockDeviceData(2)["result"]
+
+
+def testStreamSpillToFile(requests_mock: Mocker, tmp_path, monkeypatch) -> None:
+    monkeypatch.setitem(config.tagoSDKconfig, "spillDirectory", str(tmp_path))
+    requests_mock.get(
+        "https://api.tago.io/device/device1/data", json=mockDeviceData(500)
+    )
+
+    resources = Resources({"token": "your_token_value"})
+    result = list(
+        resources.devices.getDeviceDataStream("device1", {"qty": 500}, spillToFile=True)
+    )
+
+    assert len(result) == 500
+    assert result[-1]["id"] == "499"
+    assert list(tmp_path.iterdir()) == []
+
+
+def testStreamMaxContentLength(requests_mock: Mocker) -> None:
+    requests_mock.get(
+        "https://api.tago.io/device/device1/data", json=mockDeviceData(500)
+    )
+
+    resources = Resources({"token": "your_token_value"})
+    stream = resources.devices.doRequestStream(
+        {"path": "/device/device1/data", "method": "GET", "maxContentLength": 1024}
+    )
+    with pytest.raises(TagoIORequestError, match="exceeds maxContentLength"):
+        list(stream)
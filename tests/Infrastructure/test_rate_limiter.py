@@ -0,0 +1,146 @@
+import time
+
+import pytest
+
+from requests_mock.mocker import Mocker
+
+from tagoio_sdk import config
+from tagoio_sdk.infrastructure.api_request import TagoIODeadlineError
+from tagoio_sdk.infrastructure.api_request import TagoIORequestError
+from tagoio_sdk.infrastructure.deadline import deadline
+from tagoio_sdk.infrastructure.rate_limiter import AdaptiveConcurrency
+from tagoio_sdk.infrastructure.rate_limiter import TokenBucket
+from tagoio_sdk.infrastructure.rate_limiter import clearRateLimiters
+from tagoio_sdk.infrastructure.rate_limiter import getRateLimiter
+from tagoio_sdk.infrastructure.rate_limiter import isThrottled
+from tagoio_sdk.modules.Device.Device import Device
+
+
+@pytest.fixture
+def rateLimitEnabled(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setitem(
+        config.tagoSDKconfig,
+        "rateLimit",
+        {**config.tagoSDKconfig["rateLimit"], "enabled": True},
+    )
+    clearRateLimiters()
+    yield
+    clearRateLimiters()
+
+
+def testTokenBucketLimitsRate():
+    bucket = TokenBucket(rate=100, burst=1)
+
+    start = time.monotonic()
+    for _ in range(6):
+        bucket.acquire()
+
+    assert time.monotonic() - start >= 0.04
+
+
+def testTokenBucketRejectsNonPositiveRate():
+    with pytest.raises(ValueError):
+        TokenBucket(rate=0, burst=1)
+
+
+@pytest.mark.parametrize("value,expected", [("", 0), ("0", 0), ("-1", 0), ("2.5", 2.5)])
+def testRateLimitFromEnvironment(
+    monkeypatch: pytest.MonkeyPatch, value: str, expected: float
+):
+    monkeypatch.setenv("TAGOIO_RATE_LIMIT", value)
+
+    assert config._envRateLimit() == expected
+
+
+def testAdaptiveConcurrencyAIMD():
+    concurrency = AdaptiveConcurrency(initial=8, minimum=1, maximum=10)
+
+    concurrency.acquire()
+    concurrency.release(throttled=True)
+    assert concurrency.limit == 4
+
+    for _ in range(4):
+        concurrency.acquire()
+        concurrency.release()
+    assert 4.9 < concurrency.limit < 5.1
+
+    for _ in range(10):
+        concurrency.acquire()
+        concurrency.release(throttled=True)
+    assert concurrency.limit == 1
+
+
+def testIsThrottled():
+    assert isThrottled(429)
+    assert isThrottled(400, "You have exceeded the maximum limit of requests")
+    assert not isThrottled(400, "Invalid parameter")
+
+
+def testRateLimiterDisabledByDefault():
+    assert getRateLimiter("https://api.tago.io", "fake_token") is None
+
+
+def testRateLimiterBacksOffOnLimitError(requests_mock: Mocker, rateLimitEnabled):
+    requests_mock.get(
+        "https://api.tago.io/info",
+        status_code=400,
+        json={
+            "status": False,
+            "message": "You have exceeded the maximum limit of requests",
+        },
+    )
+
+    limiter = getRateLimiter("https://api.tago.io", "fake_token")
+    initialLimit = limiter.concurrency.limit
+
+    with pytest.raises(TagoIORequestError):
+        Device({"token": "fake_token"}).info()
+
+    assert limiter.concurrency.limit < initialLimit
+    assert limiter.concurrency.inFlight == 0
+
+
+def testAcquireGivesUpAtTheTimeout():
+    bucket = TokenBucket(rate=0.2, burst=1)
+    assert bucket.acquire(0)
+
+    start = time.monotonic()
+    assert not bucket.acquire(0.5)
+    assert time.monotonic() - start < 0.1
+
+    concurrency = AdaptiveConcurrency(initial=1, minimum=1, maximum=1)
+    concurrency.acquire()
+    start = time.monotonic()
+    assert not concurrency.acquire(0.1)
+    assert 0.1 <= time.monotonic() - start < 0.5
+    assert concurrency.inFlight == 1
+
+
+def testSaturatedLimiterKeepsTheDeadline(
+    requests_mock: Mocker, monkeypatch: pytest.MonkeyPatch
+):
+    monkeypatch.setitem(
+        config.tagoSDKconfig,
+        "rateLimit",
+        {
+            **config.tagoSDKconfig["rateLimit"],
+            "enabled": True,
+            "requestsPerSecond": 0.2,
+            "burst": 1,
+        },
+    )
+    clearRateLimiters()
+    requests_mock.get(
+        "https://api.tago.io/info", json={"status": True, "result": {"id": "1"}}
+    )
+    device = Device({"token": "fake_token"})
+    device.info()
+
+    start = time.monotonic()
+    with deadline(0.5), pytest.raises(TagoIODeadlineError):
+        device.info()
+
+    assert time.monotonic() - start < 0.2
+    assert requests_mock.call_count == 1
+    assert getRateLimiter("https://api.tago.io", "fake_token").concurrency.inFlight == 0
+    clearRateLimiters()
@@ -0,0 +1,129 @@
+import pytest
+
+from requests_mock.mocker import Mocker
+
+from tagoio_sdk.infrastructure.api_request import TagoIORequestError
+from tagoio_sdk.infrastructure.retry import RetryPolicy
+from tagoio_sdk.infrastructure.retry import parseRetryAfter
+from tagoio_sdk.infrastructure.retry import setRetryPolicy
+from tagoio_sdk.modules.Device.Device import Device
+
+
+@pytest.fixture(autouse=True)
+def noDelayPolicy():
+    setRetryPolicy(RetryPolicy(attempts=3, baseDelay=0, maxDelay=0))
+    yield
+    setRetryPolicy(None)
+
+
+def testRetryOnServerErrorForGet(requests_mock: Mocker):
+    requests_mock.get(
+        "https://api.tago.io/info",
+        [
+            {"status_code": 503, "text": "Service Unavailable"},
+            {"status_code": 200, "json": {"status": True, "result": {"id": "1"}}},
+        ],
+    )
+
+    assert Device({"token": "fake_token"}).info() == {"id": "1"}
+    assert requests_mock.call_count == 2
+
+
+def testNoRetryOnClientError(requests_mock: Mocker):
+    requests_mock.get(
+        "https://api.tago.io/info",
+        status_code=401,
+        json={"status": False, "message": "Invalid Token"},
+    )
+
+    with pytest.raises(TagoIORequestError) as error:
+        Device({"token": "fake_token"}).info()
+
+    assert error.value.message == "Invalid Token"
+    assert error.value.statusCode == 401
+    assert requests_mock.call_count == 1
+
+
+def testPostNotReplayedOnServerError(requests_mock: Mocker):
+    requests_mock.post(
+        "https://api.tago.io/data",
+        status_code=500,
+        json={"status": False, "message": "Oops"},
+    )
+
+    with pytest.raises(TagoIORequestError) as error:
+        Device({"token": "fake_token"}).sendData(
+            {"variable": "temperature", "value": 1}
+        )
+
+    assert error.value.statusCode == 500
+    assert requests_mock.call_count == 1
+
+
+def testPostRetriedOnTooManyRequests(requests_mock: Mocker):
+    requests_mock.post(
+        "https://api.tago.io/data",
+        [
+            {
+                "status_code": 429,
+                "headers": {"Retry-After": "0"},
+                "json": {"status": False, "message": "Slow down"},
+            },
+            {"status_code": 200, "json": {"status": True, "result": "1 Data Added"}},
+        ],
+    )
+
+    result = Device({"token": "fake_token"}).sendData(
+        {"variable": "temperature", "value": 1}
+    )
+
+    assert result == "1 Data Added"
+    assert requests_mock.call_count == 2
+
+
+def testLongRetryAfterIsNotRetriedEarly(requests_mock: Mocker):
+    setRetryPolicy(RetryPolicy(attempts=3, maxDelay=5))
+    requests_mock.get(
+        "https://api.tago.io/info",
+        status_code=429,
+        headers={"Retry-After": "60"},
+        json={"status": False, "message": "Slow down"},
+    )
+
+    with pytest.raises(TagoIORequestError) as error:
+        Device({"token": "fake_token"}).info()
+
+    assert error.value.statusCode == 429
+    assert requests_mock.call_count == 1
+
+
+def testRetryStopsAfterAttempts(requests_mock: Mocker):
+    requests_mock.get("https://api.tago.io/info", status_code=502, text="Bad Gateway")
+
+    with pytest.raises(TagoIORequestError):
+        Device({"token": "fake_token"}).info()
+
+    assert requests_mock.call_count == 3
+
+
+def testBackoffIsBounded():
+    policy = RetryPolicy(attempts=10, baseDelay=1, maxDelay=5, budget=100)
+
+    for attempt in range(10):
+        assert 0 <= policy.backoff(attempt) <= min(5, 2**attempt)
+
+    assert policy.backoff(0, retryAfter=3) == 3
+    assert policy.nextDelay(0, 0, "GET", statusCode=429, retryAfter=5) == 5
+    assert policy.nextDelay(0, 0, "GET", statusCode=429, retryAfter=60) is None
+    assert (
+        policy.nextDelay(0, 0, "GET", statusCode=429, retryAfter=3, remaining=2) is None
+    )
+    assert policy.nextDelay(0, 99, "GET", statusCode=503, retryAfter=3) is None
+    assert policy.nextDelay(0, 0, "GET", statusCode=404) is None
+
+
+def testParseRetryAfter():
+    assert parseRetryAfter("12") == 12
+    assert parseRetryAfter(None) is None
+    assert parseRetryAfter("Wed, 21 Oct 2015 07:28:00 GMT") == 0
+    assert parseRetryAfter("invalid") is None
@@ -0,0 +1,143 @@
+import threading
+import time
+
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from requests_mock.mocker import Mocker
+
+from tagoio_sdk.infrastructure.api_request import TagoIODeadlineError
+from tagoio_sdk.infrastructure.deadline import deadline
+from tagoio_sdk.infrastructure.single_flight import SingleFlight
+from tagoio_sdk.modules.Resources.Resources import Resources
+
+
+def testSingleFlightSharesResult():
+    singleFlight = SingleFlight()
+    calls = []
+    release = threading.Event()
+
+    def slowCall():
+        calls.append(1)
+        release.wait(1)
+        return {"id": "device_id"}
+
+    with ThreadPoolExecutor(max_workers=5) as executor:
+        futures = [executor.submit(singleFlight.do, "key", slowCall) for _ in range(5)]
+        time.sleep(0.05)
+        release.set()
+        results = [future.result() for future in futures]
+
+    assert len(calls) == 1
+    assert all(result == {"id": "device_id"} for result in results)
+    assert len({id(result) for result in results}) == 5
+
+
+def testSingleFlightSharesError():
+    singleFlight = SingleFlight()
+    release = threading.Event()
+
+    def failingCall():
+        release.wait(1)
+        raise ValueError("Failed")
+
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        futures = [
+            executor.submit(singleFlight.do, "key", failingCall) for _ in range(3)
+        ]
+        time.sleep(0.05)
+        release.set()
+        for future in futures:
+            with pytest.raises(ValueError):
+                future.result()
+
+
+def testWaitingCallerKeepsItsDeadline():
+    singleFlight = SingleFlight()
+    started = threading.Event()
+    release = threading.Event()
+
+    def slowCall():
+        started.set()
+        release.wait(1)
+        return {"id": "device_id"}
+
+    def waitWithDeadline():
+        with deadline(0.1):
+            return singleFlight.do("key", slowCall)
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        leader = executor.submit(singleFlight.do, "key", slowCall)
+        started.wait(1)
+        start = time.monotonic()
+        with pytest.raises(TagoIODeadlineError):
+            executor.submit(waitWithDeadline).result()
+        assert time.monotonic() - start < 0.5
+
+        with pytest.raises(TagoIODeadlineError):
+            singleFlight.do("key", slowCall, callDeadline=time.monotonic() + 0.05)
+
+        release.set()
+        assert leader.result() == {"id": "device_id"}
+
+
+def testLeaderDeadlineDoesNotFailWaiters():
+    singleFlight = SingleFlight()
+    started = threading.Event()
+    calls = []
+
+    def request():
+        calls.append(1)
+        if len(calls) == 1:
+            started.set()
+            time.sleep(0.1)
+            raise TagoIODeadlineError("Deadline exceeded: read timeout")
+        return {"id": "device_id"}
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        leader = executor.submit(singleFlight.do, "key", request)
+        started.wait(1)
+        waiter = executor.submit(singleFlight.do, "key", request)
+
+        with pytest.raises(TagoIODeadlineError):
+            leader.result()
+        assert waiter.result() == {"id": "device_id"}
+
+    assert len(calls) == 2
+
+
+def testConcurrentDeviceInfoCoalesced(requests_mock: Mocker):
+    def slowResponse(request, context):
+        time.sleep(0.1)
+        return {"status": True, "result": {"id": "device_id", "name": "Device"}}
+
+    requests_mock.get("https://api.tago.io/device/device_id", json=slowResponse)
+    resources = Resources({"token": "fake_token"})
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        results = list(
+            executor.map(lambda _: resources.devices.info("device_id"), range(4))
+        )
+
+    assert requests_mock.call_count == 1
+    assert all(result["id"] == "device_id" for result in results)
+
+
+def testNonGetRequestsNotCoalesced(requests_mock: Mocker):
+    def slowResponse(request, context):
+        time.sleep(0.05)
+        return {"status": True, "result": "Successfully Updated"}
+
+    requests_mock.put("https://api.tago.io/device/device_id", json=slowResponse)
+    resources = Resources({"token": "fake_token"})
+
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        list(
+            executor.map(
+                lambda _: resources.devices.edit("device_id", {"name": "Device"}),
+                range(3),
+            )
+        )
+
+    assert requests_mock.call_count == 3
@@ -0,0 +1,102 @@
+import pytest
+
+from requests_mock.mocker import Mocker
+
+from tagoio_sdk.infrastructure.fake_backend import FakeTagoIO
+from tagoio_sdk.infrastructure.retry import RetryPolicy
+from tagoio_sdk.infrastructure.retry import setRetryPolicy
+from tagoio_sdk.infrastructure.tracing import NOOP_SPAN
+from tagoio_sdk.infrastructure.tracing import setTracer
+from tagoio_sdk.infrastructure.tracing import span
+from tagoio_sdk.modules.Device.Device import Device
+from tagoio_sdk.modules.Resources.Resources import Resources
+from tagoio_sdk.modules.Utils.sendDownlink import sendDownlink
+
+
+pytest.importorskip("opentelemetry.sdk")
+
+from opentelemetry.sdk.trace import TracerProvider  # noqa: E402
+from opentelemetry.sdk.trace.export import SimpleSpanProcessor  # noqa: E402
+from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter  # noqa: E402
+
+
+@pytest.fixture
+def exporter():
+    exporter = InMemorySpanExporter()
+    provider = TracerProvider()
+    provider.add_span_processor(SimpleSpanProcessor(exporter))
+    setTracer(provider.get_tracer("tests"))
+    yield exporter
+    setTracer(None)
+
+
+def testNoopWithoutTracer():
+    with span("TagoIO test") as current:
+        assert current is NOOP_SPAN
+        current.set_attribute("ignored", True)
+
+
+def testDoRequestSpanWithRetries(exporter: InMemorySpanExporter, requests_mock: Mocker):
+    setRetryPolicy(RetryPolicy(attempts=2, baseDelay=0))
+    requests_mock.get(
+        "https://api.tago.io/device/63f50a69fd802b000ac1aa76",
+        [
+            {"status_code": 502, "json": {"status": False}},
+            {"json": {"status": True, "result": {"id": "1"}}},
+        ],
+    )
+    try:
+        Resources({"token": "your_token_value"}).devices.doRequest(
+            {"path": "/device/63f50a69fd802b000ac1aa76", "method": "GET"}
+        )
+    finally:
+        setRetryPolicy(None)
+
+    (requestSpan,) = exporter.get_finished_spans()
+    assert requestSpan.name == "TagoIO GET /device/{id}"
+    assert requestSpan.attributes["http.response.status_code"] == 200
+    assert requestSpan.attributes["tagoio.attempts"] == 2
+    assert [event.name for event in requestSpan.events] == ["retry"]
+
+
+def testUploadPartsAreChildrenAcrossThreads(exporter: InMemorySpanExporter):
+    with FakeTagoIO():
+        Resources({"token": "account_token"}).files.uploadFile(b"x" * 1024, "/file.bin")
+
+    spans = {item.name: item for item in exporter.get_finished_spans()}
+    upload = spans["TagoIO Files.uploadFile"]
+    part = spans["TagoIO Files.uploadPart"]
+    assert part.parent.span_id == upload.context.span_id
+    assert part.context.trace_id == upload.context.trace_id
+    assert spans["TagoIO POST /files"].parent.span_id == upload.context.span_id
+
+
+def testSendDownlinkSteps(exporter: InMemorySpanExporter):
+    with FakeTagoIO() as tago:
+        networkID = tago.addNetwork("LoRaWAN", "lorawan.middleware.test")
+        deviceID, token = tago.addDevice("Sensor", network=networkID)
+        tago.tokens[token]["serie_number"] = "0011223344556677"
+        Device({"token": token}).sendData({"variable": "uplink", "value": 1})
+        exporter.clear()
+
+        sendDownlink(
+            Resources({"token": "account_token"}),
+            deviceID,
+            {"payload": "01FF", "port": 1},
+        )
+
+    spans = exporter.get_finished_spans()
+    root = next(item for item in spans if item.name == "TagoIO sendDownlink")
+    steps = [
+        item.name
+        for item in spans
+        if item.parent is not None and item.parent.span_id == root.context.span_id
+    ]
+    assert steps == [
+        "TagoIO sendDownlink.getDeviceToken",
+        "TagoIO sendDownlink.getNetworkId",
+        "TagoIO sendDownlink.getMiddlewareEndpoint",
+        "TagoIO sendDownlink.getDownlinkParams",
+        "TagoIO sendDownlink.putParamInDevice",
+        "TagoIO sendDownlink.post",
+    ]
@@ -0,0 +1,105 @@
+import asyncio
+
+from requests_mock.mocker import Mocker
+
+from tagoio_sdk import AsyncDevice
+from tagoio_sdk import AsyncResources
+from tagoio_sdk import AsyncServices
+from tagoio_sdk import config
+from tagoio_sdk.common import async_module
+from tagoio_sdk.common.async_module import ThreadOffloadModule
+
+
+def testAsyncResourcesConcurrentRequests(requests_mock: Mocker):
+    for deviceID in ["device_1", "device_2", "device_3"]:
+        requests_mock.get(
+            f"https://api.tago.io/device/{deviceID}",
+            json={"status": True, "result": {"id": deviceID, "name": deviceID}},
+        )
+
+    resources = AsyncResources({"token": "fake_token"})
+
+    async def fetchAll():
+        return await asyncio.gather(
+            *(
+                resources.devices.info(deviceID)
+                for deviceID in ["device_1", "device_2", "device_3"]
+            )
+        )
+
+    result = asyncio.run(fetchAll())
+
+    assert [device["id"] for device in result] == ["device_1", "device_2", "device_3"]
+    assert requests_mock.call_count == 3
+
+
+def testAsyncResourcesNestedModules(requests_mock: Mocker):
+    requests_mock.get(
+        "https://api.tago.io/integration/network/network_id",
+        json={"status": True, "result": {"id": "network_id", "name": "LoRaWAN"}},
+    )
+
+    resources = AsyncResources({"token": "fake_token"})
+    result = asyncio.run(resources.integration.networks.info("network_id"))
+
+    assert result["name"] == "LoRaWAN"
+    assert resources.integration.networks.token == "fake_token"
+
+
+def testAsyncDeviceAndServices(requests_mock: Mocker):
+    requests_mock.post(
+        "https://api.tago.io/data", json={"status": True, "result": "1 Data Added"}
+    )
+    requests_mock.post(
+        "https://api.tago.io/analysis/services/sms/send",
+        json={"status": True, "result": "SMS queued"},
+    )
+
+    async def run():
+        device = AsyncDevice({"token": "fake_token"})
+        services = AsyncServices({"token": "fake_token"})
+        return await asyncio.gather(
+            device.sendData({"variable": "temperature", "value": 10}),
+            services.sms.send({"to": "+5599999999999", "message": "Hi"}),
+        )
+
+    assert asyncio.run(run()) == ["1 Data Added", "SMS queued"]
+
+
+def testAsyncExecutorSizedFromConnectionPool(monkeypatch):
+    monkeypatch.setattr(async_module, "_executor", None)
+    monkeypatch.setitem(config.tagoSDKconfig, "asyncMaxWorkers", None)
+    monkeypatch.setitem(config.tagoSDKconfig["connectionPool"], "poolMaxsize", 25)
+
+    try:
+        assert async_module.getAsyncExecutor()._max_workers == 25
+    finally:
+        async_module.closeAsyncExecutor()
+
+
+def testAsyncIteratorClosesAbandonedGenerator():
+    closed = []
+
+    class Stream:
+        def items(self):
+            try:
+                yield from range(10)
+            finally:
+                closed.append(True)
+
+    async def run():
+        iterator = ThreadOffloadModule(Stream()).items()
+        assert await iterator.__anext__() == 0
+        await iterator.aclose()
+
+    asyncio.run(run())
+
+    assert closed == [True]
+
+
+def testAsyncResourcesListsWrappedMethods():
+    resources = AsyncResources({"token": "fake_token"})
+
+    assert "devices" in dir(resources)
+    assert "listDevice" in dir(resources.devices)
+    assert resources.devices.sync is resources.sync.devices
@@ -202,6 +202,41 @@ def testListDevice(requests_mock: Mocker) -> None:
     assert result[0]["id"] == "device-id-123"
 
 
+def testIterDevices(requests_mock: Mocker) -> None:
+    """Test iterDevices method of Devices class."""
+    devices = [{"id": f"device-{i}", "name": f"Sensor {i}"} for i in range(5)]
+
+    def respond(request, context):
+        page = int(request.qs["page"][0])
+        amount = int(request.qs["amount"][0])
+        return {"status": True, "result": devices[(page - 1) * amount : page * amount]}
+
+    requests_mock.get("https://api.tago.io/device", json=respond)
+
+    resources = Resources({"token": "your_token_value"})
+    result = list(resources.devices.iterDevices({"fields": ["id", "name"]}, pageSize=2, prefetch=True))
+
+    assert [device["id"] for device in result] == [device["id"] for device in devices]
+    assert sorted(int(request.qs["page"][0]) for request in requests_mock.request_history) == [1, 2, 3]
+
+
+def testListAllDevices(requests_mock: Mocker) -> None:
+    """Test listAllDevices method of Devices class."""
+    devices = [{"id": f"device-{i}", "name": f"Sensor {i}"} for i in range(45)]
+
+    def respond(request, context):
+        page = int(request.qs["page"][0])
+        amount = int(request.qs["amount"][0])
+        return {"status": True, "result": devices[(page - 1) * amount : page * amount]}
+
+    requests_mock.get("https://api.tago.io/device", json=respond)
+
+    resources = Resources({"token": "your_token_value"})
+    result = resources.devices.listAllDevices({"fields": ["id", "name"]}, pageSize=10, maxWorkers=3)
+
+    assert [device["id"] for device in result] == [device["id"] for device in devices]
+
+
 def testCreateDevice(requests_mock: Mocker) -> None:
     """Test create method of Devices class."""
     mock_response = mockDeviceCreate()
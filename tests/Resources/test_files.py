@@ -1,7 +1,13 @@
 import os
+import time
 from typing import Dict
+
+import pytest
 from requests_mock.mocker import Mocker
 
+from tagoio_sdk.infrastructure.api_request import TagoIODeadlineError
+from tagoio_sdk.infrastructure.deadline import deadline
+from tagoio_sdk.infrastructure.fake_backend import FakeTagoIO
 from tagoio_sdk.modules.Resources.Resources import Resources
 from tagoio_sdk.modules.Resources.Files_Types import FileListInfo
 
@@ -243,3 +249,46 @@ def testFilesMethodUploadFile(requests_mock: Mocker) -> None:
     # Check that progress was reported
     assert len(progress_values) > 0
     assert progress_values[-1] == 100.0
+
+
+def testUploadPartStopsRetryingAtTheDeadline(requests_mock: Mocker) -> None:
+    requests_mock.post("https://api.tago.io/files", status_code=500, json={"status": False, "message": "Failed"})
+    resources = Resources({"token": "your_token_value"})
+
+    start = time.monotonic()
+    with deadline(1), pytest.raises(TagoIODeadlineError):
+        resources.files._addToQueue("/file.txt", "upload_id", 1, b"content", {"timeoutForEachFailedChunk": 2000})
+
+    assert time.monotonic() - start < 0.5
+    assert requests_mock.call_count == 1
+    assert requests_mock.last_request.timeout[1] <= 1
+
+
+def testWalkFileTree() -> None:
+    with FakeTagoIO() as tago:
+        for i in range(7):
+            tago._storeFile(f"/reports/2024/{i:02d}.csv", b"a,b")
+        tago._storeFile("/reports/2024/summary.pdf", b"%PDF")
+        tago._storeFile("/reports/tmp/partial.csv", b"a")
+        tago._storeFile("/reports/2024/q1/deep.csv", b"a")
+        tago._storeFile("/reports/root.csv", b"a")
+        tago._storeFile("/other/ignored.csv", b"a")
+
+        files = Resources({"token": "account_token"}).files
+        found = dict(files.walk("/reports", {"quantity": 3, "maxWorkers": 3}))
+        assert len(found) == 11
+        assert found["/reports/2024/summary.pdf"]["size"] == 4
+
+        filtered = files.walk("/reports", {"include": ["*.csv"], "exclude": ["/reports/tmp/*"], "maxDepth": 1})
+        assert sorted(path for path, _ in filtered) == [f"/reports/2024/{i:02d}.csv" for i in range(7)] + [
+            "/reports/root.csv"
+        ]
+
+
+def testWalkRelativeFilenames(requests_mock: Mocker) -> None:
+    requests_mock.get("https://api.tago.io/files", json=mockFileList())
+
+    resources = Resources()
+    paths = [path for path, _ in resources.files.walk("/docs", {"maxDepth": 0})]
+
+    assert paths == ["/docs/document.pdf", "/docs/image.jpg"]
@@ -0,0 +1,33 @@
+import pytest
+
+from requests_mock.mocker import Mocker
+
+from tagoio_sdk.modules.Resources.AccountDeprecated import AccountDeprecated as Account
+from tagoio_sdk.modules.Utils.getTokenByName import getTokenByName
+
+
+def mockTokenPages(requests_mock: Mocker) -> None:
+    tokens = [{"name": f"Token {i}", "token": f"token-{i}"} for i in range(150)]
+
+    def respond(request, context):
+        page = int(request.qs["page"][0])
+        amount = int(request.qs["amount"][0])
+        return {"status": True, "result": tokens[(page - 1) * amount : page * amount]}
+
+    requests_mock.get("https://api.tago.io/device/token/device-id", json=respond)
+
+
+def testTokenOnLaterPage(requests_mock: Mocker) -> None:
+    mockTokenPages(requests_mock)
+    account = Account({"token": "account_token"})
+
+    assert getTokenByName(account, "device-id", "Token 120") == "token-120"
+    assert getTokenByName(account, "device-id", ["Missing", "Token 3"]) == "token-3"
+    assert getTokenByName(account, "device-id") == "token-0"
+
+
+def testTokenNotFound(requests_mock: Mocker) -> None:
+    mockTokenPages(requests_mock)
+
+    with pytest.raises(ValueError, match="Can't find Token"):
+        getTokenByName(Account({"token": "account_token"}), "device-id", "Missing")
@@ -0,0 +1,133 @@
+import time
+
+from tagoio_sdk.common.Cache import TTLCache
+from tagoio_sdk.common.Cache import add_cache
+from tagoio_sdk.common.Cache import cache_stats
+from tagoio_sdk.common.Cache import clear_cache
+from tagoio_sdk.common.Cache import get_cache
+
+
+def test_add_and_get_cache_by_request():
+    clear_cache()
+    request = {
+        "url": "https://api.tago.io/device/123",
+        "method": "GET",
+        "headers": {"token": "fake_token"},
+    }
+
+    add_cache(request, {"id": "123"}, ttl_ms=1000)
+
+    assert get_cache(request) == {"id": "123"}
+    assert get_cache({**request, "params": {"page": 2}}) is None
+    assert cache_stats()["hits"] >= 1
+
+
+def test_entries_expire():
+    cache = TTLCache()
+    cache.set("key", "value", ttl_ms=20)
+
+    assert cache.get("key") == "value"
+    time.sleep(0.03)
+    assert cache.get("key") is None
+    assert cache.stats()["expirations"] == 1
+
+
+def test_expired_entries_purged_on_insert():
+    cache = TTLCache()
+    for i in range(10):
+        cache.set(i, i, ttl_ms=1)
+    time.sleep(0.01)
+
+    cache.set("fresh", 1, ttl_ms=1000)
+
+    assert len(cache) == 1
+
+
+def test_lru_eviction_by_entries():
+    cache = TTLCache(max_entries=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+
+    assert cache.get("a") == 1
+    assert cache.get("b") is None
+    assert cache.get("c") == 3
+    assert cache.stats()["evictions"] == 1
+
+
+def test_lru_eviction_by_bytes():
+    value = "x" * 1000
+    cache = TTLCache(max_bytes=2000)
+    cache.set("a", value, size=1000)
+    cache.set("b", value, size=1000)
+    cache.set("c", value, size=1000)
+
+    assert len(cache) == 2
+    assert cache.get("a") is None
+    assert cache.stats()["bytes"] <= cache.max_bytes
+
+
+def test_size_defaults_to_json_length():
+    cache = TTLCache()
+    cache.set("a", [{"variable": "temperature", "value": 1}])
+
+    assert cache.stats()["bytes"] == len(b'[{"variable":"temperature","value":1}]')
+
+
+def test_replace_and_delete():
+    cache = TTLCache()
+    cache.set("a", 1)
+    cache.set("a", 2)
+
+    assert cache.get("a") == 2
+    assert cache.delete("a") is True
+    assert cache.delete("a") is False
+    assert cache.stats()["bytes"] == 0
+
+
+def test_invalidate_tag():
+    cache = TTLCache()
+    cache.set("a", 1, tags=["/device/123"])
+    cache.set("b", 2, tags=["/device/123"])
+    cache.set("c", 3, tags=["/device/456"])
+
+    assert cache.invalidate_tag("/device/123") == 2
+    assert cache.get("a") is None
+    assert cache.get("c") == 3
+    assert cache.invalidate_tags(lambda tag: tag.startswith("/device")) == 1
+    assert len(cache) == 0
+
+
+def test_reservation_skipped_only_when_its_tag_is_invalidated():
+    cache = TTLCache()
+    stale = cache.reserve(["/device/123"])
+    fresh = cache.reserve(["/integration/network/456"])
+
+    cache.invalidate_tags(lambda tag: tag.startswith("/device"))
+    cache.set("stale", 1, tags=["/device/123"], reservation=stale)
+    cache.set("fresh", 2, tags=["/integration/network/456"], reservation=fresh)
+
+    assert cache.get("stale") is None
+    assert cache.get("fresh") == 2
+
+
+def test_hash_generator_is_canonical_and_wide():
+    from tagoio_sdk.common.Hash_Generator import generateRequestID
+    from tagoio_sdk.common.Hash_Generator import hash_generator
+
+    assert hash_generator({"a": 1, "b": [1, 2]}) == hash_generator(
+        {"b": [1, 2], "a": 1}
+    )
+    assert hash_generator({"a": 1}) != hash_generator({"a": 2})
+    assert hash_generator(b"raw body") == hash_generator(b"raw body")
+    assert hash_generator({"a": "x" * 100}).bit_length() > 64
+
+    request = {
+        "url": "https://api.tago.io/data",
+        "method": "POST",
+        "headers": {"token": "fake_token"},
+    }
+    assert generateRequestID({**request, "body": b"[1]"}) != generateRequestID(
+        {**request, "body": b"[2]"}
+    )
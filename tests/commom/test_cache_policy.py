@@ -0,0 +1,201 @@
+import pytest
+
+from requests_mock.mocker import Mocker
+
+from tagoio_sdk import config
+from tagoio_sdk.common.Cache import clear_cache
+from tagoio_sdk.common.Cache_Policy import bypass_cache
+from tagoio_sdk.common.Cache_Policy import get_cache_ttl
+from tagoio_sdk.common.Cache_Policy import get_invalidation_patterns
+from tagoio_sdk.common.Cache_Policy import invalidate_cache
+from tagoio_sdk.modules.Resources.Resources import Resources
+
+
+@pytest.fixture
+def cacheEnabled(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setitem(
+        config.tagoSDKconfig,
+        "cache",
+        {**config.tagoSDKconfig["cache"], "enabled": True},
+    )
+    clear_cache()
+    yield
+    clear_cache()
+
+
+def test_cache_disabled_by_default():
+    assert get_cache_ttl("/integration/network/123") is None
+
+
+def test_cache_policy_patterns(cacheEnabled):
+    assert get_cache_ttl("/integration/network/123") == 600000
+    assert get_cache_ttl("/integration/network/token/123") is None
+    assert get_cache_ttl("/dictionary/SLUG/en-US") == 300000
+    assert get_cache_ttl("/device/123") == 30000
+    assert get_cache_ttl("/device/123/data") is None
+    assert get_cache_ttl("/device") is None
+
+
+def test_cached_get_skips_request(requests_mock: Mocker, cacheEnabled):
+    requests_mock.get(
+        "https://api.tago.io/device/123",
+        json={
+            "status": True,
+            "result": {"id": "123", "created_at": "2023-02-21T18:16:09.817Z"},
+        },
+    )
+    resources = Resources({"token": "fake_token"})
+
+    first = resources.devices.info("123")
+    second = resources.devices.info("123")
+
+    assert requests_mock.call_count == 1
+    assert first == second
+    assert first is not second
+
+
+def test_cache_keyed_by_token(requests_mock: Mocker, cacheEnabled):
+    requests_mock.get(
+        "https://api.tago.io/integration/network/123",
+        json={"status": True, "result": {"id": "123"}},
+    )
+
+    Resources({"token": "token_a"}).integration.networks.info("123")
+    Resources({"token": "token_b"}).integration.networks.info("123")
+
+    assert requests_mock.call_count == 2
+
+
+def test_bypass_cache(requests_mock: Mocker, cacheEnabled):
+    requests_mock.get(
+        "https://api.tago.io/integration/network/123",
+        [
+            {"json": {"status": True, "result": {"name": "old"}}},
+            {"json": {"status": True, "result": {"name": "new"}}},
+        ],
+    )
+    networks = Resources({"token": "fake_token"}).integration.networks
+
+    assert networks.info("123")["name"] == "old"
+    with bypass_cache():
+        assert networks.info("123")["name"] == "new"
+    assert networks.info("123")["name"] == "new"
+    assert requests_mock.call_count == 2
+
+
+def test_invalidation_patterns():
+    assert get_invalidation_patterns("/device/123/params") == [
+        "/device/123/params",
+        "/device/123/params/**",
+        "/device/123",
+    ]
+    assert "/device/token/123" in get_invalidation_patterns("/device/123")
+    assert "/dictionary/**" in get_invalidation_patterns("/dictionary/456/en-US")
+
+
+def test_edit_invalidates_cached_info(requests_mock: Mocker, cacheEnabled):
+    requests_mock.get(
+        "https://api.tago.io/device/123",
+        [
+            {"json": {"status": True, "result": {"id": "123", "name": "old"}}},
+            {"json": {"status": True, "result": {"id": "123", "name": "new"}}},
+        ],
+    )
+    requests_mock.put(
+        "https://api.tago.io/device/123",
+        json={"status": True, "result": "Successfully Updated"},
+    )
+    devices = Resources({"token": "fake_token"}).devices
+
+    assert devices.info("123")["name"] == "old"
+    devices.edit("123", {"name": "new"})
+    assert devices.info("123")["name"] == "new"
+
+
+def test_param_set_invalidates_device_not_others(requests_mock: Mocker, cacheEnabled):
+    for deviceID in ["123", "456"]:
+        requests_mock.get(
+            f"https://api.tago.io/device/{deviceID}",
+            json={"status": True, "result": {"id": deviceID}},
+        )
+    requests_mock.post(
+        "https://api.tago.io/device/123/params",
+        json={"status": True, "result": "Params Updated"},
+    )
+    devices = Resources({"token": "fake_token"}).devices
+
+    devices.info("123")
+    devices.info("456")
+    devices.paramSet("123", {"key": "downlink", "value": "01", "sent": False})
+    devices.info("123")
+    devices.info("456")
+
+    assert [
+        request.path
+        for request in requests_mock.request_history
+        if request.method == "GET"
+    ] == [
+        "/device/123",
+        "/device/456",
+        "/device/123",
+    ]
+
+
+def test_language_edit_invalidates_language_by_slug(
+    requests_mock: Mocker, cacheEnabled
+):
+    requests_mock.get(
+        "https://api.tago.io/dictionary/SLUG/en-US",
+        json={"status": True, "result": {"KEY": "Value"}},
+    )
+    requests_mock.put(
+        "https://api.tago.io/dictionary/456/en-US",
+        json={"status": True, "result": "Updated"},
+    )
+    dictionaries = Resources({"token": "fake_token"}).dictionaries
+
+    dictionaries.languageInfoBySlug("SLUG", "en-US")
+    dictionaries.languageEdit(
+        "456", "en-US", {"dictionary": {"KEY": "New"}, "active": True}
+    )
+    dictionaries.languageInfoBySlug("SLUG", "en-US")
+
+    assert requests_mock.call_count == 3
+
+
+@pytest.mark.parametrize(
+    "mutatedPath,cached",
+    [("/device/other-device/data", True), ("/integration/network/123", False)],
+)
+def test_write_during_get_only_blocks_its_paths(
+    requests_mock: Mocker, cacheEnabled, mutatedPath, cached
+):
+    def networkInfo(request, context):
+        # A write made while the GET is in flight
+        invalidate_cache(mutatedPath)
+        return {"status": True, "result": {"id": "123"}}
+
+    requests_mock.get("https://api.tago.io/integration/network/123", json=networkInfo)
+    networks = Resources({"token": "fake_token"}).integration.networks
+
+    networks.info("123")
+    networks.info("123")
+
+    assert requests_mock.call_count == (1 if cached else 2)
+
+
+@pytest.mark.parametrize(
+    "value,expected",
+    [
+        ("1", True),
+        ("true", True),
+        ("Yes", True),
+        ("0", False),
+        ("false", False),
+        ("", False),
+    ],
+)
+def test_env_flag(monkeypatch, value, expected):
+    monkeypatch.setenv("TAGOIO_CACHE", value)
+
+    assert config._envFlag("TAGOIO_CACHE") is expected
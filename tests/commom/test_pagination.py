@@ -0,0 +1,139 @@
+import threading
+import time
+
+import pytest
+
+from tagoio_sdk.common.pagination import fetchAllPages
+from tagoio_sdk.common.pagination import paginate
+from tagoio_sdk.common.pagination import paginateCursor
+
+
+def pages_of(items: list, size: int, calls: list):
+    def fetch_page(page: int) -> list:
+        calls.append(page)
+        return items[(page - 1) * size : page * size]
+
+    return fetch_page
+
+
+def test_walks_every_page_until_a_short_one():
+    calls = []
+    items = list(range(25))
+
+    assert list(paginate(pages_of(items, 10, calls), 10)) == items
+    assert calls == [1, 2, 3]
+
+
+def test_stops_on_an_empty_page():
+    calls = []
+
+    assert list(paginate(pages_of(list(range(20)), 10, calls), 10)) == list(range(20))
+    assert calls == [1, 2, 3]
+
+
+def test_pages_are_requested_lazily():
+    calls = []
+    iterator = paginate(pages_of(list(range(100)), 10, calls), 10, page=3)
+
+    assert next(iterator) == 20
+    assert calls == [3]
+
+
+def test_prefetch_requests_the_next_page_while_consuming():
+    fetched = threading.Event()
+    calls = []
+
+    def fetch_page(page: int) -> list:
+        calls.append(page)
+        if page == 2:
+            fetched.set()
+        return [page] * 2 if page < 3 else []
+
+    iterator = paginate(fetch_page, 2, prefetch=True)
+
+    assert next(iterator) == 1
+    assert fetched.wait(1)
+    assert list(iterator) == [1, 2, 2]
+    assert calls == [1, 2, 3]
+
+
+def test_prefetch_errors_are_raised_on_their_page():
+    def fetch_page(page: int) -> list:
+        if page == 2:
+            time.sleep(0.01)
+            raise ValueError("page 2 failed")
+        return [page]
+
+    iterator = paginate(fetch_page, 1, prefetch=True)
+
+    assert next(iterator) == 1
+    with pytest.raises(ValueError, match="page 2 failed"):
+        next(iterator)
+
+
+def test_fetch_all_pages_in_order():
+    calls = []
+    items = [{"id": i} for i in range(95)]
+
+    def fetch_page(page: int) -> list:
+        time.sleep(0.01 * (page % 3))
+        return pages_of(items, 10, calls)(page)
+
+    assert fetchAllPages(fetch_page, 10, maxWorkers=4) == items
+    assert set(range(1, 11)) <= set(calls)
+
+
+def test_fetch_all_pages_runs_concurrently():
+    running = []
+    peak = []
+    lock = threading.Lock()
+
+    def fetch_page(page: int) -> list:
+        with lock:
+            running.append(page)
+            peak.append(len(running))
+        time.sleep(0.02)
+        with lock:
+            running.remove(page)
+        return [{"id": page}] if page < 12 else []
+
+    assert len(fetchAllPages(fetch_page, 1, maxWorkers=4)) == 11
+    assert max(peak) == 4
+
+
+def test_fetch_all_pages_dedupes_shifted_items():
+    snapshots = {
+        1: [{"id": 1}, {"id": 2}],
+        2: [{"id": 2}, {"id": 3}],
+        3: [{"id": 4}, {"name": "no id"}],
+        4: [],
+    }
+
+    result = fetchAllPages(lambda page: snapshots.get(page, []), 2)
+
+    assert result == [{"id": 1}, {"id": 2}, {"id": 3}, {"id": 4}, {"name": "no id"}]
+    assert len(fetchAllPages(lambda page: snapshots.get(page, []), 2, key=None)) == 6
+
+
+def test_fetch_all_pages_raises_page_errors():
+    def fetch_page(page: int) -> list:
+        if page == 3:
+            raise ValueError("page 3 failed")
+        return [{"id": page}]
+
+    with pytest.raises(ValueError, match="page 3 failed"):
+        fetchAllPages(fetch_page, 1, maxWorkers=2)
+
+
+def test_cursor_pages_follow_the_returned_cursor():
+    cursors = []
+
+    def fetch_page(cursor):
+        cursors.append(cursor)
+        start = cursor or 0
+        return list(range(start, min(start + 4, 10))), (
+            start + 4 if start + 4 < 10 else None
+        )
+
+    assert list(paginateCursor(fetch_page, prefetch=True)) == list(range(10))
+    assert cursors == [None, 4, 8]